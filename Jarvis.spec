@@ -1,9 +1,9 @@
 # -*- mode: python ; coding: utf-8 -*-
 from PyInstaller.utils.hooks import collect_all
 
-datas = [('config.py', '.'), ('voice_cache', 'voice_cache')]
+datas = [('config.py', '.')]
 binaries = []
-hiddenimports = ['pyttsx3.drivers', 'pyttsx3.drivers.sapi5', 'edge_tts', 'pygame', 'customtkinter', 'speech_recognition', 'sounddevice', 'numpy', 'pystray', 'pystray._win32', 'PIL', 'PIL.Image', 'PIL.ImageDraw', 'PIL.ImageFont']
+hiddenimports = ['edge_tts', 'pygame', 'customtkinter', 'speech_recognition', 'sounddevice', 'numpy', 'pystray', 'pystray._win32', 'PIL', 'PIL.Image', 'PIL.ImageDraw', 'PIL.ImageFont']
 tmp_ret = collect_all('customtkinter')
 datas += tmp_ret[0]; binaries += tmp_ret[1]; hiddenimports += tmp_ret[2]
 tmp_ret = collect_all('edge_tts')
@@ -0,0 +1,67 @@
+# ============================================================
+#  J.A.R.V.I.S  –  Activity Log File
+#  Every log line is also persisted to a size-rotated file.
+#  Callers only enqueue a record; a background listener does
+#  the formatting and disk I/O, so no engine thread ever waits
+#  on the file system.
+# ============================================================
+
+import os
+import queue
+import logging
+import logging.handlers
+
+from config import LOG_FILE, LOG_MAX_KB, LOG_BACKUPS
+
+_logger = logging.getLogger("jarvis.activity")
+_logger.setLevel(logging.INFO)
+_logger.propagate = False
+_listener = None
+
+LEVELS = {"error": logging.ERROR}
+
+
+def start(log_dir: str, filename: str = LOG_FILE, max_kb: int = LOG_MAX_KB,
+          backups: int = LOG_BACKUPS, extra_handlers=()):
+    """Begin writing records to ``log_dir/filename`` (plus ``extra_handlers``,
+    e.g. a console) on a background thread.  Safe to call once per process.
+    """
+    global _listener
+    if _listener is not None:
+        return
+    handlers = list(extra_handlers)
+    if filename:
+        try:
+            os.makedirs(log_dir, exist_ok=True)
+            handler = logging.handlers.RotatingFileHandler(
+                os.path.join(log_dir, filename), maxBytes=max_kb * 1024,
+                backupCount=backups, encoding="utf-8", delay=True,
+            )
+            handlers.append(handler)
+        except OSError:
+            pass                # read-only install: keep the on-screen log only
+    if not handlers:
+        return
+    formatter = logging.Formatter("%(asctime)s [%(tag)-6s] %(message)s", "%Y-%m-%d %H:%M:%S")
+    for h in handlers:
+        h.setFormatter(formatter)
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    _logger.addHandler(logging.handlers.QueueHandler(records))
+    _listener = logging.handlers.QueueListener(records, *handlers, respect_handler_level=False)
+    _listener.start()
+
+
+def record(tag: str, msg: str):
+    """Queue one line for the file; never blocks on I/O."""
+    if _listener is not None:
+        _logger.log(LEVELS.get(tag, logging.INFO), msg, extra={"tag": tag.upper()})
+
+
+def stop():
+    """Flush what's queued and close the file."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+        for h in list(_logger.handlers):
+            _logger.removeHandler(h)
@@ -0,0 +1,380 @@
+# ============================================================
+#  J.A.R.V.I.S  –  Audio Capture
+#  One service owns the input device, writes into a
+#  preallocated ring buffer and fans audio out to every
+#  consumer (visualiser, detectors, speech recognition).
+# ============================================================
+
+import math
+import time
+import wave
+import weakref
+import threading
+
+import numpy as np
+
+from config import (
+    SAMPLE_RATE,
+    BLOCK_SIZE,
+    CAPTURE_RING_SECONDS,
+    LEVEL_RING_BLOCKS,
+    CAPTURE_CALLBACK_BUDGET,
+)
+
+
+class AudioRing:
+    """Fixed-size mono float32 ring with a monotonically increasing write count.
+
+    A single writer (the audio callback) appends blocks; any number of
+    readers address samples by absolute position, so each keeps its own
+    cursor and nobody consumes data out from under anyone else.
+    """
+
+    def __init__(self, seconds: float = CAPTURE_RING_SECONDS, rate: int = SAMPLE_RATE):
+        self.rate = rate
+        self.capacity = int(seconds * rate)
+        self._buf = np.zeros(self.capacity, dtype=np.float32)
+        self.written = 0
+        self._cond = threading.Condition()
+        self._readers = weakref.WeakSet()
+
+    def lag(self):
+        """Samples the slowest live reader is behind (None with no readers)."""
+        positions = [r.pos for r in list(self._readers)]
+        return self.written - min(positions) if positions else None
+
+    def write(self, block):
+        n = len(block)
+        if n > self.capacity:
+            block = block[-self.capacity:]
+            n = self.capacity
+        start = self.written % self.capacity
+        end = start + n
+        if end <= self.capacity:
+            self._buf[start:end] = block
+        else:
+            k = self.capacity - start
+            self._buf[start:] = block[:k]
+            self._buf[:n - k] = block[k:]
+        with self._cond:
+            self.written += n
+            self._cond.notify_all()
+
+    def wait_for(self, pos: int, timeout=None) -> bool:
+        """Block until at least ``pos`` samples have ever been written."""
+        with self._cond:
+            return self._cond.wait_for(lambda: self.written >= pos, timeout)
+
+    def copy(self, start: int, n: int, out=None):
+        """Copy samples ``[start, start + n)`` (absolute positions) into ``out``."""
+        if out is None:
+            out = np.empty(n, dtype=np.float32)
+        s = start % self.capacity
+        e = s + n
+        if e <= self.capacity:
+            out[:n] = self._buf[s:e]
+        else:
+            k = self.capacity - s
+            out[:k] = self._buf[s:]
+            out[k:n] = self._buf[:n - k]
+        return out
+
+
+class CaptureReader:
+    """An independent cursor into an ``AudioRing``."""
+
+    def __init__(self, ring: AudioRing, preroll_samples: int = 0):
+        self._ring = ring
+        self.pos = max(0, ring.written - preroll_samples, ring.written - ring.capacity)
+        self.dropped = 0        # samples lost because this reader fell behind
+        ring._readers.add(self)
+
+    def _catch_up(self):
+        oldest = self._ring.written - self._ring.capacity
+        if self.pos < oldest:
+            self.dropped += oldest - self.pos
+            self.pos = oldest
+
+    def read(self, n: int, timeout=None):
+        """Return the next ``n`` samples, or None if they didn't arrive in time."""
+        if not self._ring.wait_for(self.pos + n, timeout):
+            return None
+        self._catch_up()
+        out = self._ring.copy(self.pos, n)
+        self.pos += n
+        return out
+
+    def read_frames(self, frame_len: int, max_frames: int, timeout=None):
+        """Every whole frame available right now (at least one, at most
+        ``max_frames``) as a ``(k, frame_len)`` array, or None on timeout.
+        """
+        if not self._ring.wait_for(self.pos + frame_len, timeout):
+            return None
+        self._catch_up()
+        k = min(max_frames, (self._ring.written - self.pos) // frame_len)
+        out = self._ring.copy(self.pos, k * frame_len).reshape(k, frame_len)
+        self.pos += k * frame_len
+        return out
+
+    def available(self) -> int:
+        self._catch_up()
+        return self._ring.written - self.pos
+
+    @property
+    def time(self) -> float:
+        """Stream time (seconds since capture start) of the next sample."""
+        return self.pos / self._ring.rate
+
+
+class LevelRing:
+    """Per-block peak / RMS / dBFS history written from the audio callback.
+
+    Everything is preallocated and there is a single writer: the callback
+    fills the next slot and only then bumps ``written``, so the UI can take
+    a snapshot at its own frame rate without locks, and the callback never
+    allocates arrays or grows Python lists.
+    """
+
+    def __init__(self, capacity: int = LEVEL_RING_BLOCKS, block: int = BLOCK_SIZE):
+        self.capacity = capacity
+        self.peak = np.zeros(capacity, dtype=np.float32)
+        self.rms = np.zeros(capacity, dtype=np.float32)
+        self.dbfs = np.full(capacity, -100.0, dtype=np.float32)
+        self.written = 0
+        self._abs = np.empty(block, dtype=np.float32)
+        self._snap = np.empty(capacity, dtype=np.float32)
+
+    def write(self, block):
+        n = len(block)
+        if n > len(self._abs):
+            self._abs = np.empty(n, dtype=np.float32)   # device changed block size
+        scratch = self._abs[:n]
+        np.abs(block, out=scratch)
+        ms = float(np.dot(block, block)) / max(n, 1)
+        i = self.written % self.capacity
+        self.peak[i] = scratch.max()
+        self.rms[i] = math.sqrt(ms)
+        self.dbfs[i] = 10.0 * math.log10(ms + 1e-10)
+        self.written += 1
+
+    def latest(self, field: str = "peak") -> float:
+        """The newest value of ``field`` (silence before capture starts)."""
+        end = self.written
+        if end == 0:
+            return -100.0 if field == "dbfs" else 0.0
+        return float(getattr(self, field)[(end - 1) % self.capacity])
+
+    def recent(self, out, field: str = "peak", step: int = 1):
+        """Fill ``out`` with the newest values, oldest first, each the max over
+        ``step`` blocks.  Slots before capture started read as silence.
+        """
+        src = getattr(self, field)
+        n = min(len(out) * step, self.capacity)
+        end = self.written                   # read once; the writer may move on
+        k = min(n, end)
+        snap = self._snap[:n]
+        snap[:n - k] = -100.0 if field == "dbfs" else 0.0
+        s = (end - k) % self.capacity
+        if s + k <= self.capacity:
+            snap[n - k:] = src[s:s + k]
+        else:
+            first = self.capacity - s
+            snap[n - k:n - k + first] = src[s:]
+            snap[n - k + first:] = src[:k - first]
+        if step == 1:
+            out[:n] = snap
+        else:
+            np.max(snap[:len(out) * step].reshape(len(out), step), axis=1, out=out)
+        return out
+
+
+# ── Sources ────────────────────────────────────────────────
+class SoundDeviceSource:
+    """The default input device via PortAudio."""
+
+    def __init__(self, rate: int = SAMPLE_RATE, block: int = BLOCK_SIZE):
+        self.rate = rate
+        self.block = block
+        self._stream = None
+
+    def start(self, callback):
+        # Imported here so WAV-backed capture works without PortAudio installed
+        import sounddevice as sd
+        self._stream = sd.InputStream(
+            samplerate=self.rate,
+            blocksize=self.block,
+            channels=1,
+            dtype="float32",
+            callback=callback,
+        )
+        self._stream.start()
+
+    def stop(self):
+        if self._stream is not None:
+            self._stream.stop()
+            self._stream.close()
+            self._stream = None
+
+
+class WavSource:
+    """Stand-in microphone that plays a WAV file into the capture callback.
+
+    Runs on machines without audio hardware.  With ``realtime`` the blocks
+    are paced like a real device; otherwise they are delivered as fast as
+    the consumers keep up: playback waits for the first reader and never
+    gets more than half the capture ring ahead of the slowest one, so a
+    replay loses no audio however fast it runs (``hold``, if given, can
+    pause it further while a downstream queue is full).  Silence follows
+    the file unless ``loop`` is set.
+    """
+
+    def __init__(self, path: str, rate: int = SAMPLE_RATE, block: int = BLOCK_SIZE,
+                 realtime: bool = True, loop: bool = False, tail_seconds: float = 2.0,
+                 hold=None):
+        self.path = path
+        self.rate = rate
+        self.block = block
+        self.realtime = realtime
+        self.loop = loop
+        self.tail_seconds = tail_seconds
+        self.hold = hold
+        self.finished = threading.Event()
+        self.ring = None        # set by AudioCapture; used to pace non-realtime playback
+        self._running = False
+        self._thread = None
+
+    @staticmethod
+    def load(path: str, rate: int = SAMPLE_RATE):
+        """Read a PCM WAV as mono float32 at ``rate``."""
+        with wave.open(path, "rb") as w:
+            channels = w.getnchannels()
+            width = w.getsampwidth()
+            src_rate = w.getframerate()
+            raw = w.readframes(w.getnframes())
+        dtype = {1: np.uint8, 2: np.int16, 4: np.int32}[width]
+        data = np.frombuffer(raw, dtype=dtype).astype(np.float32)
+        if width == 1:
+            data = (data - 128.0) / 128.0
+        else:
+            data /= float(2 ** (8 * width - 1))
+        if channels > 1:
+            data = data.reshape(-1, channels).mean(axis=1)
+        if src_rate != rate and len(data):
+            n = int(len(data) * rate / src_rate)
+            data = np.interp(
+                np.linspace(0, len(data) - 1, n), np.arange(len(data)), data
+            ).astype(np.float32)
+        return data
+
+    def start(self, callback):
+        samples = self.load(self.path, self.rate)
+        tail = np.zeros(int(self.tail_seconds * self.rate), dtype=np.float32)
+        samples = np.concatenate([samples, tail])
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._run, args=(samples, callback), daemon=True
+        )
+        self._thread.start()
+
+    def _run(self, samples, callback):
+        period = self.block / self.rate
+        block = np.zeros((self.block, 1), dtype=np.float32)
+        if not self.realtime:
+            self._wait_for_readers(lambda lag: lag is not None, timeout=10.0)
+        next_t = time.perf_counter()
+        while self._running:
+            for i in range(0, len(samples) - self.block + 1, self.block):
+                if not self._running:
+                    break
+                block[:, 0] = samples[i:i + self.block]
+                callback(block, self.block, None, None)
+                if self.realtime:
+                    next_t += period
+                    delay = next_t - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+                else:
+                    # Back-pressure: don't lap a reader that's still busy
+                    limit = self.ring.capacity // 2 if self.ring is not None else 0
+                    self._wait_for_readers(lambda lag: lag is None or lag <= limit)
+            if not self.loop:
+                break
+        self.finished.set()
+
+    def _wait_for_readers(self, ready, timeout=None):
+        if self.ring is None:
+            return
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._running and (not ready(self.ring.lag()) or (self.hold and self.hold())):
+            if deadline is not None and time.monotonic() > deadline:
+                return
+            time.sleep(0.001)
+
+    def stop(self):
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+
+
+# ── Capture service ────────────────────────────────────────
+class AudioCapture:
+    """Owns the input source and fans each block out to all consumers.
+
+    Block listeners run on the audio thread and must be quick; anything
+    heavier should take a ``reader()`` and pull from the ring on its own
+    thread.
+    """
+
+    def __init__(self, source=None, rate: int = SAMPLE_RATE,
+                 ring_seconds: float = CAPTURE_RING_SECONDS):
+        self.source = source or SoundDeviceSource(rate)
+        self.rate = rate
+        self.ring = AudioRing(ring_seconds, rate)
+        if isinstance(self.source, WavSource):
+            self.source.ring = self.ring
+        self.running = False
+        self._listeners = []
+        # Callback health: device overruns, and blocks we took too long over
+        self.callbacks = 0
+        self.overflows = 0
+        self.over_time = 0
+        self.max_callback = 0.0
+
+    def add_listener(self, fn):
+        """``fn(block)`` is called with each mono float32 block on the audio thread."""
+        self._listeners.append(fn)
+
+    def reader(self, preroll: float = 0.0) -> CaptureReader:
+        """A new cursor starting ``preroll`` seconds in the past."""
+        return CaptureReader(self.ring, int(preroll * self.rate))
+
+    def _callback(self, indata, frames, time_info, status):
+        t0 = time.perf_counter()
+        if status and getattr(status, "input_overflow", False):
+            self.overflows += 1
+        mono = indata[:, 0]
+        self.ring.write(mono)
+        for fn in self._listeners:
+            fn(mono)
+        elapsed = time.perf_counter() - t0
+        self.callbacks += 1
+        if elapsed > self.max_callback:
+            self.max_callback = elapsed
+        if elapsed > frames / self.rate * CAPTURE_CALLBACK_BUDGET:
+            self.over_time += 1
+
+    def stats(self) -> dict:
+        return {
+            "callbacks": self.callbacks,
+            "overflows": self.overflows,
+            "over_time": self.over_time,
+            "max_callback_ms": self.max_callback * 1000,
+        }
+
+    def start(self):
+        self.source.start(self._callback)
+        self.running = True
+
+    def stop(self):
+        self.running = False
+        self.source.stop()
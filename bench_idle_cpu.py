@@ -0,0 +1,81 @@
+# ============================================================
+#  Idle CPU of the GUI, with and without render throttling
+#  Starts the window (engine off, so the mic reads as silent)
+#  in a fresh process per scenario and measures the CPU it
+#  burns while visible-and-idle and while hidden in the tray.
+#  Needs a display.
+#
+#    python bench_idle_cpu.py --seconds 20
+# ============================================================
+
+import sys
+import json
+import time
+import argparse
+import subprocess
+
+SCENARIOS = [
+    ("visible", False), ("visible", True),
+    ("hidden", False), ("hidden", True),
+]
+
+
+def measure(state: str, throttle: bool, seconds: float, settle: float) -> dict:
+    """Run in the child process: build the app, settle, then time ``seconds``."""
+    from jarvis_gui import JarvisApp
+
+    app = JarvisApp()
+    app.scheduler.enabled = throttle
+    if state == "hidden":
+        app.withdraw()
+    result = {}
+
+    def start():
+        app.scheduler.wake()
+        result["wall0"], result["cpu0"] = time.perf_counter(), time.process_time()
+        app.after(int(seconds * 1000), stop)
+
+    def stop():
+        result["wall"] = time.perf_counter() - result.pop("wall0")
+        result["cpu"] = time.process_time() - result.pop("cpu0")
+        result["mode"] = app.scheduler.mode
+        app.quit()
+
+    # Let the idle timeout pass first, so "visible" is measured at its idle rate
+    app.after(int(settle * 1000), start)
+    app.mainloop()
+    app.destroy()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure idle GUI CPU with/without throttling")
+    parser.add_argument("--seconds", type=float, default=20.0)
+    parser.add_argument("--settle", type=float, default=5.0,
+                        help="seconds to wait before measuring (longer than RENDER_IDLE_AFTER)")
+    parser.add_argument("--child", nargs=2, metavar=("STATE", "THROTTLE"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        state, throttle = args.child[0], args.child[1] == "on"
+        print(json.dumps(measure(state, throttle, args.seconds, args.settle)))
+        return
+
+    print(f"{'window':8s} {'throttle':9s} {'mode':7s} {'CPU %':>7s}")
+    for state, throttle in SCENARIOS:
+        out = subprocess.run(
+            [sys.executable, __file__, "--seconds", str(args.seconds),
+             "--settle", str(args.settle), "--child", state, "on" if throttle else "off"],
+            capture_output=True, text=True,
+        )
+        try:
+            r = json.loads(out.stdout.strip().splitlines()[-1])
+        except (ValueError, IndexError):
+            print(f"{state:8s} {'on' if throttle else 'off':9s} failed: {out.stderr.strip()[-200:]}")
+            continue
+        print(f"{state:8s} {'on' if throttle else 'off':9s} {r['mode']:7s}"
+              f" {r['cpu'] / r['wall'] * 100:6.2f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# ============================================================
+#  Micro-benchmark: command routing cost vs. command count
+#  Compares the compiled registry against the old style of a
+#  linear chain of substring checks, for 10 … 500 commands.
+#
+#    python bench_intents.py
+# ============================================================
+
+import time
+import random
+import argparse
+
+from intents import CommandRegistry, tokenize
+
+VERBS = ("open close start stop show hide turn set check read send call mute "
+         "pause resume lock find launch dim raise lower toggle").split()
+NOUNS = ("lights music email calendar browser notes weather timer alarm door "
+         "camera volume screen printer fan heater blinds news messages files "
+         "terminal editor backup network battery wallpaper kettle garage").split()
+
+
+def synthetic_patterns(n: int, seed: int = 1):
+    """``n`` distinct multi-word command patterns, some with a slot."""
+    rng = random.Random(seed)
+    seen, out = set(), [("open_home", "open home"), ("play", "play {song}")]
+    while len(out) < n:
+        words = [rng.choice(VERBS), rng.choice(NOUNS)]
+        if rng.random() < 0.5:
+            words.append(rng.choice(NOUNS))
+        if rng.random() < 0.2:
+            words.append("{thing}")
+        pattern = " ".join(words)
+        if pattern not in seen:
+            seen.add(pattern)
+            out.append((f"cmd{len(out)}", pattern))
+    return out
+
+
+def substring_chain(patterns):
+    """The old routing style: test each command's words in turn."""
+    chain = [(name, [w for w in p.split() if not w.startswith("{")]) for name, p in patterns]
+
+    def route(text):
+        for name, words in chain:
+            if all(w in text for w in words):
+                return name
+        return None
+    return route
+
+
+def _time_per_call(fn, utterances, repeat: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        for u in utterances:
+            fn(u)
+    return (time.perf_counter() - t0) / (repeat * len(utterances))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark intent matching")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    utterances = [
+        "jarvis open home",
+        "hey jarvis could you play back in black please",
+        "jarvis what time is it",
+        "jervis plya thunderstruck",
+    ]
+    print(f"{'commands':>9} {'registry us':>12} {'chain us':>10} {'compile ms':>11}")
+    for n in (10, 20, 50, 100, 200, 500):
+        patterns = synthetic_patterns(n)
+        # Use real patterns from the tail too, so the chain has to walk far
+        tail = tokenize(patterns[-1][1].replace("{thing}", "x"))
+        probes = utterances + ["jarvis " + " ".join(tail)]
+
+        registry = CommandRegistry("jarvis")
+        for name, pattern in patterns:
+            registry.register(name, pattern)
+        t0 = time.perf_counter()
+        registry.compile()
+        compile_ms = (time.perf_counter() - t0) * 1000
+        for u in probes:
+            registry.match(u)      # warm the token lookup cache, like a live session
+
+        reg = _time_per_call(registry.match, probes, args.repeat) * 1e6
+        chain = _time_per_call(substring_chain(patterns), probes, args.repeat) * 1e6
+        print(f"{n:>9} {reg:>12.1f} {chain:>10.1f} {compile_ms:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
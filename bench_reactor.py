@@ -0,0 +1,141 @@
+# ============================================================
+#  Frame-time benchmark for the arc-reactor HUD
+#  Draws N frames with the old immediate-mode renderer (kept
+#  here verbatim) and with each current renderer, and reports
+#  wall ms/frame and Tk-side CPU at 30 fps.  Needs a display;
+#  the X server's own drawing time is not included.
+#
+#    python bench_reactor.py --frames 600
+# ============================================================
+
+import math
+import time
+import argparse
+import tkinter as tk
+
+import numpy as np
+
+from jarvis_gui import ArcReactorCanvas, SpriteReactorCanvas, BG_DARK
+
+
+class LegacyReactor(tk.Canvas):
+    """The pre-retained-mode renderer: delete everything, redraw every item."""
+
+    def __init__(self, master, size=280):
+        super().__init__(master, width=size, height=size, bg=BG_DARK, highlightthickness=0)
+        self.size = size
+        self.cx = size // 2
+        self.cy = size // 2
+        self.angle = 0
+        self.angle2 = 0
+        self.amplitude = 0.0
+        self.pulse = 0
+        self.wave_data = [0.0] * 40
+
+    def _draw_frame(self):
+        self.delete("all")
+        s = self.size
+        cx, cy = self.cx, self.cy
+        self.pulse = (self.pulse + 1) % 100
+        pulse_val = abs(math.sin(self.pulse * 0.06))
+        for i in range(5):
+            r = s // 2 - 6 - i * 4
+            alpha_hex = max(15, 40 - i * 8)
+            col = f"#00{alpha_hex + 30:02x}{alpha_hex + 50:02x}"
+            self.create_oval(cx - r, cy - r, cx + r, cy + r, outline=col, width=1)
+        r1 = s // 2 - 20
+        for i in range(4):
+            self.create_arc(cx - r1, cy - r1, cx + r1, cy + r1, start=self.angle + i * 90,
+                            extent=50, outline="#00a0d0", width=2, style="arc")
+        r1b = s // 2 - 30
+        for i in range(6):
+            self.create_arc(cx - r1b, cy - r1b, cx + r1b, cy + r1b, start=-self.angle2 + i * 60,
+                            extent=25, outline="#006090", width=1, style="arc")
+        r2 = s // 2 - 45
+        glow = int(140 + self.amplitude * 115)
+        self.create_oval(cx - r2, cy - r2, cx + r2, cy + r2,
+                         outline=f"#00{min(glow, 255):02x}ff", width=3)
+        r_tick_out, r_tick_in = r2 + 2, r2 - 6
+        for i in range(36):
+            a = math.radians(i * 10)
+            self.create_line(cx + r_tick_out * math.cos(a), cy + r_tick_out * math.sin(a),
+                             cx + r_tick_in * math.cos(a), cy + r_tick_in * math.sin(a),
+                             fill="#00607a" if i % 3 != 0 else "#00b8e0", width=1)
+        r3 = s // 2 - 70
+        for i in range(3):
+            ang = math.radians(self.angle * 1.5 + i * 120)
+            px, py = cx + r3 * math.cos(ang), cy + r3 * math.sin(ang)
+            self.create_polygon([
+                px + 8 * math.cos(ang), py + 8 * math.sin(ang),
+                px + 8 * math.cos(ang + 2.3), py + 8 * math.sin(ang + 2.3),
+                px + 8 * math.cos(ang - 2.3), py + 8 * math.sin(ang - 2.3),
+            ], fill="#00c8ff", outline="")
+        r_wave = s // 2 - 58
+        points_wave = []
+        for idx, val in enumerate(self.wave_data):
+            a = math.radians(idx * (360 / len(self.wave_data)))
+            points_wave.extend([cx + (r_wave + val * 18) * math.cos(a),
+                                cy + (r_wave + val * 18) * math.sin(a)])
+        self.create_line(*points_wave, fill="#00e8ff", width=1, smooth=True)
+        brightness = int(40 + self.amplitude * 160 + pulse_val * 30)
+        self.create_oval(cx - 35, cy - 35, cx + 35, cy + 35,
+                         fill=f"#00{min(brightness, 255):02x}{min(brightness + 30, 255):02x}",
+                         outline="#00a0c0", width=1)
+        self.create_oval(cx - 25, cy - 25, cx + 25, cy + 25, outline="#00e0ff", width=2)
+        r6 = int(10 + pulse_val * 4)
+        self.create_oval(cx - r6, cy - r6, cx + r6, cy + r6, fill="#60f0ff", outline="")
+        self.create_oval(cx - 4, cy - 4, cx + 4, cy + 4, fill="#ffffff", outline="")
+        bk, bk_col = 20, "#004060"
+        for x0, y0, dx, dy in ((4, 4, 1, 1), (s - 4, 4, -1, 1), (4, s - 4, 1, -1), (s - 4, s - 4, -1, -1)):
+            self.create_line(x0, y0, x0, y0 + dy * bk, fill=bk_col, width=1)
+            self.create_line(x0, y0, x0 + dx * bk, y0, fill=bk_col, width=1)
+        self.angle = (self.angle + 1.2) % 360
+        self.angle2 = (self.angle2 + 0.7) % 360
+
+
+def run(canvas, frames: int, seed: int = 0):
+    """Draw ``frames`` frames with live-looking levels; returns (wall, cpu) seconds."""
+    rng = np.random.default_rng(seed)
+    levels = rng.random((frames, 40)).astype(np.float32) * 0.6
+    canvas.update()
+    wall0, cpu0 = time.perf_counter(), time.process_time()
+    for f in range(frames):
+        if isinstance(canvas.wave_data, list):
+            canvas.wave_data = levels[f].tolist()
+        else:
+            canvas.wave_data[:] = levels[f]
+        canvas.amplitude = float(levels[f, -1])
+        canvas._draw_frame()
+        canvas.update_idletasks()           # make Tk actually redisplay the canvas
+    return time.perf_counter() - wall0, time.process_time() - cpu0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the arc-reactor renderers")
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--size", type=int, default=280)
+    args = parser.parse_args()
+
+    root = tk.Tk()
+    root.configure(bg=BG_DARK)
+    results = []
+    for name, make in (("legacy (delete + redraw)", LegacyReactor),
+                       ("retained (coords/itemconfigure)", ArcReactorCanvas),
+                       ("sprites (pre-rendered atlas)", SpriteReactorCanvas)):
+        canvas = make(root, size=args.size)
+        canvas.pack()
+        wall, cpu = run(canvas, args.frames)
+        results.append((name, wall, cpu))
+        canvas.destroy()
+    root.destroy()
+
+    frame_budget = 1 / 30
+    print(f"{'renderer':34s} {'ms/frame':>9s} {'cpu ms':>7s} {'CPU @30fps':>11s}")
+    for name, wall, cpu in results:
+        per_frame = cpu / args.frames
+        print(f"{name:34s} {wall / args.frames * 1000:9.2f} {per_frame * 1000:7.2f}"
+              f" {per_frame / frame_budget * 100:10.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,292 @@
+# ============================================================
+#  Offline replay benchmark for the voice engine
+#  Feeds a recorded WAV session through JarvisCore — capture,
+#  VAD, wake gate, recognition pipeline, intents, speech
+#  scheduler, voice cache and playback — with local stand-ins
+#  for everything that needs a network, speakers or Windows:
+#  scripted recogniser results, a fake TTS with set latency,
+#  SDL's dummy audio driver, a fake app launcher and a fake
+#  Spotify search.  Reports throughput, per-stage latency (from
+#  the engine's own tracer), CPU and peak RSS.
+#
+#    python bench_replay.py                        # synthetic session
+#    python bench_replay.py session.wav            # transcripts in session.json
+#    python bench_replay.py --fast --json out.json
+#
+#  Real time (the default) gives user-facing latencies; --fast runs
+#  as quickly as the engine keeps up, for throughput, and its waits
+#  (endpoint, queue, first_audio) then include the backlog.  Barge-in
+#  is off in --fast: phrases then arrive faster than replies play, and
+#  each new command would cut off every reply still queued.
+#
+#  session.json: {"phrases": ["jarvis play thunderstruck", …]}, one
+#  entry per phrase in the WAV, in order; an entry may also be a list
+#  of [transcript, confidence] alternatives, or null for "nothing heard".
+# ============================================================
+
+import os
+import sys
+import json
+import time
+import wave
+import random
+import asyncio
+import argparse
+import tempfile
+import threading
+from collections import Counter, deque
+
+# Null audio sink: pygame plays into SDL's dummy driver (set before import)
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+
+from config import SAMPLE_RATE
+from audio_capture import WavSource
+from voice_cache import VoiceCache
+from voice_synth import FakeSynthesizer, synthesize_all
+from tracing import format_report
+from phrases import canned_phrases
+from jarvis_core import JarvisCore
+
+SCRIPT = [
+    "jarvis", "play thunderstruck",         # wake word, then a command in the follow-up
+    "jarvis play back in black",
+    "jarvis open home",
+    "jarvis",
+    "jarvis put on highway to hell",
+    "jarvis what's the weather like",       # not a command: falls back to a greeting
+    "play hells bells",                     # no wake word, but inside the greeting's follow-up
+]
+
+
+# ── Stand-ins ──────────────────────────────────────────────
+class ScriptedRecognizer:
+    """Stands in for ``sr.Recognizer``: returns the session's transcripts
+    in the order phrases reach it, after a set network latency.
+    """
+
+    def __init__(self, phrases, latency: float = 0.25, jitter: float = 0.0, seed: int = 0):
+        self.operation_timeout = None
+        self.latency = latency
+        self.jitter = jitter
+        self.calls = 0
+        self._phrases = deque(phrases)
+        self._lock = threading.Lock()
+        self._rng = random.Random(seed)
+
+    def recognize_google(self, audio, show_all: bool = False):
+        with self._lock:
+            self.calls += 1
+            entry = self._phrases.popleft() if self._phrases else None
+            delay = self.latency + self._rng.uniform(0, self.jitter)
+        time.sleep(delay)
+        if not entry:
+            return []               # what Google returns for unintelligible audio
+        alts = [[entry, 0.9]] if isinstance(entry, str) else entry
+        return {"alternative": [{"transcript": t, "confidence": c} for t, c in alts]}
+
+
+class FakeTrackSearch:
+    """Spotify search stand-in: every query is found, after ``latency``."""
+
+    def __init__(self, latency: float = 0.15):
+        self.latency = latency
+        self.queries = []
+
+    def __call__(self, query: str):
+        self.queries.append(query)
+        time.sleep(self.latency)
+        return f"spotify:track:{query.replace(' ', '-')}", query.title(), "Bench Artist"
+
+
+class FakeLauncher:
+    """Records what would have been opened instead of opening it."""
+
+    def __init__(self):
+        self.opened = []
+
+    def __call__(self, target: str):
+        self.opened.append(target)
+
+
+def silent_mp3(seconds: float) -> bytes:
+    """A decodable MP3 of silence (24 kHz mono 48 kbit/s, like Edge TTS)."""
+    frame = bytes([0xFF, 0xF3, 0x64, 0xC4]) + bytes(140)     # 576 samples each
+    return frame * max(1, int(seconds * 24000 / 576))
+
+
+# ── Sessions ───────────────────────────────────────────────
+def synthetic_session(phrases, rate: int = SAMPLE_RATE, gap: float = 1.5, seed: int = 0):
+    """Voiced bursts (a harmonic stack with syllable-rate modulation) at
+    -20 dBFS in -60 dBFS noise, one per phrase, sized by its word count.
+    """
+    rng = np.random.default_rng(seed)
+
+    def noise(n):
+        return (rng.standard_normal(n) * 10 ** (-60 / 20)).astype(np.float32)
+
+    parts = [noise(2 * rate)]                    # ambient lead-in for the VAD calibration
+    for text in phrases:
+        words = len((text or "x").split())
+        t = np.arange(int((0.3 + 0.18 * words) * rate)) / rate
+        f0 = rng.uniform(110, 180) * (1 + 0.03 * np.sin(2 * np.pi * 5 * t))
+        phase = 2 * np.pi * np.cumsum(f0) / rate
+        voice = sum(np.sin(k * phase) / k for k in range(1, 11))
+        envelope = 0.6 + 0.4 * np.sin(2 * np.pi * 4 * t) ** 2
+        voice = voice * envelope
+        voice *= 10 ** (-20 / 20) / np.sqrt(np.mean(voice ** 2))
+        parts.append(voice.astype(np.float32) + noise(len(t)))
+        parts.append(noise(int((gap + rng.uniform(0, 0.5)) * rate)))
+    return np.concatenate(parts)
+
+
+def write_wav(path: str, samples, rate: int = SAMPLE_RATE):
+    pcm = (np.clip(samples, -1.0, 1.0) * 32767).astype(np.int16)
+    with wave.open(path, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(rate)
+        w.writeframes(pcm.tobytes())
+
+
+def load_script(wav_path: str):
+    path = os.path.splitext(wav_path)[0] + ".json"
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["phrases"]
+
+
+def peak_rss_mb():
+    try:
+        import resource
+    except ImportError:
+        return None                 # Windows: not available without psutil
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1e6 if sys.platform == "darwin" else peak / 1024
+
+
+# ── Replay ─────────────────────────────────────────────────
+def replay(wav: str, phrases, args) -> dict:
+    with tempfile.TemporaryDirectory(prefix="jarvis_replay_") as data_dir:
+        synth = FakeSynthesizer(latency=args.tts_latency, jitter=args.tts_jitter,
+                                payload=silent_mp3(args.clip_seconds), seed=args.seed)
+        if not args.cold:
+            # Steady state: canned lines already cached, as on a warmed-up install
+            cache = VoiceCache(os.path.join(data_dir, "voice_cache"))
+            asyncio.run(synthesize_all(canned_phrases(), cache, synth))
+            cache.flush()
+
+        recognizer = ScriptedRecognizer(phrases, args.asr_latency, args.asr_jitter, args.seed)
+        search, launcher = FakeTrackSearch(args.search_latency), FakeLauncher()
+        source = WavSource(wav, realtime=not args.fast, tail_seconds=3.0)
+        tags = Counter()
+
+        def on_log(tag, msg):
+            tags[tag] += 1
+            if args.verbose or tag == "error":
+                print(f"  [{tag:6s}] {msg}")
+
+        random.seed(args.seed)                  # response lines are picked at random
+        core = JarvisCore(
+            on_log=on_log, synthesizer=synth, streamer=synth.stream, audio_source=source,
+            recognizer=recognizer, launcher=launcher, track_search=search, data_dir=data_dir,
+            control_api=False,
+        )
+        pipeline = core._pipeline
+        # --fast: also wait for the recogniser queue, so phrases aren't shed for load
+        source.hold = lambda: pipeline.backlog() >= pipeline.max_pending
+        if args.fast:
+            core.barge_in = lambda: None
+        audio_seconds = len(WavSource.load(wav)) / SAMPLE_RATE
+
+        wall0, cpu0 = time.perf_counter(), time.process_time()
+        core.start()
+        source.finished.wait()
+        # Then until every phrase is recognised, handled and spoken
+        deadline = time.monotonic() + args.timeout
+        idle_since = None
+        while time.monotonic() < deadline:
+            busy = (core._pipeline.backlog() or core._speech.pending()
+                    or core._speech._current is not None)
+            if busy:
+                idle_since = None
+            elif idle_since is None:
+                idle_since = time.monotonic()
+            elif time.monotonic() - idle_since > 0.5:
+                break
+            time.sleep(0.02)
+        wall = time.perf_counter() - wall0
+        cpu = time.process_time() - cpu0
+        core.stop()
+
+        stages = core.tracer.summary()
+        return {
+            "session": os.path.basename(wav),
+            "mode": "fast" if args.fast else "realtime",
+            "audio_s": round(audio_seconds, 2),
+            "wall_s": round(wall, 2),
+            "x_realtime": round(audio_seconds / wall, 2),
+            "phrases": core.tracer.traces,
+            "recognised": recognizer.calls,
+            "commands": tags["user"],
+            "replies": stages.get("first_audio", {}).get("count", 0),
+            "merged": core._speech.merged,
+            "cut_off": core._speech.cut_off,
+            "dropped": core._pipeline.dropped,
+            "timed_out": core._pipeline.timed_out,
+            "phrases_per_s": round(core.tracer.traces / wall, 2),
+            "cpu_pct": round(cpu / wall * 100, 1),
+            "peak_rss_mb": peak_rss_mb(),
+            "launched": len(launcher.opened),
+            "searches": len(search.queries),
+            "stages": stages,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a voice session through JarvisCore offline")
+    parser.add_argument("wav", nargs="?", help="session WAV (transcripts in the matching .json)")
+    parser.add_argument("--phrases", type=int, default=32, help="synthetic session length")
+    parser.add_argument("--fast", action="store_true",
+                        help="feed audio as fast as the engine keeps up instead of in real time")
+    parser.add_argument("--asr-latency", type=float, default=0.25)
+    parser.add_argument("--asr-jitter", type=float, default=0.0)
+    parser.add_argument("--tts-latency", type=float, default=0.3)
+    parser.add_argument("--tts-jitter", type=float, default=0.0)
+    parser.add_argument("--search-latency", type=float, default=0.15)
+    parser.add_argument("--clip-seconds", type=float, default=1.5,
+                        help="length of every synthesized reply")
+    parser.add_argument("--cold", action="store_true", help="start with an empty voice cache")
+    parser.add_argument("--timeout", type=float, default=60.0,
+                        help="seconds to wait for the backlog to clear after the session")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="also write the results here")
+    parser.add_argument("-v", "--verbose", action="store_true", help="print the engine log")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="jarvis_session_") as tmp:
+        if args.wav:
+            wav, phrases = args.wav, load_script(args.wav)
+        else:
+            phrases = [SCRIPT[i % len(SCRIPT)] for i in range(args.phrases)]
+            wav = os.path.join(tmp, "synthetic.wav")
+            write_wav(wav, synthetic_session(phrases, seed=args.seed))
+        r = replay(wav, phrases, args)
+
+    print(f"\n{r['session']} ({r['mode']}): {r['audio_s']:.1f} s of audio in {r['wall_s']:.1f} s"
+          f"  ({r['x_realtime']:.2f}x real time)")
+    print(f"  phrases {r['phrases']}/{len(phrases)}  recognised {r['recognised']}"
+          f"  commands {r['commands']}  replies {r['replies']}"
+          f"  (merged {r['merged']}, cut off {r['cut_off']})"
+          f"  dropped {r['dropped']}  timed out {r['timed_out']}")
+    rss = f"{r['peak_rss_mb']:.0f} MB" if r["peak_rss_mb"] is not None else "n/a"
+    print(f"  throughput {r['phrases_per_s']:.2f} phrases/s   CPU {r['cpu_pct']:.1f}%"
+          f"   peak RSS {rss}\n")
+    print("\n".join(format_report(r)))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(r, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,9 @@ echo   Building J.A.R.V.I.S  Standalone App
 echo ============================================
 echo.
 
+REM Pack the voice cache into a single bank shipped next to the exe
+C:\Python313\python.exe download_voices.py --bank-only
+
 C:\Python313\python.exe -m PyInstaller ^
     --name "Jarvis" ^
     --onefile ^
@@ -12,9 +15,6 @@ C:\Python313\python.exe -m PyInstaller ^
     --clean ^
     --icon "assets\jarvis_icon.ico" ^
     --add-data "config.py;." ^
-    --add-data "voice_cache;voice_cache" ^
-    --hidden-import "pyttsx3.drivers" ^
-    --hidden-import "pyttsx3.drivers.sapi5" ^
     --hidden-import "edge_tts" ^
     --hidden-import "pygame" ^
     --hidden-import "customtkinter" ^
@@ -33,9 +33,11 @@ C:\Python313\python.exe -m PyInstaller ^
 
 echo.
 if exist "dist\Jarvis.exe" (
+    if exist "voice_bank.bin" copy /Y "voice_bank.bin" "dist\voice_bank.bin" >nul
     echo ============================================
     echo   BUILD SUCCESSFUL!
     echo   Your app is at: dist\Jarvis.exe
+    echo   Keep dist\voice_bank.bin next to it
     echo ============================================
 ) else (
     echo   BUILD FAILED - check errors above
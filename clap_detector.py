@@ -0,0 +1,139 @@
+# ============================================================
+#  J.A.R.V.I.S  –  Double-Clap Detector
+#  Spectral-flux onset detection on the high band, timed at
+#  sub-block resolution, with a decay check that rejects
+#  speech and door slams.  Fed from a capture ring reader on
+#  its own thread, never from the audio callback.
+# ============================================================
+
+import numpy as np
+
+from config import (
+    SAMPLE_RATE,
+    DOUBLE_CLAP_WINDOW,
+    CLAP_HF_HZ,
+    CLAP_HF_RATIO,
+    CLAP_FLUX_RATIO,
+    CLAP_MIN_SNR_DB,
+    CLAP_DECAY_DB,
+    CLAP_DECAY_MS,
+)
+
+SUB_BLOCK = 256             # ≈6 ms at 44.1 kHz: onset timing resolution
+MIN_GAP = 0.12              # closer than this it's the same clap (or its echo)
+REFRACTORY = 1.0            # seconds ignored after a double clap fires
+LEAD_IN = 0.15              # seconds before an onset that must be comparatively quiet
+
+
+class ClapDetector:
+    """Feed it capture blocks; ``on_double_clap()`` fires on a verified pair.
+
+    A clap is a sub-block whose high-band spectral flux jumps well above its
+    running level, is loud relative to the background, carries a good share
+    of its energy above ``CLAP_HF_HZ`` and dies away by ``CLAP_DECAY_DB``
+    within ``CLAP_DECAY_MS``.  Time is counted in samples, so offline runs
+    behave exactly like live ones.
+    """
+
+    def __init__(self, rate: int = SAMPLE_RATE, on_double_clap=None, on_clap=None):
+        self.rate = rate
+        self.on_double_clap = on_double_clap or (lambda t: None)
+        self.on_clap = on_clap or (lambda t: None)
+        self._window = np.hanning(SUB_BLOCK).astype(np.float32)
+        freqs = np.fft.rfftfreq(SUB_BLOCK, 1.0 / rate)
+        self._hf_lo = int(np.searchsorted(freqs, CLAP_HF_HZ))
+        self._prev_hf = np.zeros(len(freqs) - self._hf_lo, dtype=np.float32)
+        self._flux_level = None     # running HF flux of the background
+        self._noise_db = None       # running background level
+        self._decay_subs = max(1, int(CLAP_DECAY_MS / 1000.0 * rate / SUB_BLOCK))
+        self._carry = np.zeros(0, dtype=np.float32)
+        self._lead = np.full(max(1, int(LEAD_IN * rate / SUB_BLOCK)), -100.0)
+        self._lead_i = 0
+        self._last_db = -100.0      # joins the lead-in one sub-block late (attack may start in it)
+        self.reset()
+
+    def reset(self):
+        self._samples = 0
+        self._candidate = None      # [onset time, peak dB, sub-blocks since onset]
+        self._first = None          # time of an unpaired clap
+        self._quiet_until = 0.0
+        self.claps = 0
+        self.doubles = 0
+
+    def process(self, block):
+        """Analyse one mono float32 block (any length)."""
+        x = block
+        if len(self._carry):
+            x = np.concatenate([self._carry, block])
+        n = len(x) // SUB_BLOCK
+        if n == 0:
+            self._carry = np.array(x, dtype=np.float32)
+            return
+        self._carry = np.array(x[n * SUB_BLOCK:], dtype=np.float32)
+        frames = x[:n * SUB_BLOCK].reshape(n, SUB_BLOCK)
+
+        # All sub-blocks of this block in one batch
+        power = np.abs(np.fft.rfft(frames * self._window, axis=1)) ** 2
+        hf = np.sqrt(power[:, self._hf_lo:])
+        prev = np.vstack([self._prev_hf[None, :], hf[:-1]])
+        flux = np.maximum(hf - prev, 0.0).sum(axis=1)
+        self._prev_hf = hf[-1].astype(np.float32)
+        total = power.sum(axis=1) + 1e-12
+        hf_ratio = power[:, self._hf_lo:].sum(axis=1) / total
+        level_db = 10.0 * np.log10((frames ** 2).mean(axis=1) + 1e-10)
+
+        if self._noise_db is None:
+            self._noise_db = float(level_db.min())
+            self._flux_level = float(flux.mean()) + 1e-6
+
+        start = self._samples
+        self._samples += n * SUB_BLOCK
+        for k in range(n):
+            self._step((start + k * SUB_BLOCK) / self.rate,
+                       float(flux[k]), float(hf_ratio[k]), float(level_db[k]))
+
+    def _step(self, t, flux, hf_ratio, level_db):
+        cand = self._candidate
+        if cand is not None:
+            cand[2] += 1
+            if cand[2] <= 2 and level_db > cand[1]:
+                cand[1] = level_db          # attack can straddle sub-blocks
+            elif level_db < cand[1] - CLAP_DECAY_DB:
+                self._candidate = None
+                self._clap(cand[0])
+            elif cand[2] > self._decay_subs:
+                self._candidate = None      # sustained: speech, music, a slam's rumble
+            return
+
+        onset = (
+            flux > self._flux_level * CLAP_FLUX_RATIO
+            and level_db > self._noise_db + CLAP_MIN_SNR_DB
+            and hf_ratio > CLAP_HF_RATIO
+            and level_db > self._lead.max() + CLAP_DECAY_DB    # not mid-sentence
+            and t >= self._quiet_until
+        )
+        self._lead[self._lead_i] = self._last_db
+        self._lead_i = (self._lead_i + 1) % len(self._lead)
+        self._last_db = level_db
+        if onset:
+            self._candidate = [t, level_db, 0]
+            return
+        # Background trackers: fall quickly, rise slowly
+        rate = 0.3 if level_db < self._noise_db else 0.01
+        self._noise_db += rate * (level_db - self._noise_db)
+        rate = 0.3 if flux < self._flux_level else 0.02
+        self._flux_level += rate * (flux - self._flux_level) + 1e-9
+
+    def _clap(self, t):
+        self.claps += 1
+        self.on_clap(t)
+        first = self._first
+        if first is not None and t - first < MIN_GAP:
+            return
+        if first is not None and t - first <= DOUBLE_CLAP_WINDOW:
+            self._first = None
+            self._quiet_until = t + REFRACTORY
+            self.doubles += 1
+            self.on_double_clap(t)
+        else:
+            self._first = t
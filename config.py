@@ -8,17 +8,86 @@ SPOTIFY_PATH = r"C:\Users\NAMIT\AppData\Local\Microsoft\WindowsApps\Spotify.exe"
 
 # ---------- Voice ----------
 WAKE_WORD = "jarvis"
-VOICE_RATE = 175          # words per minute (pyttsx3 fallback)
-VOICE_VOLUME = 1.0        # 0.0 – 1.0
+WAKE_SPOTTER_MODEL = "wake_word.npz"   # enrolled samples (python wake_word.py record 5)
+WAKE_SPOTTER_MARGIN = 1.5              # threshold = margin × worst sample-to-sample match
+WAKE_SPOTTER_WINDOW = 1.5              # seconds at the start of a phrase searched for it
 
 # Edge TTS (natural neural voice) — requires internet
 EDGE_TTS_VOICE = "en-GB-RyanNeural"   # British accent like the real Jarvis
 EDGE_TTS_RATE = "+30%"                 # Speed tweak
 EDGE_TTS_PITCH = "+0Hz"               # Pitch tweak
 
+# Voice cache (voice_cache/) — clips keyed by text + voice settings
+VOICE_CACHE_MAX_ENTRIES = 500          # LRU-evict dynamic clips beyond this
+VOICE_CACHE_MAX_MB = 50                # …or beyond this much disk
+CLIP_CACHE_MB = 24                     # RAM budget for decoded clips (instant playback)
+TTS_SYNTH_CONCURRENCY = 4              # parallel Edge TTS requests when warming the cache
+TTS_SYNTH_RETRIES = 2                  # retries per phrase on network errors
+TTS_SYNTH_BACKOFF = 0.5                # seconds, doubled after each failed attempt
+TTS_STREAMING = True                   # start speaking uncached lines before synthesis ends
+TTS_STREAM_FIRST_KB = 3                # ≈0.5 s of audio buffered before playback starts
+TTS_STREAM_SEGMENT_KB = 24             # later chunks decoded in larger segments
+
 # ---------- Audio Monitor ----------
 SAMPLE_RATE = 44100        # audio sample rate
 BLOCK_SIZE = 1024          # samples per audio block
+CAPTURE_RING_SECONDS = 10  # shared mic history kept in memory
+CAPTURE_PREROLL = 0.5      # seconds of history a new listener starts with
+AUDIO_INPUT_WAV = ""       # play this WAV instead of the mic (no audio hardware)
+LEVEL_RING_BLOCKS = 256    # per-block level history the HUD reads from (≈6 s)
+CAPTURE_CALLBACK_BUDGET = 0.25   # share of a block period the audio callback may use
+
+# ---------- Voice Activity Detection ----------
+VAD_FRAME_MS = 20          # analysis frame
+VAD_SNR_DB = 10            # how far above the noise floor speech must be
+VAD_FLATNESS_MAX = 0.5     # spectral flatness above this is noise (fans, hiss)
+VAD_HANGOVER_MS = (250, 700)   # silence that ends a phrase: short commands → long sentences
+VAD_MAX_PHRASE = 8.0       # seconds; hard cut for never-ending phrases
+VAD_CALIBRATION = "vad_calibration.json"   # ambient noise floor, kept across restarts
+
+# ---------- Clap Detection ----------
+CLAP_ENABLED = True        # double-clap → "open home"
+DOUBLE_CLAP_WINDOW = 1.0   # max gap between two claps (s)
+CLAP_HF_HZ = 2000          # claps are broadband; speech and thuds sit mostly below this
+CLAP_HF_RATIO = 0.25       # minimum share of a clap's energy above CLAP_HF_HZ
+CLAP_FLUX_RATIO = 8.0      # high-band spectral flux vs. its running level
+CLAP_MIN_SNR_DB = 18       # how far above the background a clap must be
+CLAP_DECAY_DB = 12         # …and how far it must fall within CLAP_DECAY_MS
+CLAP_DECAY_MS = 90
+
+# ---------- Speech Recognition ----------
+RECOGNIZER_WORKERS = 3     # phrases recognised in parallel
+RECOGNIZER_QUEUE = 4       # phrases waiting for a worker before the oldest is dropped
+RECOGNIZER_TIMEOUT = 6.0   # seconds per cloud request before giving up on it
+FOLLOWUP_WINDOW = 6.0      # seconds after the wake word a command needs no "Jarvis"
+INTENT_MIN_SCORE = 0.5     # grammar fit × recogniser confidence needed to act on a command
+
+# ---------- HUD ----------
+RENDER_THROTTLE = True     # slow the HUD down when idle, stop it when hidden
+RENDER_IDLE_AFTER = 3.0    # seconds of silence before the HUD drops to its idle rate
+RENDER_SILENCE_DBFS = -50  # mic level below this counts as silence
+HUD_RENDERER = "retained"  # "retained" (vector items) or "sprites" (pre-rendered, cheapest)
+HUD_SPRITE_CACHE = "hud_cache"   # where the sprite atlas is kept between runs
+
+# ---------- Activity Log ----------
+LOG_VIEW_LINES = 500       # lines kept in the on-screen log
+LOG_FILE = "jarvis.log"    # persisted next to the app ("" to disable)
+LOG_MAX_KB = 1024          # rotate the file at this size…
+LOG_BACKUPS = 3            # …keeping this many old ones
+
+# ---------- Latency Tracing ----------
+TRACE_ENABLED = True                 # per-stage spans for every voice interaction
+TRACE_WINDOW = 500                   # samples kept per stage for p50/p95/p99
+TRACE_FILE = "jarvis_trace.json"     # written by the tray item and on stop
+
+# ---------- Control API ----------
+CONTROL_API_ENABLED = False          # JSON-lines command socket for scripts (see control_api.py)
+CONTROL_API_HOST = "127.0.0.1"       # loopback only, but any local program (or web page) can connect
+CONTROL_API_PORT = 8765
+CONTROL_API_TOKEN = ""               # every request must carry {"token": …}; empty = generate one
+CONTROL_API_TOKEN_FILE = "control_api.token"   # the generated token, in the data dir (jarvisctl reads it)
+CONTROL_API_PIPELINE = 64            # requests one client may have in flight at once
+CONTROL_API_TIMEOUT = 30.0           # seconds a command may take before its reply is an error
 
 # ---------- Spotify API (for "Jarvis play <song>") ----------
 # One-time setup (2 minutes, free):
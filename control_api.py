@@ -0,0 +1,261 @@
+# ============================================================
+#  J.A.R.V.I.S  –  Local Control API
+#  Drive the engine without a microphone.  Typed commands go
+#  through the same in-order dispatch as spoken ones (intent
+#  matching, handlers, replies), plus speak and status
+#  requests.  One JSON object per line over a loopback TCP
+#  socket, served by a single asyncio loop on its own thread:
+#  any number of clients, each free to pipeline requests —
+#  replies come back in request order.
+#
+#    → {"id": 1, "cmd": "text", "text": "jarvis play thunderstruck"}
+#    ← {"id": 1, "ok": true, "handled": true, "intent": "play",
+#       "slots": {"song_name": "thunderstruck"}}
+#    → {"id": 2, "cmd": "speak", "text": "Hello sir.", "wait": true}
+#    ← {"id": 2, "ok": true, "spoken": true}
+#    → {"id": 3, "cmd": "status"}
+#    ← {"id": 3, "ok": false, "error": "…"}        (any failure)
+#
+#  Every request carries the token ({"token": …}, left out
+#  above): CONTROL_API_TOKEN, or one generated into the data
+#  dir on first start.  A connection whose first line is not
+#  a JSON object (an HTTP request from a web page, say) is
+#  closed unanswered.
+# ============================================================
+
+import os
+import json
+import asyncio
+import secrets
+import threading
+
+from config import (
+    CONTROL_API_HOST,
+    CONTROL_API_PORT,
+    CONTROL_API_TOKEN,
+    CONTROL_API_PIPELINE,
+    CONTROL_API_TIMEOUT,
+)
+from speech import PRIORITY_URGENT, PRIORITY_NORMAL, PRIORITY_LOW
+
+PRIORITIES = {"urgent": PRIORITY_URGENT, "normal": PRIORITY_NORMAL, "low": PRIORITY_LOW}
+LINE_LIMIT = 64 * 1024          # longest request line accepted
+
+
+class ControlServer:
+    """JSON-lines command server for one ``JarvisCore``."""
+
+    def __init__(self, core, host: str = CONTROL_API_HOST, port: int = CONTROL_API_PORT,
+                 token: str = CONTROL_API_TOKEN, token_path: str = None,
+                 pipeline: int = CONTROL_API_PIPELINE, timeout: float = CONTROL_API_TIMEOUT):
+        self.core = core
+        self.host = host
+        self.port = port                # the bound port once started (0 picks a free one)
+        self.token = token              # empty: read or generate one at token_path on start
+        self.token_path = token_path
+        self.pipeline = max(1, pipeline)
+        self.timeout = timeout
+        self._commands = {"text": self._text, "speak": self._speak, "status": self._status}
+        self._loop = None
+        self._thread = None
+        self._writers = set()
+        self.clients = 0
+        self.requests = 0
+
+    # ── Lifecycle (any thread) ──────────────────────────────
+    def start(self):
+        """Bind and serve on a background thread; raises OSError if the port is taken."""
+        if not self.token and self.token_path:
+            self.token = ensure_token(self.token_path)
+        ready = threading.Event()
+        failed = []
+        self._thread = threading.Thread(
+            target=self._run, args=(ready, failed), name="control-api", daemon=True)
+        self._thread.start()
+        ready.wait()
+        if failed:
+            self._thread = None
+            raise failed[0]
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=2.0)
+        self._thread = None
+
+    def _run(self, ready, failed):
+        loop = self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            server = loop.run_until_complete(asyncio.start_server(
+                self._serve, self.host, self.port, limit=LINE_LIMIT))
+        except OSError as e:
+            failed.append(e)
+            loop.close()
+            ready.set()
+            return
+        self.port = server.sockets[0].getsockname()[1]
+        ready.set()
+        try:
+            loop.run_forever()
+        finally:
+            server.close()
+            for writer in list(self._writers):
+                writer.close()
+            tasks = asyncio.all_tasks(loop)
+            for task in tasks:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            loop.run_until_complete(server.wait_closed())
+            loop.close()
+
+    # ── Connections ─────────────────────────────────────────
+    async def _serve(self, reader, writer):
+        self.clients += 1
+        self._writers.add(writer)
+        # Replies in request order; a full queue stops reading from this
+        # client until it catches up, so nobody can flood the engine
+        replies = asyncio.Queue(self.pipeline)
+        sender = asyncio.ensure_future(self._send(replies, writer))
+        first = True
+        try:
+            while not sender.done():
+                try:
+                    line = await reader.readline()
+                except (ValueError, ConnectionError):
+                    break               # over-long line or connection reset
+                if not line:
+                    break
+                if line.strip():
+                    if first and not _is_json_object(line):
+                        break           # not a client of ours ("POST / HTTP/1.1" …)
+                    first = False
+                    self.requests += 1
+                    await replies.put(asyncio.ensure_future(self._handle(line)))
+            if not sender.done():
+                await replies.put(None)     # hung up: still send what's due
+                await sender
+        except asyncio.CancelledError:
+            sender.cancel()                 # server stopping: drop what's in flight
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    async def _send(self, replies, writer):
+        while True:
+            reply = await replies.get()
+            if reply is None:
+                return
+            try:
+                writer.write(json.dumps(await reply).encode() + b"\n")
+                await writer.drain()
+            except ConnectionError:
+                return                  # client went away: stop, the reader follows
+
+    # ── Requests ────────────────────────────────────────────
+    async def _handle(self, line: bytes) -> dict:
+        try:
+            req = json.loads(line)
+        except ValueError:
+            return {"id": None, "ok": False, "error": "request is not valid JSON"}
+        if not isinstance(req, dict):
+            return {"id": None, "ok": False, "error": "request must be a JSON object"}
+        rid = req.get("id")
+        if self.token and not _token_matches(req.get("token"), self.token):
+            return {"id": rid, "ok": False, "error": "bad or missing token"}
+        command = self._commands.get(req.get("cmd"))
+        if command is None:
+            return {"id": rid, "ok": False,
+                    "error": f"unknown cmd {req.get('cmd')!r} (text, speak, status)"}
+        try:
+            result = await command(req)
+        except asyncio.TimeoutError:
+            return {"id": rid, "ok": False, "error": f"timed out after {self.timeout:.0f} s"}
+        except Exception as e:
+            return {"id": rid, "ok": False, "error": str(e)}
+        return {"id": rid, "ok": True, **result}
+
+    async def _text(self, req) -> dict:
+        """A typed command, dispatched exactly like a recognised phrase."""
+        text = _text_arg(req)
+        loop = asyncio.get_running_loop()
+        done = loop.create_future()
+
+        def on_done(intent, error):     # dispatcher thread
+            try:
+                loop.call_soon_threadsafe(_settle, done, intent, error)
+            except RuntimeError:
+                pass                    # the server has stopped since
+
+        if not self.core.submit_text(text, on_done):
+            raise RuntimeError("engine is not listening")
+        intent = await asyncio.wait_for(done, self.timeout)
+        if intent is None:
+            return {"handled": False}
+        return {"handled": True, "intent": intent.name, "slots": intent.slots}
+
+    async def _speak(self, req) -> dict:
+        text = _text_arg(req)
+        priority = PRIORITIES.get(req.get("priority", "normal"))
+        if priority is None:
+            raise ValueError(f"priority must be one of {', '.join(PRIORITIES)}")
+        utt = self.core.speak(text, priority)
+        if not req.get("wait"):
+            return {"queued": True}
+        # The executor thread gives up on its own after the timeout too
+        loop = asyncio.get_running_loop()
+        waited = loop.run_in_executor(None, utt.done.wait, self.timeout)
+        if not await asyncio.wait_for(waited, self.timeout):
+            raise asyncio.TimeoutError
+        return {"spoken": not utt.cancelled}
+
+    async def _status(self, req) -> dict:
+        status = self.core.status(latency=bool(req.get("latency")))
+        status["api"] = {"clients": len(self._writers), "connections": self.clients,
+                         "requests": self.requests}
+        return status
+
+
+def ensure_token(path: str) -> str:
+    """The token stored at ``path``, generating one (owner-only) if there is none."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            token = f.read().strip()
+        if token:
+            return token
+    except FileNotFoundError:
+        pass
+    token = secrets.token_urlsafe(24)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(token + "\n")
+    return token
+
+
+def _token_matches(given, token: str) -> bool:
+    # Constant time, so the token can't be guessed a character at a time
+    return isinstance(given, str) and secrets.compare_digest(given.encode(), token.encode())
+
+
+def _is_json_object(line: bytes) -> bool:
+    try:
+        return isinstance(json.loads(line), dict)
+    except ValueError:
+        return False
+
+
+def _text_arg(req) -> str:
+    text = req.get("text")
+    if not isinstance(text, str) or not text.strip():
+        raise ValueError("'text' must be a non-empty string")
+    return text
+
+
+def _settle(future, intent, error):
+    if future.done():
+        return                          # the client's wait already timed out
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(intent)
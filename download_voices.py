@@ -1,77 +1,86 @@
 # ============================================================
 #  Download all Jarvis voice responses (run once with internet)
 #  After this, the app works fully offline.
+#  Also packs them into voice_bank.bin for shipping with the exe.
 # ============================================================
 
 import os
+import time
 import asyncio
-import edge_tts
-from config import EDGE_TTS_VOICE, EDGE_TTS_RATE, EDGE_TTS_PITCH
+import argparse
+import tempfile
+from config import EDGE_TTS_VOICE, EDGE_TTS_RATE, EDGE_TTS_PITCH, TTS_SYNTH_CONCURRENCY
+from voice_cache import VoiceCache, write_bank, BANK_NAME
+from voice_synth import edge_synthesize, synthesize_all, FakeSynthesizer
+from phrases import canned_phrases
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 CACHE_DIR = os.path.join(SCRIPT_DIR, "voice_cache")
-os.makedirs(CACHE_DIR, exist_ok=True)
+BANK_PATH = os.path.join(SCRIPT_DIR, BANK_NAME)
 
-ALL_PHRASES = [
-    # Greetings
-    "At your service, sir.",
-    "Hello sir. What can I do for you?",
-    "Yes sir?",
-    "Online and ready, sir.",
-    "I'm here. What do you need?",
-    "Sir. Sarcasm module loaded and ready.",
-    "What shall we break today, sir?",
-    "Awaiting orders, sir.",
-    # Home openers
-    "On it, sir.",
-    "Firing up your workspace.",
-    "Setting up, sir.",
-    "Loading your setup.",
-    "Right away, sir.",
-    # Home ready
-    "All set, sir.",
-    "Done. You're welcome.",
-    "Ready when you are.",
-    "The stage is yours, sir.",
-    "All yours. Do try to keep up.",
-    # Error messages
-    "Well this is embarrassing. I can't seem to find VS Code, sir.",
-    "Well this is embarrassing. I can't seem to find Spotify, sir.",
-    # Play prompt
-    "What would you like me to play, sir?",
-]
+# The engine's own list, so a new canned line can't be left out of the bank
+ALL_PHRASES = canned_phrases()
 
 
-async def download_all():
+async def download_all(concurrency: int = TTS_SYNTH_CONCURRENCY, synth=None,
+                       cache_dir: str = CACHE_DIR):
+    cache = VoiceCache(cache_dir)
+    removed = cache.gc()
+    if removed:
+        print(f"  Removed {removed} orphaned clips")
+
     total = len(ALL_PHRASES)
-    downloaded = 0
     skipped = 0
+    todo = []
+    for phrase in ALL_PHRASES:
+        if cache.contains(phrase):
+            cache.pin(phrase)
+            skipped += 1
+        else:
+            todo.append(phrase)
+    print(f"  {skipped}/{total} already cached, fetching {len(todo)} "
+          f"({concurrency} at a time)")
 
-    for i, phrase in enumerate(ALL_PHRASES, 1):
-        filename = f"jarvis_{hash(phrase) & 0xFFFFFFFF:08x}.mp3"
-        filepath = os.path.join(CACHE_DIR, filename)
+    def progress(done, count, phrase, error):
+        status = "OK  " if error is None else "FAIL"
+        tail = f"  -> {error}" if error is not None else ""
+        print(f"  [{done}/{count}] {status}  {phrase[:50]}{tail}")
 
-        if os.path.exists(filepath):
-            skipped += 1
-            print(f"  [{i}/{total}] SKIP  (cached) {phrase[:50]}")
-            continue
+    started = time.perf_counter()
+    failed = await synthesize_all(
+        todo, cache, synth or edge_synthesize,
+        concurrency=concurrency, on_progress=progress,
+    )
+    elapsed = time.perf_counter() - started
 
-        try:
-            communicate = edge_tts.Communicate(
-                phrase, voice=EDGE_TTS_VOICE,
-                rate=EDGE_TTS_RATE, pitch=EDGE_TTS_PITCH,
-            )
-            await communicate.save(filepath)
-            downloaded += 1
-            print(f"  [{i}/{total}] OK    {phrase[:50]}")
-        except Exception as e:
-            print(f"  [{i}/{total}] FAIL  {phrase[:50]}  -> {e}")
+    print(f"\nDone in {elapsed:.1f}s! Downloaded: {len(todo) - len(failed)} "
+          f"| Already cached: {skipped} | Failed: {len(failed)}")
+    print(f"Voice cache folder: {cache_dir}")
 
-    print(f"\nDone! Downloaded: {downloaded} | Already cached: {skipped}")
-    print(f"Voice cache folder: {CACHE_DIR}")
+
+def build_bank(path: str = BANK_PATH):
+    """Pack every cached phrase into a single memory-mappable voice bank."""
+    cache = VoiceCache(CACHE_DIR)
+    clips = [(cache.key(p), cache.path_for(p)) for p in ALL_PHRASES if cache.contains(p)]
+    missing = len(ALL_PHRASES) - len(clips)
+    count = write_bank(path, clips)
+    size_kb = os.path.getsize(path) / 1024
+    print(f"Voice bank: {count} clips, {size_kb:.0f} KB -> {path}")
+    if missing:
+        print(f"  ({missing} phrases not cached yet — run without --bank-only first)")
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pre-synthesize Jarvis voice lines")
+    parser.add_argument("--bank-only", action="store_true",
+                        help="skip downloading, just pack voice_bank.bin")
+    parser.add_argument("--concurrency", type=int, default=TTS_SYNTH_CONCURRENCY,
+                        help="max Edge TTS requests in flight")
+    parser.add_argument("--fake-latency", type=float, default=None, metavar="SEC",
+                        help="use a local stand-in TTS with this latency "
+                             "(writes to a throwaway cache dir)")
+    args = parser.parse_args()
+
     print("=" * 55)
     print("  J.A.R.V.I.S  Voice Downloader")
     print(f"  Voice : {EDGE_TTS_VOICE}")
@@ -79,4 +88,13 @@ if __name__ == "__main__":
     print(f"  Pitch : {EDGE_TTS_PITCH}")
     print("=" * 55)
     print()
-    asyncio.run(download_all())
+    if args.fake_latency is not None:
+        asyncio.run(download_all(
+            args.concurrency,
+            synth=FakeSynthesizer(latency=args.fake_latency, jitter=args.fake_latency / 2),
+            cache_dir=tempfile.mkdtemp(prefix="jarvis_voice_"),
+        ))
+    else:
+        if not args.bank_only:
+            asyncio.run(download_all(args.concurrency))
+        build_bank()
@@ -0,0 +1,162 @@
+# ============================================================
+#  Offline evaluation of the double-clap detector
+#  Runs recorded WAVs through the detector block by block,
+#  exactly as the capture callback would, and reports
+#  precision / recall and the CPU cost per audio block.
+#
+#    python eval_clap_detector.py                  # built-in synthetic set
+#    python eval_clap_detector.py --positive recordings/double_claps \
+#                                 --negative recordings/speech_and_slams
+#
+#  The synthetic set is generated from a fixed seed, so its numbers
+#  are reproducible; --write DIR saves it as WAVs to listen to.
+# ============================================================
+
+import os
+import time
+import wave
+import argparse
+
+import numpy as np
+
+from config import SAMPLE_RATE, BLOCK_SIZE
+from audio_capture import WavSource
+from clap_detector import ClapDetector
+
+
+def _wavs(folder: str):
+    paths = sorted(
+        os.path.join(folder, n) for n in os.listdir(folder) if n.lower().endswith(".wav")
+    )
+    return [(os.path.basename(p), WavSource.load(p, SAMPLE_RATE)) for p in paths]
+
+
+def write_wav(path: str, audio, rate: int = SAMPLE_RATE):
+    with wave.open(path, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(rate)
+        w.writeframes((np.clip(audio, -1.0, 1.0) * 32767).astype(np.int16).tobytes())
+
+
+# ── Synthetic test set ─────────────────────────────────────
+def synthetic_set(seed: int = 0, rate: int = SAMPLE_RATE):
+    """``(positives, negatives)`` as lists of ``(name, audio)``.
+
+    Positives hold one double clap (gap 0.25–0.8 s, varying level) in room
+    noise; negatives are speech with plosives, door slams, single claps and
+    claps too far apart to pair.
+    """
+    rng = np.random.default_rng(seed)
+
+    def clap(amp):
+        t = np.arange(int(0.06 * rate)) / rate
+        x = rng.normal(0, 1, len(t)) * np.exp(-t / rng.uniform(0.006, 0.012))
+        x = np.diff(np.concatenate([[0.0], x]))        # brighten: claps are broadband
+        return amp * x / np.abs(x).max()
+
+    def speech(dur):
+        t = np.arange(int(dur * rate)) / rate
+        f0 = rng.uniform(100, 200) + 20 * np.sin(2 * np.pi * 3 * t)
+        phase = 2 * np.pi * np.cumsum(f0) / rate
+        x = sum(np.sin(k * phase) / k for k in range(1, 20))
+        envelope = (np.sin(2 * np.pi * 4 * t) > -0.2) * np.clip(t * 20, 0, 1)
+        x = x * envelope * 0.3
+        for b in np.arange(0.1, dur, 0.25):                 # plosive bursts
+            i, m = int(b * rate), int(0.015 * rate)
+            x[i:i + m] += rng.normal(0, 0.15, len(x[i:i + m]))
+        return x
+
+    def slam():
+        t = np.arange(int(0.5 * rate)) / rate
+        x = (np.sin(2 * np.pi * rng.uniform(50, 90) * t) * np.exp(-t / 0.12)
+             + 0.2 * rng.normal(0, 1, len(t)) * np.exp(-t / 0.05))
+        return 0.8 * x / np.abs(x).max()
+
+    def place(seconds, events):
+        y = rng.normal(0, 0.003, int(seconds * rate))
+        for t0, sig in events:
+            i = int(t0 * rate)
+            y[i:i + len(sig)] += sig[:len(y) - i]
+        return np.clip(y, -1.0, 1.0).astype(np.float32)
+
+    positives = []
+    for i in range(24):
+        t0, gap = rng.uniform(0.8, 1.5), rng.uniform(0.25, 0.8)
+        positives.append((f"double{i:02d}", place(3.5, [
+            (t0, clap(rng.uniform(0.25, 0.9))), (t0 + gap, clap(rng.uniform(0.25, 0.9)))])))
+    negatives = []
+    for i in range(6):
+        negatives.append((f"speech{i}", place(3.0, [(0.5, speech(rng.uniform(1.5, 2.2)))])))
+        negatives.append((f"slam{i}", place(3.0, [(1.0, slam()), (1.0 + rng.uniform(0.4, 0.9), slam())])))
+        negatives.append((f"single{i}", place(3.0, [(rng.uniform(0.8, 1.5), clap(rng.uniform(0.3, 0.9)))])))
+        negatives.append((f"apart{i}", place(4.5, [(0.8, clap(0.6)), (0.8 + rng.uniform(1.3, 2.5), clap(0.6))])))
+    return positives, negatives
+
+
+def run_files(clips, block: int = BLOCK_SIZE, verbose: bool = False):
+    """Detector output per ``(name, audio)`` clip; returns (double counts,
+    blocks, cpu seconds)."""
+    doubles, blocks, cpu = [], 0, 0.0
+    for name, audio in clips:
+        detector = ClapDetector(SAMPLE_RATE)
+        t0 = time.process_time()
+        for i in range(0, len(audio) - block + 1, block):
+            detector.process(audio[i:i + block])
+        cpu += time.process_time() - t0
+        blocks += len(audio) // block
+        doubles.append(detector.doubles)
+        if verbose:
+            print(f"  {name:32s} claps {detector.claps:2d}"
+                  f"  doubles {detector.doubles}")
+    return doubles, blocks, cpu
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate the double-clap detector")
+    parser.add_argument("--positive", help="folder of recordings with one double clap each")
+    parser.add_argument("--negative", help="folder of speech, slams, single claps, …")
+    parser.add_argument("--seed", type=int, default=0, help="synthetic set seed")
+    parser.add_argument("--write", metavar="DIR", help="save the synthetic set as WAVs")
+    parser.add_argument("--block", type=int, default=BLOCK_SIZE, help="samples per capture block")
+    parser.add_argument("-v", "--verbose", action="store_true", help="per-file results")
+    args = parser.parse_args()
+
+    if bool(args.positive) != bool(args.negative):
+        parser.error("--positive and --negative go together")
+    if args.positive:
+        positives, negatives = _wavs(args.positive), _wavs(args.negative)
+    else:
+        positives, negatives = synthetic_set(args.seed)
+        if args.write:
+            for label, clips in (("positive", positives), ("negative", negatives)):
+                os.makedirs(os.path.join(args.write, label), exist_ok=True)
+                for name, audio in clips:
+                    write_wav(os.path.join(args.write, label, name + ".wav"), audio)
+
+    pos, pos_blocks, pos_cpu = run_files(positives, args.block, args.verbose)
+    neg, neg_blocks, neg_cpu = run_files(negatives, args.block, args.verbose)
+    if not pos or not neg:
+        parser.error("Both folders need at least one .wav file")
+
+    tp = sum(1 for d in pos if d >= 1)
+    fp = sum(max(0, d - 1) for d in pos) + sum(neg)
+    precision = tp / (tp + fp) if tp + fp else 1.0
+    recall = tp / len(pos)
+    blocks = pos_blocks + neg_blocks
+    cpu = pos_cpu + neg_cpu
+    block_s = args.block / SAMPLE_RATE
+
+    print("=" * 55)
+    print("  Double-clap detector evaluation")
+    print("=" * 55)
+    print(f"  Positives : {len(pos):4d}   detected   : {tp}")
+    print(f"  Negatives : {len(neg):4d}   false fires: {fp}")
+    print(f"  Precision : {precision * 100:5.1f}%   Recall : {recall * 100:5.1f}%")
+    print(f"  CPU/block : {cpu / max(blocks, 1) * 1e6:6.1f} us"
+          f"  ({args.block} samples = {block_s * 1000:.1f} ms of audio)")
+    print(f"  Real-time : {cpu / max(blocks * block_s, 1e-9) * 100:.2f}% of one core")
+
+
+if __name__ == "__main__":
+    main()
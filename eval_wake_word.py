@@ -0,0 +1,88 @@
+# ============================================================
+#  Offline evaluation of the local wake-word spotter
+#  Scores recorded phrases (WAV) and reports false-accept /
+#  false-reject rates and the CPU cost per 10 ms audio frame.
+#
+#    python eval_wake_word.py --positive recordings/jarvis \
+#                             --negative recordings/other
+# ============================================================
+
+import os
+import time
+import argparse
+
+import numpy as np
+
+from audio_capture import WavSource
+from wake_word import WakeWordSpotter, MODEL_PATH, FEATURE_RATE, HOP, subsequence_dtw
+
+
+def _wavs(folder: str):
+    return sorted(
+        os.path.join(folder, n) for n in os.listdir(folder) if n.lower().endswith(".wav")
+    )
+
+
+def score_files(spotter: WakeWordSpotter, paths):
+    """Score each file; returns (scores, audio_seconds, feature_cpu, dtw_cpu)."""
+    scores = []
+    seconds = feat_cpu = dtw_cpu = 0.0
+    for path in paths:
+        audio = WavSource.load(path, FEATURE_RATE)
+        seconds += min(len(audio) / FEATURE_RATE, spotter.window)
+        t0 = time.process_time()
+        feats = spotter.features(audio, FEATURE_RATE)
+        t1 = time.process_time()
+        s = min(subsequence_dtw(t, feats) for t in spotter.templates)
+        t2 = time.process_time()
+        feat_cpu += t1 - t0
+        dtw_cpu += t2 - t1
+        scores.append(s)
+    return np.array(scores), seconds, feat_cpu, dtw_cpu
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate the local wake-word spotter")
+    parser.add_argument("--model", default=MODEL_PATH)
+    parser.add_argument("--positive", required=True, help="folder of phrases starting with the wake word")
+    parser.add_argument("--negative", required=True, help="folder of speech / noise without it")
+    parser.add_argument("--threshold", type=float, default=None,
+                        help="override the enrolled threshold")
+    parser.add_argument("--sweep", action="store_true", help="print FA/FR across thresholds")
+    args = parser.parse_args()
+
+    spotter = WakeWordSpotter.load(args.model)
+    if not spotter.enabled:
+        parser.error(f"No enrolled model at {args.model} (run wake_word.py first)")
+    threshold = args.threshold if args.threshold is not None else spotter.threshold
+
+    pos, pos_sec, pf, pd = score_files(spotter, _wavs(args.positive))
+    neg, neg_sec, nf, nd = score_files(spotter, _wavs(args.negative))
+    if not len(pos) or not len(neg):
+        parser.error("Both folders need at least one .wav file")
+
+    frames = (pos_sec + neg_sec) * FEATURE_RATE / HOP
+    feat_cpu, dtw_cpu = pf + nf, pd + nd
+    fr = float(np.mean(pos > threshold))
+    fa = float(np.mean(neg <= threshold))
+
+    print("=" * 55)
+    print("  Wake-word spotter evaluation")
+    print(f"  Templates : {len(spotter.templates)}   Threshold : {threshold:.2f}")
+    print("=" * 55)
+    print(f"  Positives : {len(pos):4d}   false reject : {fr * 100:5.1f}%")
+    print(f"  Negatives : {len(neg):4d}   false accept : {fa * 100:5.1f}%"
+          f"  ({fa * len(neg) / max(neg_sec / 3600, 1e-9):.0f} per hour of audio)")
+    print(f"  Score     : pos {np.median(pos):.2f} median | neg {np.median(neg):.2f} median")
+    print(f"  CPU/frame : {feat_cpu / frames * 1e6:6.1f} us features"
+          f" + {dtw_cpu / frames * 1e6:6.1f} us DTW  (10 ms frames)")
+    print(f"  Real-time : {(feat_cpu + dtw_cpu) / (pos_sec + neg_sec) * 100:.2f}% of one core")
+
+    if args.sweep:
+        print("\n  threshold    FR      FA")
+        for t in np.quantile(np.concatenate([pos, neg]), np.linspace(0.05, 0.95, 10)):
+            print(f"  {t:8.2f}  {np.mean(pos > t) * 100:5.1f}%  {np.mean(neg <= t) * 100:5.1f}%")
+
+
+if __name__ == "__main__":
+    main()
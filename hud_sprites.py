@@ -0,0 +1,211 @@
+# ============================================================
+#  J.A.R.V.I.S  –  HUD Sprite Atlas
+#  Pre-renders the arc reactor's moving layers with PIL (the
+#  same drawing approach as generate_icon.py) into angle- and
+#  brightness-indexed atlases, cached on disk per canvas size,
+#  so the sprite renderer only has to blit images each frame.
+# ============================================================
+
+import os
+import math
+
+from PIL import Image, ImageDraw
+
+ATLAS_VERSION = 2
+CORE_LEVELS = 12            # glow-disc brightness steps
+CORE_RADII = (10, 11, 12, 13, 14)
+CORE_SIZE = 74              # glow disc (r=35) plus its outline
+SUPERSAMPLE = 2             # draw big, downsample: anti-aliased edges
+GRID_COLS = 15
+
+BG = (10, 10, 15)
+
+
+def _rgb(hex_col: str):
+    return tuple(int(hex_col[i:i + 2], 16) for i in (1, 3, 5))
+
+
+def _ring(draw, cx, cy, r, **kw):
+    draw.ellipse([cx - r, cy - r, cx + r, cy + r], **kw)
+
+
+def _tk_arc(draw, cx, cy, r, start, extent, fill, width):
+    # Tk measures counter-clockwise, PIL clockwise
+    draw.arc([cx - r, cy - r, cx + r, cy + r], start=-(start + extent), end=-start,
+             fill=fill, width=width)
+
+
+def background_frame(size: int):
+    """The static layers: faint outer rings, tick marks and corner brackets."""
+    ss = SUPERSAMPLE
+    s = size * ss
+    img = Image.new("RGB", (s, s), BG)
+    draw = ImageDraw.Draw(img)
+    cx = cy = s // 2
+    half = size // 2
+
+    # ── Outer faint rings ──
+    for i in range(5):
+        alpha_hex = max(15, 40 - i * 8)
+        _ring(draw, cx, cy, (half - 6 - i * 4) * ss,
+              outline=(0, alpha_hex + 30, alpha_hex + 50), width=ss)
+
+    # ── Tick marks ──
+    r2 = half - 45
+    for i in range(36):
+        a = math.radians(i * 10)
+        c, sn = math.cos(a), math.sin(a)
+        col = _rgb("#00607a" if i % 3 != 0 else "#00b8e0")
+        draw.line([cx + (r2 + 2) * ss * c, cy + (r2 + 2) * ss * sn,
+                   cx + (r2 - 6) * ss * c, cy + (r2 - 6) * ss * sn], fill=col, width=ss)
+
+    # ── Corner brackets ──
+    bk, col = 20 * ss, _rgb("#004060")
+    e = s - 4 * ss
+    o = 4 * ss
+    for x0, y0, dx, dy in ((o, o, 1, 1), (e, o, -1, 1), (o, e, 1, -1), (e, e, -1, -1)):
+        draw.line([x0, y0, x0, y0 + dy * bk], fill=col, width=ss)
+        draw.line([x0, y0, x0 + dx * bk, y0], fill=col, width=ss)
+
+    return img.resize((size, size), Image.LANCZOS)
+
+
+def _layer(extent: int, colour: str):
+    """A transparent square of side ``2 × extent``, centred on the reactor.
+    The clear pixels carry the layer's colour so resampling leaves no dark fringe."""
+    s = 2 * extent * SUPERSAMPLE
+    img = Image.new("RGBA", (s, s), _rgb(colour) + (0,))
+    return img, ImageDraw.Draw(img), s // 2
+
+
+def ring1_frame(size: int, angle: float):
+    """Outer spinning ring 1 at ``angle`` (the vector canvas's ``angle``)."""
+    ss, r = SUPERSAMPLE, size // 2 - 20
+    img, draw, c = _layer(r + 2, "#00a0d0")
+    for i in range(4):
+        _tk_arc(draw, c, c, r * ss, angle + i * 90, 50, _rgb("#00a0d0"), 2 * ss)
+    return img.resize((img.width // ss,) * 2, Image.LANCZOS)
+
+
+def ring2_frame(size: int, angle: float):
+    """Outer spinning ring 2 at ``angle`` (the vector canvas's ``angle2``)."""
+    ss, r = SUPERSAMPLE, size // 2 - 30
+    img, draw, c = _layer(r + 2, "#006090")
+    for i in range(6):
+        _tk_arc(draw, c, c, r * ss, -angle + i * 60, 25, _rgb("#006090"), ss)
+    return img.resize((img.width // ss,) * 2, Image.LANCZOS)
+
+
+def triangles_frame(size: int, angle: float):
+    """The inner triangles at ``angle`` (the vector canvas's ``angle3``)."""
+    ss, r3 = SUPERSAMPLE, size // 2 - 70
+    img, draw, c = _layer(r3 + 9, "#00c8ff")
+    r3, tri = r3 * ss, 8 * ss
+    for i in range(3):
+        ang = math.radians(angle + i * 120)
+        px, py = c + r3 * math.cos(ang), c + r3 * math.sin(ang)
+        draw.polygon([
+            (px + tri * math.cos(ang), py + tri * math.sin(ang)),
+            (px + tri * math.cos(ang + 2.3), py + tri * math.sin(ang + 2.3)),
+            (px + tri * math.cos(ang - 2.3), py + tri * math.sin(ang - 2.3)),
+        ], fill=_rgb("#00c8ff"))
+    return img.resize((img.width // ss,) * 2, Image.LANCZOS)
+
+
+# Rotating layers in canvas stacking order: (name, frame renderer, symmetry in degrees)
+LAYERS = [
+    ("ring1", ring1_frame, 90),
+    ("ring2", ring2_frame, 60),
+    ("triangles", triangles_frame, 120),
+]
+
+
+def layer_frames(symmetry: float, step: float) -> int:
+    """How many frames cover one ``symmetry`` turn at ``step`` degrees each."""
+    return max(1, round(symmetry / step))
+
+
+def core_frame(level: int, radius: int):
+    """Glow disc, inner ring and pulsing core at one brightness/radius."""
+    ss = SUPERSAMPLE
+    s = CORE_SIZE * ss
+    img = Image.new("RGBA", (s, s), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    c = s // 2
+    brightness = int(40 + (230 - 40) * level / (CORE_LEVELS - 1))
+    fill = (0, min(brightness, 255), min(brightness + 30, 255))
+    _ring(draw, c, c, 35 * ss, fill=fill, outline=_rgb("#00a0c0"), width=ss)
+    _ring(draw, c, c, 25 * ss, outline=_rgb("#00e0ff"), width=2 * ss)
+    _ring(draw, c, c, radius * ss, fill=_rgb("#60f0ff"))
+    _ring(draw, c, c, 4 * ss, fill=(255, 255, 255))
+    return img.resize((CORE_SIZE, CORE_SIZE), Image.LANCZOS)
+
+
+def core_index(brightness: float, radius: int):
+    """Atlas slot for a glow brightness (40–230) and core radius."""
+    level = round((brightness - 40) / (230 - 40) * (CORE_LEVELS - 1))
+    level = min(max(level, 0), CORE_LEVELS - 1)
+    r = min(max(radius, CORE_RADII[0]), CORE_RADII[-1])
+    return level * len(CORE_RADII) + (r - CORE_RADII[0])
+
+
+# ── Atlas packing / disk cache ─────────────────────────────
+def _pack(frames, cell: int):
+    rows = -(-len(frames) // GRID_COLS)
+    sheet = Image.new(frames[0].mode, (GRID_COLS * cell, rows * cell))
+    for i, f in enumerate(frames):
+        sheet.paste(f, ((i % GRID_COLS) * cell, (i // GRID_COLS) * cell))
+    return sheet
+
+
+def _unpack(sheet, cell: int, count: int):
+    return [
+        sheet.crop(((i % GRID_COLS) * cell, (i // GRID_COLS) * cell,
+                    (i % GRID_COLS + 1) * cell, (i // GRID_COLS + 1) * cell))
+        for i in range(count)
+    ]
+
+
+def _cached(path: str, mode: str, count: int, render):
+    """``count`` square frames from the sheet at ``path``, or from
+    ``render()`` (then saved there) if it's missing or unreadable."""
+    try:
+        with Image.open(path) as sheet:
+            return _unpack(sheet.convert(mode), sheet.width // GRID_COLS, count)
+    except (OSError, ValueError):
+        pass
+    frames = render()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path + ".tmp"
+        _pack(frames, frames[0].width).save(tmp, "PNG")
+        os.replace(tmp, path)
+    except OSError:
+        pass                    # read-only install: just render again next time
+    return frames
+
+
+def load_atlas(size: int, cache_dir: str, steps):
+    """``(background, layers, core_frames)`` for a canvas size, rendered once
+    and then read back from ``cache_dir``.
+
+    ``steps`` are the degrees per frame of each of ``LAYERS``; ``layers[i]``
+    holds that layer's frames over one symmetry turn, about a step apart.
+    """
+    def path(name):
+        return os.path.join(cache_dir, f"reactor_{name}_v{ATLAS_VERSION}.png")
+
+    background = _cached(path(f"{size}_bg"), "RGB", 1,
+                         lambda: [background_frame(size)])[0]
+    layers = []
+    for (name, render, symmetry), step in zip(LAYERS, steps):
+        count = layer_frames(symmetry, step)
+        layers.append(_cached(
+            path(f"{size}_{name}_{count}"), "RGBA", count,
+            lambda: [render(size, k * symmetry / count) for k in range(count)],
+        ))
+    n_core = CORE_LEVELS * len(CORE_RADII)
+    core = _cached(path("core"), "RGBA", n_core,
+                   lambda: [core_frame(level, r) for level in range(CORE_LEVELS)
+                            for r in CORE_RADII])
+    return background, layers, core
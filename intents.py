@@ -0,0 +1,221 @@
+# ============================================================
+#  J.A.R.V.I.S  –  Command Registry
+#  Skills register patterns like "play {song}"; they are
+#  compiled once into a token trie, and each transcript is
+#  matched in a single pass with typo-tolerant token lookup
+#  (a SymSpell-style deletion index), so routing cost doesn't
+#  grow with the number of commands.
+# ============================================================
+
+import re
+
+FILLER = frozenset(
+    "a an the please can could would will you me my for to just now hey ok okay uh um".split()
+)
+FUZZY_MIN_LEN = 4       # shorter words must match exactly
+EDIT_PENALTY = 0.15     # per corrected token
+SKIP_PENALTY = 0.02     # per filler word skipped inside a pattern
+LEFTOVER_PENALTY = 0.1  # per unexplained word after the match
+RANK_DECAY = 0.9        # recogniser belief in each successive alternative
+
+_TOKEN = re.compile(r"[a-z0-9']+")
+
+
+def tokenize(text: str):
+    return _TOKEN.findall(text.lower())
+
+
+def edit_distance(a: str, b: str) -> int:
+    """Optimal-string-alignment distance (Levenshtein + adjacent swaps)."""
+    prev2, prev = None, list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        cur = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                cur[j] = min(cur[j], prev2[j - 2] + 1)
+        prev2, prev = prev, cur
+    return prev[-1]
+
+
+def _deletes(word: str):
+    return {word[:i] + word[i + 1:] for i in range(len(word))}
+
+
+class Intent:
+    """A matched command.  ``name`` is None when the phrase was only
+    addressed to Jarvis (wake word, no recognisable command).
+    """
+
+    def __init__(self, name, slots, score: float, addressed: bool, text: str = "",
+                 handler=None):
+        self.name = name
+        self.slots = slots
+        self.score = score
+        self.addressed = addressed
+        self.text = text
+        self.handler = handler
+
+    def __repr__(self):
+        return f"Intent({self.name!r}, {self.slots!r}, score={self.score:.2f})"
+
+
+class _Node:
+    __slots__ = ("children", "slot", "intent")
+
+    def __init__(self):
+        self.children = {}
+        self.slot = None        # (slot name, _Node)
+        self.intent = None      # intent name if a pattern ends here
+
+
+class CommandRegistry:
+    """Declarative command patterns compiled into one matcher.
+
+    Pattern words are matched case-insensitively and tolerate one typo
+    (for words of ``FUZZY_MIN_LEN`` letters or more); ``{name}`` captures
+    one or more words of the original transcript.
+    """
+
+    def __init__(self, wake_word: str = None, fallback=None):
+        self.wake_word = wake_word
+        self.fallback = fallback    # handler for the wake word without a command
+        self._patterns = []     # (intent name, pattern)
+        self._handlers = {}
+        self._root = None
+        self._vocab = set()
+        self._index = {}        # deletion -> vocabulary words
+        self._lookups = {}      # token -> (canonical word | None, edit distance)
+
+    def register(self, name: str, patterns, handler=None):
+        """Add an intent with one or more patterns (a string or a list)."""
+        if isinstance(patterns, str):
+            patterns = [patterns]
+        for pattern in patterns:
+            self._patterns.append((name, pattern))
+        if handler is not None:
+            self._handlers[name] = handler
+        self._root = None       # recompiled on next match
+        return self
+
+    def __len__(self):
+        return len(self._patterns)
+
+    # ── Compilation ────────────────────────────────────────
+    def compile(self):
+        root = _Node()
+        vocab = set()
+        for name, pattern in self._patterns:
+            node = root
+            for part in pattern.lower().split():
+                if part.startswith("{") and part.endswith("}"):
+                    if node.slot is None:
+                        node.slot = (part[1:-1], _Node())
+                    node = node.slot[1]
+                else:
+                    vocab.add(part)
+                    node = node.children.setdefault(part, _Node())
+            node.intent = name
+        if self.wake_word:
+            vocab.add(self.wake_word)
+        index = {}
+        for word in vocab:
+            if len(word) >= FUZZY_MIN_LEN:
+                for d in _deletes(word):
+                    index.setdefault(d, set()).add(word)
+        self._root, self._vocab, self._index, self._lookups = root, vocab, index, {}
+
+    def _canonical(self, token: str):
+        """Vocabulary word ``token`` most likely is, with its edit distance."""
+        hit = self._lookups.get(token)
+        if hit is not None:
+            return hit
+        if token in self._vocab:
+            hit = (token, 0)
+        elif len(token) < FUZZY_MIN_LEN:
+            hit = (None, 0)
+        else:
+            candidates = set(self._index.get(token, ()))     # one letter extra
+            candidates.update(w for w in ({token} | _deletes(token)) if w in self._vocab)
+            for d in _deletes(token):
+                candidates.update(self._index.get(d, ()))   # substitutions/swaps
+            best = min(candidates, key=lambda w: (edit_distance(token, w), w), default=None)
+            dist = edit_distance(token, best) if best else 0
+            hit = (best, dist) if best and dist <= 1 else (None, 0)
+        if len(self._lookups) < 4096:
+            self._lookups[token] = hit
+        return hit
+
+    # ── Matching ───────────────────────────────────────────
+    def match(self, text: str):
+        """Best ``Intent`` for ``text``, or None if it is neither addressed to
+        Jarvis nor a known command.
+        """
+        if self._root is None:
+            self.compile()
+        tokens = tokenize(text)
+        canon = [self._canonical(t) for t in tokens]
+        addressed = bool(self.wake_word) and any(c == self.wake_word for c, _ in canon)
+
+        best = None
+        for i, (c, _) in enumerate(canon):
+            if c in self._root.children:
+                for found in self._walk(self._root, tokens, canon, i, {}, 0.0):
+                    if best is None or found[0] > best[0]:
+                        best = found
+        if best is None:
+            return Intent(None, {}, 1.0, True, text, self.fallback) if addressed else None
+        score, name, slots = best
+        return Intent(name, slots, score, addressed, text, self._handlers.get(name))
+
+    def match_nbest(self, alternatives):
+        """Best ``Intent`` across recogniser alternatives.
+
+        ``alternatives`` is ``[(transcript, confidence or None), …]`` best
+        first.  Each is scored as grammar fit × recogniser belief, and a
+        hypothesis carrying a command beats one that is only the wake word.
+        The phrase counts as addressed if any alternative heard the wake word.
+        """
+        best, best_key, addressed = None, None, False
+        top = next((c for _, c in alternatives if c is not None), None)
+        for rank, (text, confidence) in enumerate(alternatives):
+            intent = self.match(text)
+            if intent is None:
+                continue
+            addressed = addressed or intent.addressed
+            belief = confidence if confidence is not None else (top or 1.0) * RANK_DECAY ** rank
+            intent.score *= belief
+            key = (intent.name is not None, intent.score)
+            if best_key is None or key > best_key:
+                best, best_key = intent, key
+        if best is not None:
+            best.addressed = addressed
+        return best
+
+    def _walk(self, node, tokens, canon, i, slots, penalty):
+        """Yield ``(score, intent, slots)`` for every pattern matched from ``i``."""
+        if node.intent is not None:
+            leftover = sum(1 for t, (c, _) in zip(tokens[i:], canon[i:])
+                           if t not in FILLER and c != self.wake_word)
+            yield 1.0 - penalty - LEFTOVER_PENALTY * leftover, node.intent, slots
+        if i >= len(tokens):
+            return
+        word, dist = canon[i]
+        child = node.children.get(word)
+        if child is not None:
+            yield from self._walk(child, tokens, canon, i + 1, slots, penalty + EDIT_PENALTY * dist)
+        if node.slot is not None:
+            name, after = node.slot
+            for j in range(i + 1, len(tokens) + 1):
+                # A slot stops where the rest of the pattern picks up again
+                if j < len(tokens) and canon[j][0] not in after.children and after.intent is None:
+                    continue
+                value = tokens[i:j]
+                while value and value[-1] in FILLER:
+                    value = value[:-1]
+                if value:
+                    yield from self._walk(after, tokens, canon, j,
+                                          {**slots, name: " ".join(value)}, penalty)
+        if tokens[i] in FILLER and node is not self._root:
+            yield from self._walk(node, tokens, canon, i + 1, slots, penalty + SKIP_PENALTY)
@@ -0,0 +1,687 @@
+# ============================================================
+#  J.A.R.V.I.S  –  Engine
+#  Voice, clap and speech engine shared by the GUI and the
+#  headless daemon.  Nothing here imports Tk, PIL or pystray.
+# ============================================================
+
+import os
+import sys
+import time
+import subprocess
+import threading
+import random
+import json
+import base64
+import webbrowser
+from urllib.parse import quote, urlencode
+from urllib.request import Request, urlopen
+
+import asyncio
+
+import pygame
+import speech_recognition as sr
+
+from config import (
+    VSCODE_PATH,
+    SPOTIFY_PATH,
+    WAKE_WORD,
+    SPOTIFY_CLIENT_ID,
+    SPOTIFY_CLIENT_SECRET,
+    TTS_STREAMING,
+    CAPTURE_PREROLL,
+    AUDIO_INPUT_WAV,
+    RECOGNIZER_TIMEOUT,
+    FOLLOWUP_WINDOW,
+    INTENT_MIN_SCORE,
+    CLAP_ENABLED,
+    TRACE_FILE,
+    WAKE_SPOTTER_MODEL,
+    VAD_CALIBRATION,
+    CONTROL_API_ENABLED,
+    CONTROL_API_TOKEN_FILE,
+)
+from paths import APP_DIR, DATA_DIR
+from phrases import (
+    GREETINGS, HOME_OPENERS, HOME_READY, PLAY_RESPONSES, HOME_APPS,
+    LAUNCH_FAILED, PLAY_PROMPT, NOT_CAUGHT, canned_phrases,
+)
+from voice_cache import VoiceCache, ClipCache, VoiceBank
+from voice_synth import (
+    edge_synthesize, edge_stream, synthesize_all, synthesize_to_cache, stream_to_cache,
+)
+from audio_capture import AudioCapture, WavSource, LevelRing
+from wake_word import WakeWordSpotter
+from vad import UtteranceSegmenter, VoiceActivityDetector
+from recognition import RecognitionPipeline
+from intents import CommandRegistry, Intent
+from clap_detector import ClapDetector, SUB_BLOCK
+from spectrum import SpectrumAnalyzer
+from tracing import Tracer, format_report
+from control_api import ControlServer
+import startup
+from speech import (
+    SpeechScheduler, StreamingPlayer, play_sound, play_music,
+    PRIORITY_URGENT, PRIORITY_NORMAL, PRIORITY_LOW,
+)
+
+def launch(target: str):
+    """Open an app path or a URI (spotify:…) the way Explorer would."""
+    if os.path.exists(target):
+        subprocess.Popen([target], shell=False)
+    else:
+        os.startfile(target)
+
+
+class TypedPhrase:
+    """A command that arrived as text (control API): stands in for a
+    ``vad.Segment`` in the recognition pipeline's dispatch."""
+
+    def __init__(self, text: str, now: float, trace, on_done=None):
+        self.text = text
+        self.start = self.speech_end = now     # stream time it arrived
+        self.wake = False
+        self.trace = trace
+        self.on_done = on_done or (lambda intent, error: None)
+
+
+# ====================================================================
+#  JARVIS CORE  (engine that both GUI and headless mode share)
+# ====================================================================
+class JarvisCore:
+    """Voice + clap engine running on background threads."""
+
+    def __init__(self, on_log=None, on_status=None, on_wake=None,
+                 synthesizer=None, streamer=None, audio_source=None,
+                 recognizer=None, launcher=None, track_search=None, data_dir=None,
+                 control_api: bool = CONTROL_API_ENABLED):
+        self._on_log = on_log or (lambda *a: None)
+        self._on_status = on_status or (lambda *a: None)
+        self._on_wake = on_wake or (lambda: None)
+        # async (text, path) -> None; swap in a stand-in for offline testing
+        self._synth = synthesizer or edge_synthesize
+        # async iterator of MP3 chunks, used to speak cache misses while they stream
+        self._stream = streamer or edge_stream
+        # (target) -> None: opens an app path or URI
+        self._launch = launcher or launch
+        # (query) -> (uri, name, artist); None means the Spotify Web API
+        self._track_search = track_search
+        # Caches, calibration and enrolment live here (a scratch dir for replays)
+        self._data_dir = data_dir or DATA_DIR
+
+        self.running = False
+        self._speech = SpeechScheduler()
+        # Per-stage latency of every voice interaction (see tracing.STAGES)
+        self.tracer = Tracer()
+        self._tts_lock = threading.Lock()
+
+        # Pygame mixer for audio playback.  Opening the output device can
+        # take a while on some drivers and only playback needs it, so it
+        # opens in the background while the rest of the engine starts.
+        self._mixer_ready = threading.Event()
+        threading.Thread(target=self._init_mixer, daemon=True).start()
+
+        # Permanent voice cache (pre-downloaded, never re-fetched)
+        self._tts_cache_dir = os.path.join(self._data_dir, "voice_cache")
+        self._voice_cache = VoiceCache(self._tts_cache_dir)
+        # Packed voice bank shipped next to the exe (or the script)
+        bank_dirs = [self._data_dir]
+        if data_dir is None and getattr(sys, "frozen", False):
+            bank_dirs.append(APP_DIR)
+        with startup.step("open voice bank"):
+            self._voice_bank = VoiceBank.open_first(*bank_dirs)
+        # Decoded clips kept in RAM so playback skips file I/O + MP3 decode
+        self._clip_cache = ClipCache(pygame.mixer.Sound, self._sound_bytes)
+
+        # One capture stream shared by the visualiser and the voice listener
+        if audio_source is None and AUDIO_INPUT_WAV:
+            audio_source = WavSource(AUDIO_INPUT_WAV, loop=True)
+        self._capture = AudioCapture(audio_source)
+        # Per-block levels for the HUD, read at its own frame rate
+        self.levels = LevelRing()
+        self._capture.add_listener(self.levels.write)
+        # Spectrum for the waveform bar; runs only while that view is shown
+        self.spectrum = SpectrumAnalyzer(self._capture)
+
+        # Double clap → open home.  Onset detection reads the ring on its own
+        # thread (see _clap_loop): its FFTs have no place in the audio callback
+        self._clap = ClapDetector(self._capture.rate, on_double_clap=self._on_double_clap)
+
+        # Speech recogniser (endpointing is done locally by the VAD)
+        self._recognizer = recognizer or sr.Recognizer()
+        self._recognizer.operation_timeout = RECOGNIZER_TIMEOUT
+        # Capture keeps going while earlier phrases are still being recognised
+        self._pipeline = RecognitionPipeline(
+            self._recognize, self._dispatch,
+            on_error=lambda seg, e: self._on_log("error", f"Voice error: {e}"),
+            on_drop=lambda seg: self._on_log("system", "Recogniser busy — dropped a phrase"),
+        )
+
+        # Local wake-word gate in front of the cloud recogniser
+        with startup.step("load wake-word model"):
+            self._spotter = WakeWordSpotter.load(os.path.join(self._data_dir, WAKE_SPOTTER_MODEL))
+        self._wake_until = 0.0        # stream time until which phrases skip the gate
+        self._followup_until = 0.0    # stream time until which "Jarvis" is implied
+        self._commands = self._register_commands()
+
+        # Spotify API token cache
+        self._spotify_token = None
+        self._spotify_token_expiry = 0.0
+
+        # Local JSON-lines socket for scripts (text commands, speech, status)
+        self._control = None
+        if control_api:
+            self._control = ControlServer(
+                self, token_path=os.path.join(self._data_dir, CONTROL_API_TOKEN_FILE))
+
+    def _init_mixer(self):
+        with startup.step("open audio output"):
+            try:
+                pygame.mixer.init()
+            except pygame.error as e:
+                self._on_log("error", f"Audio output unavailable: {e}")
+        self._mixer_ready.set()
+
+    # ── TTS via Edge Neural Voice ───────────────────────────
+    def _tts_worker(self):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self._mixer_ready.wait()
+        while self.running:
+            utt = self._speech.next(timeout=0.5)
+            if utt is None:
+                continue
+            if utt.trace is not None:
+                utt.trace.since("tts_queue", "queued")
+                utt.trace.stamp("picked")
+            self._on_log("jarvis", utt.text)
+            try:
+                loop.run_until_complete(self._edge_speak(utt.text, utt.stopped, utt.trace))
+            except Exception as e:
+                self._on_log("error", f"TTS error: {e}")
+            finally:
+                self._speech.finish(utt)
+        loop.close()
+
+    async def _edge_speak(self, text: str, stopped: threading.Event, trace=None):
+        """Generate speech with Edge TTS and play it (until ``stopped`` is set)."""
+        key = self._voice_cache.key(text)
+        sound = self._clip_cache.get(key)
+        if sound is not None:
+            self._voice_cache.touch(text)
+        elif self._in_bank(key):
+            audio_file = self._voice_bank.open(key)
+            sound = self._clip_cache.put(key, audio_file)
+            audio_file.seek(0)
+        else:
+            audio_file = self._voice_cache.lookup(text)
+            # Generate audio if not cached
+            if audio_file is None and TTS_STREAMING:
+                if await self._stream_speak(text, stopped, trace):
+                    return
+            if audio_file is None:
+                audio_file = await synthesize_to_cache(
+                    text, self._voice_cache, self._synth, retries=1
+                )
+            sound = self._clip_cache.put(key, audio_file)
+        # Play audio
+        if stopped.is_set():
+            return
+        with self._tts_lock:
+            if trace is not None:
+                trace.first_audio()
+            if sound is not None:
+                await play_sound(sound, stopped)
+            else:
+                # Decoder refused the clip as a Sound — stream it instead
+                await play_music(audio_file, stopped)
+
+    async def _stream_speak(self, text: str, stopped: threading.Event, trace=None) -> bool:
+        """Speak a cache miss while it streams in, persisting it as it goes.
+
+        Returns False if the stream failed before any audio was played, so the
+        caller can fall back to the regular synthesize-then-play path.
+        """
+        player = StreamingPlayer(on_start=trace.first_audio if trace is not None else None)
+
+        def on_chunk(chunk):
+            # Barge-in: cut off what is already playing, not just what's to come
+            # (the rest of the stream is still saved to the cache)
+            if stopped.is_set():
+                player.stop()
+            else:
+                player.feed(chunk)
+
+        with self._tts_lock:
+            try:
+                path = await stream_to_cache(
+                    text, self._voice_cache, self._stream, on_chunk=on_chunk,
+                )
+                await player.finish(stopped)
+            except Exception:
+                if not player.started:
+                    return False
+                player.stop()
+                raise
+        # Decode for next time, off the latency-critical path
+        self._clip_cache.put(self._voice_cache.key(text), path)
+        return True
+
+    def _in_bank(self, key: str) -> bool:
+        return self._voice_bank is not None and key in self._voice_bank
+
+    @staticmethod
+    def _sound_bytes(sound) -> int:
+        """Decoded PCM size of a pygame Sound."""
+        freq, fmt, channels = pygame.mixer.get_init()
+        return int(sound.get_length() * freq * channels * (abs(fmt) // 8))
+
+    def cache_stats(self) -> dict:
+        """Disk and in-memory voice cache counters (for tuning the budgets)."""
+        return {"disk": self._voice_cache.stats(), "memory": self._clip_cache.stats()}
+
+    def speak(self, text: str, priority: int = PRIORITY_NORMAL):
+        """Queue a line of speech. Returns a handle that can be cancelled."""
+        # The first reply to a voice command carries its trace to the TTS worker
+        return self._speech.submit(text, priority, self.tracer.claim_reply())
+
+    def barge_in(self):
+        """Cut off current speech and drop anything stale still queued."""
+        self._speech.barge_in()
+
+    # ── App launcher ────────────────────────────────────
+    def open_home(self):
+        self.speak(random.choice(HOME_OPENERS))
+        for name, path in zip(HOME_APPS, [VSCODE_PATH, SPOTIFY_PATH]):
+            try:
+                self._launch(path)
+                self._on_log("system", f"Launched {name}")
+            except Exception:
+                self.speak(LAUNCH_FAILED.format(name=name))
+        self.speak(random.choice(HOME_READY), PRIORITY_LOW)
+
+    # ── Spotify play ────────────────────────────────────
+    def _get_spotify_token(self):
+        """Get a Spotify API access token (client-credentials flow)."""
+        now = time.time()
+        if self._spotify_token and now < self._spotify_token_expiry:
+            return self._spotify_token
+        auth = base64.b64encode(
+            f"{SPOTIFY_CLIENT_ID}:{SPOTIFY_CLIENT_SECRET}".encode()
+        ).decode()
+        data = urlencode({"grant_type": "client_credentials"}).encode()
+        req = Request(
+            "https://accounts.spotify.com/api/token",
+            data=data,
+            headers={"Authorization": f"Basic {auth}"},
+        )
+        with urlopen(req, timeout=10) as resp:
+            result = json.loads(resp.read())
+        self._spotify_token = result["access_token"]
+        self._spotify_token_expiry = now + result.get("expires_in", 3600) - 60
+        return self._spotify_token
+
+    def _spotify_search_track(self, query: str):
+        """Search Spotify for a track. Returns (uri, name, artist) or Nones."""
+        with self.tracer.span("spotify"):
+            token = self._get_spotify_token()
+            params = urlencode({"q": query, "type": "track", "limit": 1})
+            req = Request(
+                f"https://api.spotify.com/v1/search?{params}",
+                headers={"Authorization": f"Bearer {token}"},
+            )
+            with urlopen(req, timeout=10) as resp:
+                data = json.loads(resp.read())
+        tracks = data.get("tracks", {}).get("items", [])
+        if tracks:
+            t = tracks[0]
+            return t["uri"], t["name"], t["artists"][0]["name"]
+        return None, None, None
+
+    def play_song(self, song_name: str):
+        """Search Spotify for a song and play it."""
+        if self._track_search is None and (not SPOTIFY_CLIENT_ID or not SPOTIFY_CLIENT_SECRET):
+            self.speak("I need Spotify API credentials to play music, sir. Check config.",
+                       PRIORITY_URGENT)
+            self._on_log("error", "Set SPOTIFY_CLIENT_ID & SECRET in config.py")
+            return
+        try:
+            search = self._track_search or self._spotify_search_track
+            uri, track_name, artist = search(song_name)
+            if uri:
+                self.speak(random.choice(PLAY_RESPONSES).format(
+                    song=f"{track_name} by {artist}"
+                ), PRIORITY_URGENT)
+                self._launch(uri)  # opens spotify:track:XXX → auto-plays
+                self._on_log("system", f"Playing: {track_name} by {artist}")
+            else:
+                self.speak(f"I couldn't find {song_name} on Spotify, sir.", PRIORITY_URGENT)
+        except Exception as e:
+            self._on_log("error", f"Spotify API error: {e}")
+            # Fallback: open search in Spotify
+            try:
+                self._launch(f"spotify:search:{quote(song_name)}")
+            except Exception:
+                webbrowser.open(f"https://open.spotify.com/search/{quote(song_name)}")
+
+    # ── Voice loop ──────────────────────────────────────────
+    def _voice_loop(self):
+        self._on_log("system", "Voice listener active")
+        if self._spotter.enabled:
+            self._on_log("system", "Local wake-word spotter enrolled")
+        self._on_status("voice", True)
+        # Same shared stream the whole time, so nothing is lost between phrases
+        segmenter = UtteranceSegmenter(
+            self._capture.reader(preroll=CAPTURE_PREROLL), self._capture.rate,
+            vad=VoiceActivityDetector.load(os.path.join(self._data_dir, VAD_CALIBRATION)),
+        )
+        with startup.step("calibrate noise floor"):
+            calibrated = segmenter.calibrate()
+        if calibrated:
+            self._on_log("system", f"Ambient noise floor {segmenter.vad.noise_db:.0f} dBFS")
+        self._pipeline.start()
+        startup.mark("wake word listening")
+        # Typed commands share the pipeline's dispatch, so open up only now
+        self._start_control()
+        while self.running:
+            try:
+                segment = segmenter.next_segment(timeout=1.0)
+                if segment is None:
+                    continue
+
+                # Only send audio off the machine once the wake word is heard
+                # locally — or when it follows closely on one that was
+                # (not enrolled: every phrase goes to the recogniser)
+                if self._spotter.enabled:
+                    heard, _ = self._spotter.detect(segment.audio, segment.rate)
+                    if heard:
+                        self._wake_until = segment.speech_end + FOLLOWUP_WINDOW
+                    elif segment.start >= self._wake_until:
+                        continue
+                    segment.wake = heard
+                self._on_log(
+                    "system",
+                    f"Heard {segment.duration:.1f}s phrase, "
+                    f"endpoint +{segment.endpoint_delay * 1000:.0f} ms",
+                )
+                segment.trace = self.tracer.begin(ago=segment.endpoint_delay)
+                self.tracer.record("endpoint", int(segment.endpoint_delay * 1e9))
+                segment.trace.stamp("submitted")
+                # Under load, follow-ups and unspotted phrases are shed before
+                # one the spotter actually heard "Jarvis" in
+                self._pipeline.submit(segment, is_wake=segment.wake)
+            except Exception as e:
+                self._on_log("error", f"Voice error: {e}")
+                time.sleep(2)
+        self._pipeline.stop()
+        segmenter.vad.save()
+
+    def _recognize(self, segment):
+        """Cloud recognition of one phrase (runs on a pipeline worker).
+
+        Returns every alternative as ``[(transcript, confidence or None), …]``
+        so a mis-heard wake word or command can be recovered from the n-best list.
+        """
+        if segment.trace is None:
+            segment.trace = self.tracer.begin()
+        trace = segment.trace
+        trace.since("queue", "submitted")
+        audio = sr.AudioData(segment.pcm16(), segment.rate, 2)
+        try:
+            with trace.span("recognize"):
+                result = self._recognizer.recognize_google(audio, show_all=True)
+        except sr.RequestError as e:
+            self._on_log("error", f"Recogniser unavailable: {e}")
+            return None
+        finally:
+            trace.stamp("recognized")
+        if not isinstance(result, dict):
+            return None         # nothing intelligible
+        alternatives = [
+            (alt["transcript"].lower(), alt.get("confidence"))
+            for alt in result.get("alternative", []) if alt.get("transcript")
+        ]
+        return alternatives or None
+
+    def _dispatch(self, segment, alternatives):
+        """Pipeline dispatch: typed commands also report back when done."""
+        if not isinstance(segment, TypedPhrase):
+            self._handle_phrase(segment, alternatives)
+            return
+        try:
+            intent = self._handle_phrase(segment, alternatives)
+        except Exception as e:
+            segment.on_done(None, e)
+            raise
+        segment.on_done(intent, None)
+
+    def _handle_phrase(self, segment, alternatives):
+        """Act on recognised alternatives; called in capture order.
+        Returns the intent if its handler ran, else None."""
+        trace = segment.trace
+        trace.since("reorder", "recognized")
+        self._on_log("user", alternatives[0][0])
+        with trace.span("intent"):
+            intent = self._commands.match_nbest(alternatives)
+        if segment.wake:
+            # The local spotter already heard "Jarvis": addressed even if the
+            # recogniser's transcript lost the wake word
+            if intent is None:
+                intent = Intent(None, {}, 1.0, True, alternatives[0][0], self._commands.fallback)
+            intent.addressed = True
+        if intent is None:
+            return
+        if intent.addressed:
+            # New request: don't make the user sit through stale chatter
+            self.barge_in()
+        elif segment.start >= self._followup_until:
+            return
+        if intent.text != alternatives[0][0]:
+            self._on_log("system", f"Understood as \"{intent.text}\"")
+        if intent.name is not None and intent.score < INTENT_MIN_SCORE:
+            # Ask again straight away rather than leaving the user waiting.
+            # A bare "Jarvis" is exempt: however unsure the transcript, the
+            # greeting is the only thing it can mean
+            self._on_log("system", f"Low confidence ({intent.score:.2f}) — asking again")
+            self._followup_until = segment.speech_end + FOLLOWUP_WINDOW
+            with self.tracer.activate(trace):
+                self.speak(NOT_CAUGHT, PRIORITY_URGENT)
+            return
+        # "Jarvis." … "play Thunderstruck" — a command may come as its own phrase
+        if intent.name is None or intent.name == "play_prompt":
+            self._followup_until = segment.speech_end + FOLLOWUP_WINDOW
+        else:
+            self._followup_until = 0.0
+        self._on_wake()
+        with self.tracer.activate(trace), trace.span("handler"):
+            intent.handler(**intent.slots)
+        return intent
+
+    # ── Typed commands (control API) ────────────────────────
+    def submit_text(self, text: str, on_done=None) -> bool:
+        """Handle ``text`` as if it had just been heard.
+
+        It joins the spoken phrases' in-order dispatch, so it never overtakes
+        one said before it, and goes through the same intent matching and
+        handlers.  ``on_done(intent or None, error or None)`` is called on the
+        dispatcher thread afterwards.  False if not listening yet.
+        """
+        if not self._pipeline.running:
+            return False
+        now = self._capture.ring.written / self._capture.rate
+        phrase = TypedPhrase(text, now, self.tracer.begin(), on_done)
+        phrase.trace.stamp("recognized")
+        # Typed text is exactly what was meant: full recogniser confidence
+        self._pipeline.inject(phrase, [(text.lower().strip(), 1.0)])
+        return True
+
+    def status(self, latency: bool = False) -> dict:
+        """Engine state for the control API (safe from any thread)."""
+        status = {
+            "running": self.running,
+            "listening": self._pipeline.running,
+            "recognizer_backlog": self._pipeline.backlog(),
+            "dropped": self._pipeline.dropped,
+            "timed_out": self._pipeline.timed_out,
+            "speech_pending": self._speech.pending(),
+            "speaking": self._speech.speaking(),
+            "interactions": self.tracer.traces,
+            "audio": self._capture.stats(),
+        }
+        if latency:
+            status["latency"] = self.tracer.summary()
+        return status
+
+    # ── Commands ────────────────────────────────────────────
+    def _register_commands(self):
+        """Every voice command Jarvis understands (patterns → handlers)."""
+        commands = CommandRegistry(WAKE_WORD, fallback=self._greet)
+        commands.register("open_home", ["open home", "open up home", "home mode"], self.open_home)
+        commands.register("play", ["play {song_name}", "put on {song_name}"],
+                          self.play_song)
+        commands.register("play_prompt", "play", lambda: self.speak(
+            PLAY_PROMPT, PRIORITY_URGENT))
+        commands.compile()
+        return commands
+
+    def _greet(self):
+        self.speak(random.choice(GREETINGS), PRIORITY_URGENT)
+
+    # ── Clap trigger ────────────────────────────────────────
+    def _clap_loop(self):
+        reader = self._capture.reader()
+        while self.running:
+            # Whole sub-blocks only, so the detector never has to carry a remainder
+            frames = reader.read_frames(SUB_BLOCK, 64, timeout=0.5)
+            if frames is not None:
+                self._clap.process(frames.ravel())
+
+    def _on_double_clap(self, t: float):
+        # Called on the clap thread — don't hold up the analysis
+        if self.running:
+            threading.Thread(target=self._clap_home, daemon=True).start()
+
+    def _clap_home(self):
+        self._on_log("system", "Double clap detected")
+        self.barge_in()
+        self._on_wake()
+        self.open_home()
+
+    # ── Audio monitor (feeds UI waveform & reactor) ───────
+    def _start_capture(self):
+        try:
+            self._capture.start()
+        except Exception as e:
+            self._on_log("error", f"Audio monitor error: {e}")
+            self._on_status("audio", False)
+            return
+        self._on_log("system", "Audio monitor active")
+        self._on_status("audio", True)
+
+    # ── Start / Stop ────────────────────────────────────────
+    def start(self):
+        self.running = True
+        with startup.step("start audio capture"):
+            self._start_capture()
+        threading.Thread(target=self._tts_worker, daemon=True).start()
+        threading.Thread(target=self._voice_loop, daemon=True).start()
+        if CLAP_ENABLED:
+            threading.Thread(target=self._clap_loop, daemon=True).start()
+        threading.Thread(target=self._precache_responses, daemon=True).start()
+        self._on_log("system", "Jarvis online. Listening silently…")
+
+    def _start_control(self):
+        if self._control is None:
+            return
+        try:
+            self._control.start()
+        except OSError as e:
+            self._on_log("error", f"Control API unavailable on port {self._control.port}: {e}")
+            self._control = None
+            return
+        self._on_log("system", f"Control API on {self._control.host}:{self._control.port}")
+
+    def _precache_responses(self):
+        """Check if all responses are cached, download any missing ones."""
+        removed = self._voice_cache.gc()
+        if removed:
+            self._on_log("system", f"Voice cache: removed {removed} orphaned files.")
+
+        missing = []
+        for phrase in canned_phrases():
+            if self._in_bank(self._voice_cache.key(phrase)):
+                continue
+            if self._voice_cache.contains(phrase):
+                self._voice_cache.pin(phrase)
+            else:
+                missing.append(phrase)
+
+        if not missing:
+            self._voice_cache.flush()
+            self._preload_clips()
+            self._on_log("system", "Voice cache loaded. All responses ready.")
+            return
+
+        self._on_log("system", f"Downloading {len(missing)} missing voice files…")
+
+        def progress(done, total, phrase, error):
+            if error is not None:
+                self._on_log("error", f"Voice download failed: {phrase[:40]} ({error})")
+            elif done == total or done % 5 == 0:
+                self._on_log("system", f"Voice cache {done}/{total}")
+
+        failed = asyncio.run(synthesize_all(
+            missing, self._voice_cache, self._synth, on_progress=progress
+        ))
+        self._preload_clips()
+        if failed:
+            self._on_log("system", f"Voice cache ready ({len(failed)} phrases unavailable).")
+        else:
+            self._on_log("system", "Voice cache ready.")
+
+    def _preload_clips(self):
+        """Decode every canned response into the in-memory clip cache."""
+        self._mixer_ready.wait()
+        items = []
+        for phrase in canned_phrases():
+            key = self._voice_cache.key(phrase)
+            if self._in_bank(key):
+                items.append((key, self._voice_bank.open(key)))
+            elif self._voice_cache.contains(phrase):
+                items.append((key, self._voice_cache.path_for(phrase)))
+        self._clip_cache.preload(items)
+        st = self._clip_cache.stats()
+        self._on_log(
+            "system",
+            f"Clip cache: {st['clips']} clips, "
+            f"{st['bytes'] / 1e6:.1f}/{st['budget'] / 1e6:.0f} MB",
+        )
+
+    def dump_trace(self, log: bool = True):
+        """Write the latency percentiles to ``TRACE_FILE`` (and the log)."""
+        path = os.path.join(self._data_dir, TRACE_FILE)
+        try:
+            report = self.tracer.dump(path)
+        except OSError as e:
+            self._on_log("error", f"Could not write latency trace: {e}")
+            return None
+        if log:
+            for line in format_report(report):
+                self._on_log("system", line)
+            self._on_log("system", f"Latency trace saved to {path}")
+        return path
+
+    def stop(self):
+        self.running = False
+        if self._control is not None:
+            self._control.stop()
+        self.spectrum.stop()
+        self._capture.stop()
+        st = self._capture.stats()
+        self._on_log(
+            "system",
+            f"Audio callback: {st['callbacks']} blocks, max {st['max_callback_ms']:.2f} ms, "
+            f"{st['over_time']} over budget, {st['overflows']} overflows",
+        )
+        if self.tracer.traces:
+            self.dump_trace(log=False)
+        self._voice_cache.flush()
@@ -0,0 +1,908 @@
+# ============================================================
+#  J.A.R.V.I.S  –  GUI
+#  Iron Man–style interface with system tray
+# ============================================================
+
+import os
+import sys
+import time
+import threading
+import math
+from datetime import datetime
+
+import customtkinter as ctk
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont, ImageTk
+
+from config import (
+    RENDER_THROTTLE,
+    RENDER_IDLE_AFTER,
+    RENDER_SILENCE_DBFS,
+    HUD_RENDERER,
+    HUD_SPRITE_CACHE,
+    LOG_VIEW_LINES,
+)
+from paths import APP_DIR, DATA_DIR
+from hud_sprites import load_atlas, core_index, LAYERS
+import activity_log
+from ui_events import UIEventBus
+import startup
+
+# ── Paths ───────────────────────────────────────────────────
+# jarvis_core is imported when the engine starts, after the window is up
+ICON_PATH = os.path.join(APP_DIR, "assets", "jarvis_icon.ico")
+
+# ── Colour palette (Iron Man vibes) ────────────────────────
+BG_DARK      = "#0a0a0f"
+BG_PANEL     = "#111118"
+ACCENT_CYAN  = "#00d4ff"
+ACCENT_GOLD  = "#f0c040"
+TEXT_DIM     = "#5a5a6e"
+TEXT_LIGHT   = "#c8c8d8"
+RED_ALERT    = "#ff3040"
+GREEN_OK     = "#30ff90"
+
+
+# ====================================================================
+#  SYSTEM TRAY  (pystray – so Jarvis lives in the taskbar)
+# ====================================================================
+def create_tray_icon(show_cb, quit_cb, trace_cb=None):
+    """Create a system-tray icon. Returns the Icon object."""
+    import pystray
+    from pystray import MenuItem, Menu
+
+    # Generate a simple icon programmatically
+    img = Image.new("RGBA", (64, 64), (10, 10, 15, 255))
+    draw = ImageDraw.Draw(img)
+    # Cyan arc
+    draw.ellipse([8, 8, 56, 56], outline=(0, 212, 255, 255), width=3)
+    # "J" letter
+    try:
+        font = ImageFont.truetype("arial.ttf", 30)
+    except Exception:
+        font = ImageFont.load_default()
+    draw.text((20, 12), "J", fill=(0, 212, 255, 255), font=font)
+
+    icon = pystray.Icon(
+        "Jarvis",
+        img,
+        "J.A.R.V.I.S",
+        menu=Menu(
+            MenuItem("Show Jarvis", show_cb, default=True),
+            MenuItem("Dump latency trace", trace_cb, visible=trace_cb is not None),
+            MenuItem("Quit", quit_cb),
+        ),
+    )
+    return icon
+
+
+# ====================================================================
+#  ANIMATED ARC REACTOR CANVAS  (pure tkinter drawing)
+# ====================================================================
+class ArcReactorCanvas(ctk.CTkCanvas):
+    """Full-size animated HUD with arc reactor, scanning rings, and waveform.
+
+    Retained mode: every item is created once in ``_build`` and each frame
+    only moves or recolours the parts that change.
+    """
+
+    WAVE_POINTS = 40
+    # Degrees per frame of each rotating layer
+    RING1_STEP = 1.2
+    RING2_STEP = 0.7
+    TRIANGLE_STEP = 1.8
+
+    def __init__(self, master, size=280, **kw):
+        super().__init__(master, width=size, height=size,
+                         bg=BG_DARK, highlightthickness=0, **kw)
+        self.size = size
+        self.cx = size // 2
+        self.cy = size // 2
+        self.angle = 0
+        self.angle2 = 0
+        self.angle3 = 0
+        self.amplitude = 0.0
+        self.pulse = 0
+        self.levels = None          # LevelRing of the running engine
+        self.wave_data = np.zeros(self.WAVE_POINTS, dtype=np.float32)
+        self._build()
+        self._draw_frame()
+
+    def _build(self):
+        s = self.size
+        cx, cy = self.cx, self.cy
+
+        # ── Outer faint rings (HUD radar style) ──
+        for i in range(5):
+            r = s // 2 - 6 - i * 4
+            alpha_hex = max(15, 40 - i * 8)
+            col = f"#00{alpha_hex + 30:02x}{alpha_hex + 50:02x}"
+            self.create_oval(cx - r, cy - r, cx + r, cy + r,
+                             outline=col, width=1)
+
+        # ── Outer spinning ring 1 (clockwise) ──
+        r1 = s // 2 - 20
+        self._ring1 = [
+            self.create_arc(cx - r1, cy - r1, cx + r1, cy + r1,
+                            start=i * 90, extent=50,
+                            outline="#00a0d0", width=2, style="arc")
+            for i in range(4)
+        ]
+
+        # ── Outer spinning ring 2 (counter-clockwise) ──
+        r1b = s // 2 - 30
+        self._ring2 = [
+            self.create_arc(cx - r1b, cy - r1b, cx + r1b, cy + r1b,
+                            start=i * 60, extent=25,
+                            outline="#006090", width=1, style="arc")
+            for i in range(6)
+        ]
+
+        # ── Main reactor ring ──
+        r2 = s // 2 - 45
+        self._ring_col = "#008cff"
+        self._main_ring = self.create_oval(cx - r2, cy - r2, cx + r2, cy + r2,
+                                           outline=self._ring_col, width=3)
+
+        # ── Tick marks around the ring (static) ──
+        r_tick_out = r2 + 2
+        r_tick_in = r2 - 6
+        for i in range(36):
+            a = math.radians(i * 10)
+            c, sn = math.cos(a), math.sin(a)
+            tick_col = "#00607a" if i % 3 != 0 else "#00b8e0"
+            self.create_line(cx + r_tick_out * c, cy + r_tick_out * sn,
+                             cx + r_tick_in * c, cy + r_tick_in * sn,
+                             fill=tick_col, width=1)
+
+        # ── Inner spinning triangular segments ──
+        self._r3 = s // 2 - 70
+        self._triangles = [
+            self.create_polygon(0, 0, 0, 0, 0, 0, fill="#00c8ff", outline="")
+            for _ in range(3)
+        ]
+        # Unit vectors for every 0.1°, plus the vertex offset of ±2.3 rad
+        steps = np.arange(3600) * (math.pi / 1800)
+        self._cos, self._sin = np.cos(steps).tolist(), np.sin(steps).tolist()
+        self._tri_offset = int(round(math.degrees(2.3) * 10))
+
+        # ── Audio waveform ring ──
+        self._build_wave()
+
+        # ── Inner glow disc ──
+        r4 = 35
+        self._inner_col = "#002846"
+        self._glow = self.create_oval(cx - r4, cy - r4, cx + r4, cy + r4,
+                                      fill=self._inner_col, outline="#00a0c0", width=1)
+
+        # ── Inner ring ──
+        r5 = 25
+        self.create_oval(cx - r5, cy - r5, cx + r5, cy + r5,
+                         outline="#00e0ff", width=2)
+
+        # ── Pulsing core ──
+        self._core_r = 10
+        self._core = self.create_oval(cx - 10, cy - 10, cx + 10, cy + 10,
+                                      fill="#60f0ff", outline="")
+
+        # ── White hot centre ──
+        r7 = 4
+        self.create_oval(cx - r7, cy - r7, cx + r7, cy + r7,
+                         fill="#ffffff", outline="")
+
+        # ── Decorative corner brackets (HUD feel) ──
+        bk = 20
+        bk_col = "#004060"
+        # top-left
+        self.create_line(4, 4, 4, 4 + bk, fill=bk_col, width=1)
+        self.create_line(4, 4, 4 + bk, 4, fill=bk_col, width=1)
+        # top-right
+        self.create_line(s - 4, 4, s - 4, 4 + bk, fill=bk_col, width=1)
+        self.create_line(s - 4, 4, s - 4 - bk, 4, fill=bk_col, width=1)
+        # bottom-left
+        self.create_line(4, s - 4, 4, s - 4 - bk, fill=bk_col, width=1)
+        self.create_line(4, s - 4, 4 + bk, s - 4, fill=bk_col, width=1)
+        # bottom-right
+        self.create_line(s - 4, s - 4, s - 4, s - 4 - bk, fill=bk_col, width=1)
+        self.create_line(s - 4, s - 4, s - 4 - bk, s - 4, fill=bk_col, width=1)
+
+    def _build_wave(self):
+        self._r_wave = self.size // 2 - 58
+        wave_angles = np.radians(np.arange(self.WAVE_POINTS) * (360 / self.WAVE_POINTS))
+        self._wave_cos = np.cos(wave_angles)
+        self._wave_sin = np.sin(wave_angles)
+        self._wave_xy = np.empty(self.WAVE_POINTS * 2)
+        self._wave = self.create_line(0, 0, 0, 0, 0, 0, fill="#00e8ff", width=1, smooth=True)
+
+    def _update_wave(self):
+        if self.levels is not None:
+            self.levels.recent(self.wave_data)
+            self.amplitude = min(float(self.wave_data[-1]), 1.0)
+        wave_r = self._r_wave + self.wave_data * 18
+        self._wave_xy[0::2] = self.cx + wave_r * self._wave_cos
+        self._wave_xy[1::2] = self.cy + wave_r * self._wave_sin
+        self.coords(self._wave, *self._wave_xy.tolist())
+
+    def _draw_frame(self):
+        """Advance one frame, touching only the items that move."""
+        self._update_wave()
+        cx, cy = self.cx, self.cy
+        self.pulse = (self.pulse + 1) % 100
+        pulse_val = abs(math.sin(self.pulse * 0.06))
+
+        for i, item in enumerate(self._ring1):
+            self.itemconfigure(item, start=self.angle + i * 90)
+        for i, item in enumerate(self._ring2):
+            self.itemconfigure(item, start=-self.angle2 + i * 60)
+
+        glow = int(140 + self.amplitude * 115)
+        ring_col = f"#00{min(glow, 255):02x}ff"
+        if ring_col != self._ring_col:
+            self._ring_col = ring_col
+            self.itemconfigure(self._main_ring, outline=ring_col)
+
+        cos, sin, r3, tri_size = self._cos, self._sin, self._r3, 8
+        base = int(self.angle3 * 10)            # in tenths of a degree
+        for i, item in enumerate(self._triangles):
+            a = (base + i * 1200) % 3600
+            px = cx + r3 * cos[a]
+            py = cy + r3 * sin[a]
+            b = (a + self._tri_offset) % 3600
+            c = (a - self._tri_offset) % 3600
+            self.coords(item,
+                        px + tri_size * cos[a], py + tri_size * sin[a],
+                        px + tri_size * cos[b], py + tri_size * sin[b],
+                        px + tri_size * cos[c], py + tri_size * sin[c])
+
+        brightness = int(40 + self.amplitude * 160 + pulse_val * 30)
+        inner_col = f"#00{min(brightness, 255):02x}{min(brightness + 30, 255):02x}"
+        if inner_col != self._inner_col:
+            self._inner_col = inner_col
+            self.itemconfigure(self._glow, fill=inner_col)
+
+        r6 = int(10 + pulse_val * 4)
+        if r6 != self._core_r:
+            self._core_r = r6
+            self.coords(self._core, cx - r6, cy - r6, cx + r6, cy + r6)
+
+        self._advance()
+
+    def _advance(self):
+        self.angle = (self.angle + self.RING1_STEP) % 360
+        self.angle2 = (self.angle2 + self.RING2_STEP) % 360
+        self.angle3 = (self.angle3 + self.TRIANGLE_STEP) % 360
+
+
+class SpriteReactorCanvas(ArcReactorCanvas):
+    """The same HUD composited from a pre-rendered sprite atlas.
+
+    Each frame swaps the images of the three rotating layers, picked by the
+    same angles (and so the same rates) as the vector canvas, and of one
+    small core item; only the main ring colour and the live waveform are
+    still vector items.  Cheapest on slow machines.
+    """
+
+    def _build(self):
+        s = self.size
+        cx, cy = self.cx, self.cy
+        background, self._layer_src, self._core_src = load_atlas(
+            s, os.path.join(DATA_DIR, HUD_SPRITE_CACHE),
+            (self.RING1_STEP, self.RING2_STEP, self.TRIANGLE_STEP))
+        # PhotoImages are made the first time each frame is shown
+        self._background = ImageTk.PhotoImage(background)
+        self._layer_img = [[None] * len(src) for src in self._layer_src]
+        self._core_img = [None] * len(self._core_src)
+        self._layer_idx = [-1] * len(self._layer_src)
+        self._core_idx = -1
+
+        self.create_image(0, 0, anchor="nw", image=self._background)
+        self._layers = [self.create_image(cx, cy) for _ in self._layer_src]
+        r2 = s // 2 - 45
+        self._ring_col = "#008cff"
+        self._main_ring = self.create_oval(cx - r2, cy - r2, cx + r2, cy + r2,
+                                           outline=self._ring_col, width=3)
+        self._build_wave()
+        self._core = self.create_image(cx, cy)
+
+    @staticmethod
+    def _photo(cache, src, i):
+        if cache[i] is None:
+            cache[i] = ImageTk.PhotoImage(src[i])
+        return cache[i]
+
+    def _draw_frame(self):
+        self._update_wave()
+        self.pulse = (self.pulse + 1) % 100
+        pulse_val = abs(math.sin(self.pulse * 0.06))
+
+        angles = (self.angle, self.angle2, self.angle3)
+        for i, ((_, _, symmetry), angle) in enumerate(zip(LAYERS, angles)):
+            src = self._layer_src[i]
+            idx = round(angle % symmetry * len(src) / symmetry) % len(src)
+            if idx != self._layer_idx[i]:
+                self._layer_idx[i] = idx
+                self.itemconfigure(self._layers[i],
+                                   image=self._photo(self._layer_img[i], src, idx))
+
+        glow = int(140 + self.amplitude * 115)
+        ring_col = f"#00{min(glow, 255):02x}ff"
+        if ring_col != self._ring_col:
+            self._ring_col = ring_col
+            self.itemconfigure(self._main_ring, outline=ring_col)
+
+        idx = core_index(40 + self.amplitude * 160 + pulse_val * 30, int(10 + pulse_val * 4))
+        if idx != self._core_idx:
+            self._core_idx = idx
+            self.itemconfigure(self._core, image=self._photo(self._core_img, self._core_src, idx))
+        self._advance()
+
+
+REACTOR_RENDERERS = {
+    "retained": ArcReactorCanvas,
+    "sprites": SpriteReactorCanvas,
+}
+
+
+# ====================================================================
+#  AUDIO WAVEFORM BAR
+# ====================================================================
+class WaveformBar(ctk.CTkCanvas):
+    """Horizontal audio visualiser: level history, or a live spectrum with
+    peak hold (click to switch).  Bars are created once and moved in place.
+    """
+
+    PALETTE_STEPS = 32
+
+    def __init__(self, master, width=420, height=40, bars=50, **kw):
+        super().__init__(master, width=width, height=height,
+                         bg=BG_DARK, highlightthickness=0, **kw)
+        self.w = width
+        self.h = height
+        self.levels = None          # LevelRing of the running engine
+        self.spectrum = None        # SpectrumAnalyzer of the running engine
+        self.mode = "levels"
+        self.bars = np.zeros(bars, dtype=np.float32)
+
+        # Bar colours for each level step, formatted once
+        self._palette = []
+        for val in np.linspace(0.0, 1.0, self.PALETTE_STEPS):
+            brightness = int(80 + val * 175)
+            self._palette.append(f"#00{min(brightness, 255):02x}{min(brightness + 30, 255):02x}")
+        self._shown = [None] * bars             # (y0, y1, colour step) last drawn
+        self._peak_y = [None] * bars
+
+        bar_w = self.w / bars
+        mid = self.h // 2
+        self._rects, self._peaks = [], []
+        for i in range(bars):
+            x = i * bar_w
+            self._rects.append(self.create_rectangle(x + 1, mid - 1, x + bar_w - 1, mid + 1,
+                                                     fill=self._palette[0], outline=""))
+            self._peaks.append(self.create_line(x + 1, self.h - 1, x + bar_w - 1, self.h - 1,
+                                                fill=ACCENT_GOLD, state="hidden"))
+        # Centre line
+        self._centre = self.create_line(0, mid, self.w, mid, fill="#002535", width=1)
+        self.bind("<Button-1>", lambda e: self.toggle_mode())
+        self._draw()
+
+    def attach(self, levels, spectrum):
+        """Point the bar at an engine's data (or at None when it stops)."""
+        self.levels, self.spectrum = levels, spectrum
+        if spectrum is not None and self.mode == "spectrum":
+            spectrum.start()
+
+    def toggle_mode(self):
+        spectrum = self.mode == "levels"
+        self.mode = "spectrum" if spectrum else "levels"
+        if self.spectrum is not None:
+            (self.spectrum.start if spectrum else self.spectrum.stop)()
+        state = "normal" if spectrum else "hidden"
+        for item in self._peaks:
+            self.itemconfigure(item, state=state)
+        self.itemconfigure(self._centre, state="hidden" if spectrum else "normal")
+        self._shown = [None] * len(self.bars)
+        self._draw()
+
+    def _draw(self):
+        n = len(self.bars)
+        peaks = None
+        if self.mode == "spectrum":
+            if self.spectrum is not None:
+                bands, peaks = self.spectrum.bands, self.spectrum.peaks
+                if len(bands) != n:
+                    grid = np.linspace(0, len(bands) - 1, n)
+                    bands = np.interp(grid, np.arange(len(bands)), bands)
+                    peaks = np.interp(grid, np.arange(len(peaks)), peaks)
+                self.bars[:] = bands
+            else:
+                self.bars[:] = 0.0
+        elif self.levels is not None:
+            self.levels.recent(self.bars)
+            np.minimum(self.bars, 1.0, out=self.bars)
+
+        bar_w = self.w / n
+        mid = self.h // 2
+        top = self.mode == "spectrum"
+        steps = self.PALETTE_STEPS - 1
+        for i, val in enumerate(self.bars.tolist()):
+            if top:
+                # Spectrum bars grow up from the bottom edge
+                y0, y1 = int(self.h - 1 - max(1, val * (self.h - 2))), self.h - 1
+            else:
+                h = int(max(1, val * mid * 0.9))
+                y0, y1 = mid - h, mid + h
+            step = int(val * steps)
+            shown = self._shown[i]
+            if shown is not None and shown[0] == y0 and shown[2] == step:
+                continue
+            x = i * bar_w
+            self.coords(self._rects[i], x + 1, y0, x + bar_w - 1, y1)
+            if shown is None or shown[2] != step:
+                self.itemconfigure(self._rects[i], fill=self._palette[step])
+            self._shown[i] = (y0, y1, step)
+        if peaks is not None:
+            for i, p in enumerate(np.asarray(peaks).tolist()):
+                y = int(self.h - 1 - p * (self.h - 2))
+                if y != self._peak_y[i]:
+                    self._peak_y[i] = y
+                    x = i * bar_w
+                    self.coords(self._peaks[i], x + 1, y, x + bar_w - 1, y)
+
+
+# ====================================================================
+#  RENDER SCHEDULER  (one place that decides how often the UI redraws)
+# ====================================================================
+class _Task:
+    __slots__ = ("fn", "periods", "after")
+
+    def __init__(self, fn, periods):
+        self.fn = fn
+        self.periods = periods      # mode -> ms, or None to suspend
+        self.after = None
+
+
+class RenderScheduler:
+    """Runs every periodic UI job at a rate that suits what's on screen.
+
+    ``active``  window visible and the mic hearing something — full rate
+    ``idle``    visible, but silent for ``RENDER_IDLE_AFTER`` seconds
+    ``hidden``  withdrawn to the tray or minimised — animation suspended
+    """
+
+    ACTIVE, IDLE, HIDDEN = "active", "idle", "hidden"
+
+    def __init__(self, root, enabled: bool = RENDER_THROTTLE):
+        self.root = root
+        self.enabled = enabled
+        self.levels = None          # LevelRing of the running engine
+        self.mode = self.ACTIVE
+        self._tasks = []
+        self._last_sound = time.monotonic()
+        root.bind("<Map>", self._on_visibility, add="+")
+        root.bind("<Unmap>", self._on_visibility, add="+")
+        self.add(self._update_mode, 250, idle_ms=250)
+
+    def add(self, fn, active_ms: int, idle_ms: int = None, hidden_ms: int = None):
+        """Run ``fn`` now and then every ``active_ms`` / ``idle_ms`` /
+        ``hidden_ms`` depending on the mode (None while hidden = suspended).
+        """
+        task = _Task(fn, {
+            self.ACTIVE: active_ms,
+            self.IDLE: idle_ms or active_ms,
+            self.HIDDEN: hidden_ms,
+        })
+        self._tasks.append(task)
+        self._run(task)
+        return task
+
+    def wake(self):
+        """Something happened (wake word, window shown): full rate, right now."""
+        self._last_sound = time.monotonic()
+        self._update_mode()
+
+    # ── Internals ───────────────────────────────────────────
+    def _run(self, task):
+        task.after = None
+        task.fn()
+        self._schedule(task)
+
+    def _schedule(self, task):
+        if task.after is not None:
+            self.root.after_cancel(task.after)
+            task.after = None
+        period = task.periods[self.mode]
+        if period is not None:
+            task.after = self.root.after(period, self._run, task)
+
+    def _on_visibility(self, event):
+        if event.widget is self.root:
+            self._update_mode()
+
+    def _update_mode(self):
+        now = time.monotonic()
+        if self.levels is not None and self.levels.latest("dbfs") > RENDER_SILENCE_DBFS:
+            self._last_sound = now
+        if not self.enabled:
+            mode = self.ACTIVE
+        elif self.root.state() in ("withdrawn", "iconic"):
+            mode = self.HIDDEN
+        elif now - self._last_sound > RENDER_IDLE_AFTER:
+            mode = self.IDLE
+        else:
+            mode = self.ACTIVE
+        if mode == self.mode:
+            return
+        self.mode = mode
+        # Reschedule everything for the new mode; resumed jobs run at once
+        for task in self._tasks:
+            if task.after is not None:
+                self.root.after_cancel(task.after)
+                task.after = None
+            if task.periods[mode] is not None:
+                task.after = self.root.after(0, self._run, task)
+
+
+# ====================================================================
+#  MAIN GUI WINDOW
+# ====================================================================
+class JarvisApp(ctk.CTk):
+    def __init__(self, renderer: str = HUD_RENDERER):
+        super().__init__()
+        self.renderer = renderer if renderer in REACTOR_RENDERERS else "retained"
+
+        # ── Window setup ────────────────────────────────────
+        self.title("J.A.R.V.I.S")
+        self.geometry("560x820")
+        self.minsize(500, 750)
+        self.configure(fg_color=BG_DARK)
+        ctk.set_appearance_mode("dark")
+        ctk.set_default_color_theme("dark-blue")
+
+        # Set icon if available
+        if os.path.exists(ICON_PATH):
+            self.iconbitmap(ICON_PATH)
+
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        # ── State ───────────────────────────────────────────
+        self.core = None              # JarvisCore once engaged
+        self._loading = False         # engine importing / starting in the background
+        self.tray_icon = None
+        self._voice_ok = False
+        self._audio_ok = False
+
+        self._build_ui()
+
+    # ── Build UI ────────────────────────────────────────────
+    def _build_ui(self):
+        # ─── TOP HEADER BAR ─────────────────────────────────
+        header = ctk.CTkFrame(self, fg_color="#06060c", corner_radius=0, height=52)
+        header.pack(fill="x")
+        header.pack_propagate(False)
+
+        left_line = ctk.CTkFrame(header, fg_color=ACCENT_CYAN, width=3, height=30,
+                                  corner_radius=2)
+        left_line.pack(side="left", padx=(16, 8), pady=11)
+
+        ctk.CTkLabel(
+            header, text="J . A . R . V . I . S",
+            font=ctk.CTkFont(family="Consolas", size=20, weight="bold"),
+            text_color=ACCENT_CYAN,
+        ).pack(side="left")
+
+        self.clock_label = ctk.CTkLabel(
+            header, text="", font=ctk.CTkFont(family="Consolas", size=11),
+            text_color=TEXT_DIM,
+        )
+        self.clock_label.pack(side="right", padx=16)
+
+        # Thin cyan line under header
+        ctk.CTkFrame(self, fg_color="#003545", height=1, corner_radius=0).pack(fill="x")
+
+        # ─── ARC REACTOR ─────────────────────────────────────
+        reactor_frame = ctk.CTkFrame(self, fg_color=BG_DARK)
+        reactor_frame.pack(pady=(10, 0))
+        self.reactor = REACTOR_RENDERERS[self.renderer](reactor_frame, size=280)
+        self.reactor.pack()
+
+        # ─── STATUS ROW ──────────────────────────────────────
+        status_row = ctk.CTkFrame(self, fg_color=BG_DARK)
+        status_row.pack(pady=(6, 2))
+
+        # Status badge
+        self.status_badge = ctk.CTkFrame(status_row, fg_color="#1a0a0a",
+                                          corner_radius=12, height=28)
+        self.status_badge.pack(side="left", padx=8)
+        self.status_label = ctk.CTkLabel(
+            self.status_badge, text="  ● OFFLINE  ",
+            font=ctk.CTkFont(family="Consolas", size=12, weight="bold"),
+            text_color=RED_ALERT,
+        )
+        self.status_label.pack(padx=8, pady=2)
+
+        # Voice indicator
+        self.voice_dot = ctk.CTkLabel(
+            status_row, text="◈ VOICE",
+            font=ctk.CTkFont(family="Consolas", size=11, weight="bold"),
+            text_color=TEXT_DIM,
+        )
+        self.voice_dot.pack(side="left", padx=14)
+
+        # Audio indicator
+        self.audio_dot = ctk.CTkLabel(
+            status_row, text="◈ AUDIO",
+            font=ctk.CTkFont(family="Consolas", size=11, weight="bold"),
+            text_color=TEXT_DIM,
+        )
+        self.audio_dot.pack(side="left", padx=14)
+
+        # ─── WAVEFORM ────────────────────────────────────────
+        wave_frame = ctk.CTkFrame(self, fg_color=BG_DARK)
+        wave_frame.pack(pady=(8, 2), padx=30, fill="x")
+        ctk.CTkLabel(
+            wave_frame, text="AUDIO INPUT",
+            font=ctk.CTkFont(family="Consolas", size=9),
+            text_color="#003545",
+        ).pack(anchor="w", padx=4)
+        self.waveform = WaveformBar(wave_frame, width=480, height=36)
+        self.waveform.pack(fill="x", padx=2)
+
+        # ─── LOG AREA ────────────────────────────────────────
+        log_frame = ctk.CTkFrame(self, fg_color=BG_PANEL, corner_radius=12,
+                                  border_width=1, border_color="#0d2a38")
+        log_frame.pack(fill="both", expand=True, padx=20, pady=(10, 8))
+
+        log_header = ctk.CTkFrame(log_frame, fg_color="transparent", height=28)
+        log_header.pack(fill="x", padx=12, pady=(8, 0))
+        log_header.pack_propagate(False)
+        ctk.CTkLabel(
+            log_header, text="◆ ACTIVITY LOG",
+            font=ctk.CTkFont(family="Consolas", size=10, weight="bold"),
+            text_color="#006080",
+        ).pack(side="left")
+
+        self.log_box = ctk.CTkTextbox(
+            log_frame, font=ctk.CTkFont(family="Consolas", size=11),
+            fg_color="#0a0a12", text_color=TEXT_LIGHT,
+            corner_radius=8, border_width=0,
+            wrap="word", state="disabled",
+        )
+        self.log_box.pack(fill="both", expand=True, padx=10, pady=(4, 10))
+        self._log_lines = 0
+
+        # ─── BUTTONS ─────────────────────────────────────────
+        btn_frame = ctk.CTkFrame(self, fg_color=BG_DARK)
+        btn_frame.pack(pady=(0, 6))
+
+        self.start_btn = ctk.CTkButton(
+            btn_frame, text="▶  ENGAGE", width=140, height=42,
+            font=ctk.CTkFont(family="Consolas", size=14, weight="bold"),
+            fg_color="#0a2a3d", hover_color="#0d3a55",
+            text_color=ACCENT_CYAN, corner_radius=10,
+            border_width=1, border_color="#00506a",
+            command=self._toggle_engine,
+        )
+        self.start_btn.pack(side="left", padx=6)
+
+        self.home_btn = ctk.CTkButton(
+            btn_frame, text="⚡ OPEN HOME", width=155, height=42,
+            font=ctk.CTkFont(family="Consolas", size=14, weight="bold"),
+            fg_color="#2a1a05", hover_color="#3d2808",
+            text_color=ACCENT_GOLD, corner_radius=10,
+            border_width=1, border_color="#604010",
+            command=self._manual_open_home,
+        )
+        self.home_btn.pack(side="left", padx=6)
+
+        self.minimize_btn = ctk.CTkButton(
+            btn_frame, text="▼ TRAY", width=90, height=42,
+            font=ctk.CTkFont(family="Consolas", size=14, weight="bold"),
+            fg_color="#0e0e16", hover_color="#1a1a28",
+            text_color=TEXT_DIM, corner_radius=10,
+            border_width=1, border_color="#1a1a2a",
+            command=self._minimize_to_tray,
+        )
+        self.minimize_btn.pack(side="left", padx=6)
+
+        # ─── BOTTOM BAR ──────────────────────────────────────
+        bottom = ctk.CTkFrame(self, fg_color="#06060c", corner_radius=0, height=30)
+        bottom.pack(fill="x", side="bottom")
+        bottom.pack_propagate(False)
+        ctk.CTkFrame(self, fg_color="#003545", height=1, corner_radius=0).pack(
+            fill="x", side="bottom")
+        ctk.CTkLabel(
+            bottom,
+            text="  ◆ Namit-07/Jarvis  │  Say 'Jarvis' or 'Jarvis play <song>'  │  v3.0",
+            font=ctk.CTkFont(family="Consolas", size=9), text_color="#2a2a3a",
+        ).pack(side="left", padx=8)
+
+        # Background threads never touch Tk: they publish here instead
+        self.events = UIEventBus()
+        self.events.on("log", self._show_logs)
+        self.events.on("status", self._show_status)
+        self.events.on("raise", lambda _: self._bring_to_front())
+        self.events.on("quit", lambda _: self._force_quit())
+        self.events.on("engine", self._engine_ready)
+
+        # Every periodic job runs through the scheduler so it can be throttled
+        self.scheduler = RenderScheduler(self)
+        self.scheduler.add(self._frame, 33, idle_ms=200, hidden_ms=250)
+        self.scheduler.add(self.waveform._draw, 60, idle_ms=300)
+        self.scheduler.add(self._tick_clock, 1000)
+
+    def _frame(self):
+        # Events first, so the frame draws the state they describe
+        self.events.drain()
+        if self.scheduler.mode != RenderScheduler.HIDDEN:
+            self.reactor._draw_frame()
+
+    # ── Clock ───────────────────────────────────────────────
+    def _tick_clock(self):
+        now = datetime.now().strftime("%H:%M:%S  •  %d %b %Y")
+        self.clock_label.configure(text=now)
+
+    # ── Logging ─────────────────────────────────────────────
+    LOG_PREFIXES = {
+        "jarvis": "JARVIS",
+        "user":   "  YOU ",
+        "system": " SYS  ",
+        "error":  "ERROR ",
+    }
+
+    def _log(self, tag: str, msg: str):
+        # Any thread: stamp now, show on the next frame, persist in the background
+        self.events.append("log", (datetime.now(), tag, msg))
+        activity_log.record(tag, msg)
+
+    def _show_logs(self, entries):
+        lines = []
+        for ts, tag, msg in entries:
+            prefix = self.LOG_PREFIXES.get(tag, "INFO")
+            flat = msg.replace("\n", " ")
+            lines.append(f"[{ts:%H:%M:%S}] [{prefix}]  {flat}\n")
+        self._append_logs(lines)
+
+    def _append_logs(self, lines):
+        """Insert a batch in one go and trim the view to ``LOG_VIEW_LINES``."""
+        lines = lines[-LOG_VIEW_LINES:]
+        self.log_box.configure(state="normal")
+        self.log_box.insert("end", "".join(lines))
+        self._log_lines += len(lines)
+        excess = self._log_lines - LOG_VIEW_LINES
+        if excess > 0:
+            self.log_box.delete("1.0", f"{excess + 1}.0")
+            self._log_lines -= excess
+        self.log_box.see("end")
+        self.log_box.configure(state="disabled")
+
+    # ── Status updates (published from core threads) ────────
+    def _on_status(self, subsystem: str, ok: bool):
+        self.events.post("status", (subsystem, ok), key=subsystem)
+
+    def _show_status(self, update):
+        subsystem, ok = update
+        if subsystem == "voice":
+            self._voice_ok = ok
+        elif subsystem == "audio":
+            self._audio_ok = ok
+        self._refresh_indicators()
+
+    def _refresh_indicators(self):
+        self.voice_dot.configure(text_color=GREEN_OK if self._voice_ok else TEXT_DIM)
+        self.audio_dot.configure(text_color=GREEN_OK if self._audio_ok else TEXT_DIM)
+        if self._voice_ok or self._audio_ok:
+            self.status_label.configure(text="  ● ONLINE  ", text_color=GREEN_OK)
+            self.status_badge.configure(fg_color="#0a1a0a")
+
+    # ── Engine toggle ───────────────────────────────────────
+    def _toggle_engine(self):
+        if self._loading:
+            return                  # still engaging: the button catches up when it's done
+        if self.core and self.core.running:
+            self.core.stop()
+            self.core = None
+            self.reactor.levels = self.scheduler.levels = None
+            self.waveform.attach(None, None)
+            self.start_btn.configure(text="▶  ENGAGE", fg_color="#0a2a3d",
+                                     text_color=ACCENT_CYAN)
+            self.status_label.configure(text="  ● OFFLINE  ", text_color=RED_ALERT)
+            self.status_badge.configure(fg_color="#1a0a0a")
+            self._voice_ok = self._audio_ok = False
+            self.events.forget("status")
+            self._refresh_indicators()
+            self._log("system", "Jarvis stopped.")
+        else:
+            self._loading = True
+            self.start_btn.configure(text="…  ENGAGING", fg_color="#0a2a3d",
+                                     text_color=TEXT_DIM)
+            self._log("system", "Jarvis starting up…")
+            threading.Thread(target=self._load_engine, daemon=True).start()
+
+    def _load_engine(self):
+        """Import and start the engine off the Tk thread, so the window
+        draws and responds while the audio stack loads."""
+        core = None
+        try:
+            with startup.step("import jarvis_core"):
+                from jarvis_core import JarvisCore
+            with startup.step("build engine"):
+                core = JarvisCore(
+                    on_log=self._log,
+                    on_status=self._on_status,
+                    on_wake=self._on_wake_word,
+                )
+            core.start()
+        except Exception as e:
+            self._log("error", f"Engine failed to start: {e}")
+            core = None
+        self.events.post("engine", core)
+
+    def _engine_ready(self, core):
+        self._loading = False
+        if core is None:
+            self.start_btn.configure(text="▶  ENGAGE", fg_color="#0a2a3d",
+                                     text_color=ACCENT_CYAN)
+            return
+        self.core = core
+        self.reactor.levels = self.scheduler.levels = core.levels
+        self.waveform.attach(core.levels, core.spectrum)
+        self.start_btn.configure(text="■  DISENGAGE", fg_color="#3d0d0d",
+                                 text_color=RED_ALERT)
+
+    def _manual_open_home(self):
+        if self.core and self.core.running:
+            threading.Thread(target=self.core.open_home, daemon=True).start()
+        else:
+            self._log("system", "Start Jarvis first.")
+
+    # ── System Tray ─────────────────────────────────────────
+    def _minimize_to_tray(self):
+        self.withdraw()  # hide window
+        if not self.tray_icon:
+            self.tray_icon = create_tray_icon(
+                show_cb=lambda icon, item: self._show_from_tray(),
+                quit_cb=lambda icon, item: self._quit_from_tray(),
+                trace_cb=lambda icon, item: self._dump_trace(),
+            )
+            threading.Thread(target=self.tray_icon.run, daemon=True).start()
+        self._log("system", "Minimised to system tray.")
+
+    def _show_from_tray(self):
+        self.events.post("raise")
+
+    def _on_wake_word(self):
+        """Called when the wake word is detected — pop up the GUI."""
+        self.events.post("raise")
+
+    def _bring_to_front(self):
+        """Show window and bring it to the foreground."""
+        self.deiconify()
+        self.lift()
+        self.attributes('-topmost', True)
+        self.after(800, lambda: self.attributes('-topmost', False))
+        self.focus_force()
+        self.scheduler.wake()
+
+    def _dump_trace(self):
+        # Tray thread: the tracer is safe to read from here, logs go via the bus
+        if self.core and self.core.running:
+            self.core.dump_trace()
+        else:
+            self._log("system", "Start Jarvis first.")
+
+    def _quit_from_tray(self):
+        if self.tray_icon:
+            self.tray_icon.stop()
+        self.events.post("quit")
+
+    # ── Close / quit ────────────────────────────────────────
+    def _on_close(self):
+        """Minimize to tray instead of quitting."""
+        self._minimize_to_tray()
+
+    def _force_quit(self):
+        if self.core:
+            self.core.stop()
+        activity_log.stop()
+        self.destroy()
+        sys.exit(0)
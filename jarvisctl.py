@@ -0,0 +1,159 @@
+# ============================================================
+#  J.A.R.V.I.S  –  Control API client
+#  Send commands to a running Jarvis (GUI or --headless) over
+#  its local control socket, or load-test the dispatch / TTS
+#  path with many pipelined requests.  Needs
+#  CONTROL_API_ENABLED; the token is read from the data dir.
+#
+#    python jarvisctl.py "jarvis play thunderstruck"
+#    python jarvisctl.py --speak "Hello sir." --wait
+#    python jarvisctl.py --status --latency
+#    python jarvisctl.py --load 1000 --clients 8 --depth 32 --status
+# ============================================================
+
+import os
+import sys
+import json
+import time
+import socket
+import argparse
+import threading
+
+import numpy as np
+
+from config import CONTROL_API_HOST, CONTROL_API_PORT, CONTROL_API_TOKEN, CONTROL_API_TOKEN_FILE
+from paths import DATA_DIR
+
+
+def default_token() -> str:
+    """CONTROL_API_TOKEN, else the one the engine generated on its first start."""
+    if CONTROL_API_TOKEN:
+        return CONTROL_API_TOKEN
+    try:
+        with open(os.path.join(DATA_DIR, CONTROL_API_TOKEN_FILE), encoding="utf-8") as f:
+            return f.read().strip()
+    except OSError:
+        return ""
+
+
+class ControlClient:
+    """Blocking JSON-lines client; ``send`` and ``recv`` may be pipelined."""
+
+    def __init__(self, host: str = CONTROL_API_HOST, port: int = CONTROL_API_PORT,
+                 token: str = CONTROL_API_TOKEN, timeout: float = 60.0):
+        self.token = token
+        self._sock = socket.create_connection((host, port), timeout=timeout)
+        self._file = self._sock.makefile("rb")
+        self._ids = 0
+
+    def send(self, cmd: str, **args) -> int:
+        self._ids += 1
+        req = {"id": self._ids, "cmd": cmd, **args}
+        if self.token:
+            req["token"] = self.token
+        self._sock.sendall(json.dumps(req).encode() + b"\n")
+        return self._ids
+
+    def recv(self) -> dict:
+        line = self._file.readline()
+        if not line:
+            raise ConnectionError("Jarvis closed the connection")
+        return json.loads(line)
+
+    def call(self, cmd: str, **args) -> dict:
+        self.send(cmd, **args)
+        return self.recv()
+
+    def close(self):
+        self._file.close()
+        self._sock.close()
+
+
+def load_test(args, cmd: str, req: dict) -> dict:
+    """``args.load`` requests over ``args.clients`` connections, each keeping
+    up to ``args.depth`` in flight; per-request latency is send → reply."""
+    latencies, failures = [], []
+    lock = threading.Lock()
+    per_client = [args.load // args.clients + (i < args.load % args.clients)
+                  for i in range(args.clients)]
+
+    def run(n):
+        client = ControlClient(args.host, args.port, args.token)
+        sent, lat, bad = {}, [], []
+        for _ in range(min(n, args.depth)):
+            sent[client.send(cmd, **req)] = time.perf_counter()
+        remaining = n - len(sent)
+        for _ in range(n):
+            reply = client.recv()
+            lat.append(time.perf_counter() - sent.pop(reply["id"]))
+            if not reply.get("ok"):
+                bad.append(reply.get("error"))
+            if remaining:
+                sent[client.send(cmd, **req)] = time.perf_counter()
+                remaining -= 1
+        client.close()
+        with lock:
+            latencies.extend(lat)
+            failures.extend(bad)
+
+    t0 = time.perf_counter()
+    threads = [threading.Thread(target=run, args=(n,)) for n in per_client if n]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    wall = time.perf_counter() - t0
+    ms = np.array(latencies) * 1000
+    p50, p95, p99 = np.percentile(ms, (50, 95, 99))
+    return {
+        "requests": len(ms), "failed": len(failures), "wall_s": round(wall, 3),
+        "per_s": round(len(ms) / wall, 1), "p50_ms": round(float(p50), 2),
+        "p95_ms": round(float(p95), 2), "p99_ms": round(float(p99), 2),
+        "max_ms": round(float(ms.max()), 2), "errors": sorted(set(map(str, failures)))[:5],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Drive a running Jarvis over its control API")
+    parser.add_argument("text", nargs="?", help="command to run as if spoken")
+    parser.add_argument("--speak", metavar="TEXT", help="say TEXT instead")
+    parser.add_argument("--priority", choices=("urgent", "normal", "low"), default="normal")
+    parser.add_argument("--wait", action="store_true", help="--speak: reply once it was spoken")
+    parser.add_argument("--status", action="store_true", help="print the engine status")
+    parser.add_argument("--latency", action="store_true", help="--status: include percentiles")
+    parser.add_argument("--load", type=int, metavar="N", help="send the request N times")
+    parser.add_argument("--clients", type=int, default=4, help="--load: connections")
+    parser.add_argument("--depth", type=int, default=16, help="--load: requests in flight each")
+    parser.add_argument("--host", default=CONTROL_API_HOST)
+    parser.add_argument("--port", type=int, default=CONTROL_API_PORT)
+    parser.add_argument("--token", help=f"default: {CONTROL_API_TOKEN_FILE} in the data dir")
+    args = parser.parse_args()
+    if args.token is None:
+        args.token = default_token()
+
+    if args.status:
+        cmd, req = "status", {"latency": args.latency}
+    elif args.speak:
+        cmd, req = "speak", {"text": args.speak, "priority": args.priority, "wait": args.wait}
+    elif args.text:
+        cmd, req = "text", {"text": args.text}
+    else:
+        parser.error("give a command, --speak TEXT or --status")
+
+    try:
+        if args.load:
+            args.clients = max(1, min(args.clients, args.load))
+            print(json.dumps(load_test(args, cmd, req), indent=2))
+            return
+        client = ControlClient(args.host, args.port, args.token)
+        reply = client.call(cmd, **req)
+        client.close()
+    except OSError as e:
+        sys.exit(f"[Jarvis] Control API not reachable on {args.host}:{args.port}: {e}")
+    print(json.dumps(reply, indent=2))
+    if not reply.get("ok"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,14 @@
+# ============================================================
+#  J.A.R.V.I.S  –  Paths
+#  Where the app's own files live, and where the files it
+#  writes (logs, caches, calibration, enrolment, trace) go.
+# ============================================================
+
+import os
+import sys
+
+# Scripts and bundled assets (the onefile build's temporary extraction dir)
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+# Must survive restarts: next to the exe when frozen, since the onefile
+# bundle dir is deleted on exit
+DATA_DIR = os.path.dirname(sys.executable) if getattr(sys, "frozen", False) else APP_DIR
@@ -0,0 +1,58 @@
+# ============================================================
+#  J.A.R.V.I.S  –  Phrases
+#  Every canned response line.  Kept free of engine imports so
+#  download_voices.py can build the voice bank without pygame,
+#  the recogniser or the audio stack.
+# ============================================================
+
+# ── Witty responses (like the real Jarvis) ────────────────
+GREETINGS = [
+    "At your service, sir.",
+    "Hello sir. What can I do for you?",
+    "Yes sir?",
+    "Online and ready, sir.",
+    "I'm here. What do you need?",
+    "Sir. Sarcasm module loaded and ready.",
+    "What shall we break today, sir?",
+    "Awaiting orders, sir.",
+]
+
+HOME_OPENERS = [
+    "On it, sir.",
+    "Firing up your workspace.",
+    "Setting up, sir.",
+    "Loading your setup.",
+    "Right away, sir.",
+]
+
+HOME_READY = [
+    "All set, sir.",
+    "Done. You're welcome.",
+    "Ready when you are.",
+    "The stage is yours, sir.",
+    "All yours. Do try to keep up.",
+]
+
+# Synthesised per song, so never cached ahead of time
+PLAY_RESPONSES = [
+    "Playing {song} for you, sir.",
+    "Queuing up {song}. Enjoy, sir.",
+    "One {song} coming right up.",
+    "{song}. Excellent choice, sir.",
+    "On it. Playing {song}.",
+]
+
+# ── Fixed lines ───────────────────────────────────────────
+HOME_APPS = ["VS Code", "Spotify"]
+LAUNCH_FAILED = "Well this is embarrassing. I can't seem to find {name}, sir."
+PLAY_PROMPT = "What would you like me to play, sir?"
+NOT_CAUGHT = "Sorry sir, I didn't catch that."
+
+
+def canned_phrases():
+    """Every fixed response line (pinned in the voice cache)."""
+    return GREETINGS + HOME_OPENERS + HOME_READY + [
+        *(LAUNCH_FAILED.format(name=name) for name in HOME_APPS),
+        PLAY_PROMPT,
+        NOT_CAUGHT,
+    ]
@@ -0,0 +1,145 @@
+# ============================================================
+#  J.A.R.V.I.S  –  Recognition Pipeline
+#  Decouples capture from cloud recognition: segments go into
+#  a bounded queue, a small worker pool recognises them in
+#  parallel, and results are dispatched strictly in capture
+#  order.  When the queue is full the oldest non-wake segment
+#  is dropped so capture never stalls.
+# ============================================================
+
+import time
+import queue
+import itertools
+import threading
+from collections import deque
+
+from config import RECOGNIZER_WORKERS, RECOGNIZER_QUEUE, RECOGNIZER_TIMEOUT
+
+_SKIPPED = object()     # dropped, failed or timed out — advance past it
+
+
+class RecognitionPipeline:
+    """Bounded segment queue -> recogniser worker pool -> in-order dispatch.
+
+    ``recognize(segment)`` runs on a worker thread and returns a result (or
+    None for "nothing recognised"); ``dispatch(segment, result)`` runs on a
+    single dispatcher thread, in the order segments were submitted.
+    """
+
+    def __init__(self, recognize, dispatch, workers: int = RECOGNIZER_WORKERS,
+                 max_pending: int = RECOGNIZER_QUEUE, timeout: float = RECOGNIZER_TIMEOUT,
+                 on_error=None, on_drop=None):
+        self._recognize = recognize
+        self._dispatch = dispatch
+        self._workers = max(1, workers)
+        self.max_pending = max(1, max_pending)
+        self.timeout = timeout
+        self._on_error = on_error or (lambda seg, e: None)
+        self._on_drop = on_drop or (lambda seg: None)
+
+        self._seq = itertools.count()
+        self._next = 0                  # next sequence number to dispatch
+        self._pending = deque()         # (seq, segment, is_wake) awaiting a worker
+        self._in_flight = {}            # seq -> (segment, started)
+        self._results = {}              # seq -> (segment, result | _SKIPPED)
+        self._cond = threading.Condition()
+        self._ready: queue.Queue = queue.Queue()
+        self.running = False
+        self.dropped = 0
+        self.timed_out = 0
+
+    # ── Producer side ──────────────────────────────────────
+    def submit(self, segment, is_wake: bool = False) -> int:
+        """Queue a segment for recognition; never blocks."""
+        with self._cond:
+            if len(self._pending) >= self.max_pending:
+                self._drop_one()
+            seq = next(self._seq)
+            self._pending.append((seq, segment, is_wake))
+            self._cond.notify()
+            return seq
+
+    def inject(self, segment, result) -> int:
+        """Queue an already-recognised result (e.g. a typed command); it is
+        dispatched in order behind every segment submitted before it."""
+        with self._cond:
+            seq = next(self._seq)
+            self._results[seq] = (segment, result)
+            self._release()
+            return seq
+
+    def _drop_one(self):
+        victim = next((item for item in self._pending if not item[2]), self._pending[0])
+        self._pending.remove(victim)
+        self.dropped += 1
+        self._results[victim[0]] = (victim[1], _SKIPPED)
+        self._on_drop(victim[1])
+        self._release()
+
+    # ── Workers ────────────────────────────────────────────
+    def _worker(self):
+        while True:
+            with self._cond:
+                while self.running and not self._pending:
+                    self._cond.wait()
+                if not self.running:
+                    return
+                seq, segment, _ = self._pending.popleft()
+                self._in_flight[seq] = (segment, time.monotonic())
+            try:
+                result = self._recognize(segment)
+            except Exception as e:
+                self._on_error(segment, e)
+                result = _SKIPPED
+            with self._cond:
+                if self._in_flight.pop(seq, None) is None:
+                    continue            # gave up on it already; too late to matter
+                self._results[seq] = (segment, _SKIPPED if result is None else result)
+                self._release()
+
+    # ── In-order release ───────────────────────────────────
+    def _release(self):
+        """Hand every result that is next in line to the dispatcher (lock held)."""
+        while self._next in self._results:
+            segment, result = self._results.pop(self._next)
+            if result is not _SKIPPED:
+                self._ready.put((segment, result))
+            self._next += 1
+
+    def _expire(self):
+        """Skip the head of the line if its recognition is hopelessly late."""
+        with self._cond:
+            item = self._in_flight.get(self._next)
+            if item is not None and time.monotonic() - item[1] > self.timeout:
+                del self._in_flight[self._next]
+                self.timed_out += 1
+                self._results[self._next] = (item[0], _SKIPPED)
+                self._release()
+
+    def _dispatcher(self):
+        while self.running:
+            try:
+                segment, result = self._ready.get(timeout=0.25)
+            except queue.Empty:
+                self._expire()
+                continue
+            try:
+                self._dispatch(segment, result)
+            except Exception as e:
+                self._on_error(segment, e)
+
+    # ── Lifecycle ──────────────────────────────────────────
+    def start(self):
+        self.running = True
+        for _ in range(self._workers):
+            threading.Thread(target=self._worker, daemon=True).start()
+        threading.Thread(target=self._dispatcher, daemon=True).start()
+
+    def stop(self):
+        with self._cond:
+            self.running = False
+            self._cond.notify_all()
+
+    def backlog(self) -> int:
+        with self._cond:
+            return len(self._pending) + len(self._in_flight)
@@ -0,0 +1,117 @@
+# ============================================================
+#  J.A.R.V.I.S  –  Spectrum Analyser
+#  Windowed FFTs over the shared capture stream, computed in
+#  batches on their own thread and folded into log-spaced
+#  bands with smoothing and peak hold.  The UI only ever reads
+#  the latest finished arrays.
+# ============================================================
+
+import threading
+
+import numpy as np
+
+from config import BLOCK_SIZE
+
+FFT_SIZE = 2048
+MIN_HZ = 60.0
+MAX_HZ = 12000.0
+FLOOR_DB = -80.0            # maps to an empty bar
+CEIL_DB = -10.0             # maps to a full bar
+RELEASE = 0.75              # per update; bars rise instantly, fall smoothly
+PEAK_HOLD = 12              # updates a peak marker stays put
+PEAK_FALL = 0.02            # then falls this much per update
+
+
+class SpectrumAnalyzer:
+    """Publishes ``bands`` and ``peaks`` (0–1 float32 arrays, low → high
+    frequency) for a capture stream.
+
+    Each update swaps in freshly computed arrays, so readers on another
+    thread always see a complete frame without locking.
+    """
+
+    def __init__(self, capture, bands: int = 50, hop: int = BLOCK_SIZE):
+        self.capture = capture
+        self.rate = capture.rate
+        self.n_bands = bands
+        self.hop = hop
+        self.bands = np.zeros(bands, dtype=np.float32)
+        self.peaks = np.zeros(bands, dtype=np.float32)
+        self.updates = 0
+        self._window = np.hanning(FFT_SIZE).astype(np.float32)
+        self._edges = self._band_edges(bands)
+        self._hold = np.zeros(bands, dtype=np.int32)
+        self._running = False
+        self._thread = None
+        # A restarted analyser gets a new generation; an older thread that
+        # hasn't noticed the stop yet can then no longer publish
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def _band_edges(self, bands: int):
+        """FFT bin ranges for log-spaced bands, each at least one bin wide."""
+        freqs = np.geomspace(MIN_HZ, min(MAX_HZ, self.rate / 2), bands + 1)
+        edges = np.round(freqs * FFT_SIZE / self.rate).astype(int)
+        edges = np.maximum(edges, 1)
+        for i in range(1, len(edges)):
+            edges[i] = max(edges[i], edges[i - 1] + 1)
+        return np.minimum(edges, FFT_SIZE // 2)
+
+    # ── Analysis ────────────────────────────────────────────
+    def analyse(self, samples):
+        """Band levels (0–1) for every full window in ``samples``, averaged."""
+        frames = np.lib.stride_tricks.sliding_window_view(samples, FFT_SIZE)[::self.hop]
+        power = np.abs(np.fft.rfft(frames * self._window, axis=1)) ** 2
+        power = power.mean(axis=0) / (FFT_SIZE * self._window.sum())
+        # Sum of power per band via a cumulative sum: one pass for all bands
+        cum = np.concatenate(([0.0], np.cumsum(power)))
+        band_power = (cum[self._edges[1:]] - cum[self._edges[:-1]]) / np.diff(self._edges)
+        db = 10.0 * np.log10(band_power + 1e-12)
+        return np.clip((db - FLOOR_DB) / (CEIL_DB - FLOOR_DB), 0.0, 1.0).astype(np.float32)
+
+    def _publish(self, level):
+        bands = np.maximum(level, self.bands * RELEASE)
+        peaks = self.peaks.copy()
+        rising = bands >= peaks
+        peaks[rising] = bands[rising]
+        self._hold[rising] = PEAK_HOLD
+        falling = ~rising & (self._hold <= 0)
+        peaks[falling] = np.maximum(peaks[falling] - PEAK_FALL, bands[falling])
+        self._hold[~rising] -= 1
+        self.bands, self.peaks = bands, peaks
+        self.updates += 1
+
+    def _run(self, generation: int):
+        reader = self.capture.reader(preroll=FFT_SIZE / self.rate)
+        tail = np.zeros(FFT_SIZE - self.hop, dtype=np.float32)
+        while self._generation == generation:
+            # Whatever has piled up since the last pass, analysed as one batch
+            frames = reader.read_frames(self.hop, 16, timeout=0.25)
+            if frames is None:
+                continue
+            samples = np.concatenate([tail, frames.ravel()])
+            tail = samples[-(FFT_SIZE - self.hop):]
+            level = self.analyse(samples)
+            with self._lock:
+                if self._generation != generation:
+                    return
+                self._publish(level)
+
+    # ── Lifecycle ──────────────────────────────────────────
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def start(self):
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
+            self._generation += 1
+            self._thread = threading.Thread(target=self._run, args=(self._generation,), daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        with self._lock:
+            self._running = False
+            self._generation += 1
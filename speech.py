@@ -0,0 +1,308 @@
+# ============================================================
+#  J.A.R.V.I.S  –  Speech Output
+#  Prioritised, cancellable utterance scheduler with barge-in,
+#  plus playback helpers for synthesized speech.
+# ============================================================
+
+import io
+import time
+import heapq
+import asyncio
+import itertools
+import threading
+
+import pygame
+
+from config import TTS_STREAM_FIRST_KB, TTS_STREAM_SEGMENT_KB
+
+
+# ── Priorities (lower plays first) ─────────────────────────
+PRIORITY_URGENT = 0     # direct replies to something the user just said
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2        # follow-up chatter that is fine to drop
+
+
+class Utterance:
+    """Handle for one line of speech, pending or playing."""
+
+    def __init__(self, text: str, priority: int, seq: int, trace=None):
+        self.text = text
+        self.priority = priority
+        self.seq = seq
+        self.trace = trace                  # latency trace of the request it answers
+        self.cancelled = False
+        self.stopped = threading.Event()    # set on cancel (and when finished)
+        self.done = threading.Event()       # set once it left the scheduler
+
+    def cancel(self):
+        """Drop it if still queued, or cut it off if it is playing."""
+        self.cancelled = True
+        self.stopped.set()
+
+    def wait(self, timeout=None) -> bool:
+        return self.done.wait(timeout)
+
+    def __lt__(self, other):
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+
+class SpeechScheduler:
+    """Priority queue of utterances for the single TTS worker.
+
+    Duplicate pending lines are coalesced into one handle, cancelled entries
+    are skipped lazily, and ``barge_in()`` silences whatever is playing and
+    drops everything still queued.
+    """
+
+    def __init__(self):
+        self._heap = []
+        self._pending = {}          # text -> Utterance (not yet playing)
+        self._current = None
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self.cut_off = 0            # lines silenced or dropped by barge_in()
+        self.merged = 0             # submits folded into an identical pending line
+
+    def submit(self, text: str, priority: int = PRIORITY_NORMAL, trace=None) -> Utterance:
+        with self._cond:
+            utt = self._pending.get(text)
+            if utt is not None and not utt.cancelled:
+                if priority < utt.priority:
+                    # Re-queue at the higher priority; the old heap slot is stale
+                    utt.cancel()
+                    trace = trace or utt.trace
+                else:
+                    self.merged += 1
+                    utt.trace = utt.trace or trace
+                    return utt
+            utt = Utterance(text, priority, next(self._seq), trace)
+            self._pending[text] = utt
+            heapq.heappush(self._heap, utt)
+            self._cond.notify()
+            return utt
+
+    def next(self, timeout=None):
+        """Block until an utterance is ready to play (None on timeout)."""
+        with self._cond:
+            while True:
+                while self._heap and self._heap[0].cancelled:
+                    stale = heapq.heappop(self._heap)
+                    if self._pending.get(stale.text) is stale:
+                        del self._pending[stale.text]
+                    stale.done.set()
+                if self._heap:
+                    utt = heapq.heappop(self._heap)
+                    del self._pending[utt.text]
+                    self._current = utt
+                    return utt
+                if not self._cond.wait(timeout):
+                    return None
+
+    def finish(self, utt: Utterance):
+        with self._cond:
+            if self._current is utt:
+                self._current = None
+        utt.stopped.set()
+        utt.done.set()
+
+    def barge_in(self):
+        """The user started talking: stop the current line, drop the backlog."""
+        with self._cond:
+            if self._current is not None and not self._current.cancelled:
+                self._current.cancel()
+                self.cut_off += 1
+            for utt in self._pending.values():
+                utt.cancel()
+            self.cut_off += len(self._pending)
+            self._pending.clear()
+
+    def pending(self) -> int:
+        with self._cond:
+            return len(self._pending)
+
+    def speaking(self) -> bool:
+        return self._current is not None
+
+
+def _frame_cut(buf: bytearray, header: bytes, start: int = 1) -> int:
+    """Offset of the last MP3 frame header in ``buf`` (0 if none after ``start``).
+
+    Edge TTS emits constant-bitrate MPEG audio, so every frame begins with the
+    same sync + bitrate bytes as the first one; cutting there gives segments
+    the decoder can open on their own.
+    """
+    pos = len(buf)
+    while True:
+        pos = buf.rfind(header[:2], start, pos)
+        if pos <= 0:
+            return 0
+        if pos + 2 < len(buf) and (buf[pos + 2] & 0xF0) == (header[2] & 0xF0):
+            return pos
+
+
+# Layer III bitrates (kbit/s) by bitrate index: MPEG-1, then MPEG-2 / 2.5
+_MP3_KBPS = (
+    (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+)
+
+
+def mp3_length(data: bytes):
+    """Seconds of audio in a constant-bitrate MP3 (as Edge TTS emits), from
+    the bitrate in its first frame header; None if no header is found."""
+    pos = data.find(b"\xff")
+    while 0 <= pos < len(data) - 2:
+        b1, b2 = data[pos + 1], data[pos + 2]
+        version, layer, index = (b1 >> 3) & 3, (b1 >> 1) & 3, b2 >> 4
+        if (b1 & 0xE0) == 0xE0 and version != 1 and layer == 1 and 0 < index < 15:
+            kbps = _MP3_KBPS[0 if version == 3 else 1][index]
+            return (len(data) - pos) * 8 / (kbps * 1000)
+        pos = data.find(b"\xff", pos + 1)
+    return None
+
+
+class StreamingPlayer:
+    """Plays an MP3 byte stream while it is still being synthesized.
+
+    Bytes arrive through ``feed()``; as soon as enough for a short first
+    segment is buffered it is decoded and played, and later (larger)
+    segments are chained onto the same mixer channel with ``Channel.queue``.
+    The end time of every segment handed to the channel is known, so
+    ``finish()`` sleeps on the stop event until the next one is due
+    instead of polling the mixer.
+    """
+
+    def __init__(self, first_bytes: int = TTS_STREAM_FIRST_KB * 1024,
+                 segment_bytes: int = TTS_STREAM_SEGMENT_KB * 1024, on_start=None):
+        self.first_bytes = first_bytes
+        self.segment_bytes = segment_bytes
+        self.on_start = on_start    # called once, when the first segment starts playing
+        self.started = False
+        self._buf = bytearray()
+        self._header = b""
+        self._pending = []          # decoded segments waiting for the channel
+        self._channel = None
+        self._ends = []             # monotonic end times of segments on the channel
+        self._stopped = False
+
+    def feed(self, data: bytes):
+        if self._stopped:
+            return
+        if not self._header and len(data) >= 3:
+            self._header = bytes(data[:3])
+        self._buf += data
+        threshold = self.segment_bytes if self.started else self.first_bytes
+        if len(self._buf) >= threshold:
+            self._flush(final=False)
+        self._pump()
+
+    def _flush(self, final: bool):
+        if final:
+            cut = len(self._buf)
+        else:
+            cut = _frame_cut(self._buf, self._header)
+        if cut <= 0:
+            return
+        segment = bytes(self._buf[:cut])
+        del self._buf[:cut]
+        try:
+            self._pending.append(pygame.mixer.Sound(file=io.BytesIO(segment)))
+        except pygame.error:
+            pass
+
+    def _pump(self):
+        """Start playback or top up the channel's one-slot queue."""
+        if not self._pending:
+            return
+        now = time.monotonic()
+        self._ends = [t for t in self._ends if t > now]
+        if self._channel is None:
+            sound = self._pending.pop(0)
+            self._channel = sound.play()
+            self.started = self._channel is not None
+            if self.started:
+                self._ends = [now + sound.get_length()]
+                if self.on_start is not None:
+                    self.on_start()
+        elif self._channel.get_queue() is None:
+            sound = self._pending.pop(0)
+            if self._channel.get_busy():
+                self._channel.queue(sound)
+                self._ends.append((self._ends[-1] if self._ends else now) + sound.get_length())
+            else:
+                self._channel.play(sound)
+                self._ends = [now + sound.get_length()]
+
+    def busy(self) -> bool:
+        return bool(self._pending) or (
+            self._channel is not None and self._channel.get_busy())
+
+    async def finish(self, stopped: threading.Event = None):
+        """Flush what's left of the stream and wait for playback to end
+        (or for ``stopped`` to be set, which cuts playback off).
+        """
+        if self._buf:
+            self._flush(final=True)
+        while self.busy():
+            self._pump()
+            # Wake when the channel's queue slot frees up (to top it up) or,
+            # with nothing left to queue, when the last segment ends
+            now = time.monotonic()
+            ends = [t for t in self._ends if t > now]
+            if not ends:
+                wait = 0.02         # the mixer runs a little behind our clock
+            else:
+                wait = (ends[0] if self._pending else ends[-1]) - now + 0.005
+            if stopped is None:
+                await asyncio.sleep(wait)
+            elif await asyncio.to_thread(stopped.wait, wait):
+                self.stop()
+                return
+
+    def stop(self):
+        if self._stopped:
+            return
+        self._stopped = True
+        self._pending.clear()
+        self._ends.clear()
+        self._buf.clear()
+        if self._channel is not None:
+            self._channel.stop()
+
+
+async def play_sound(sound, stopped: threading.Event):
+    """Play a decoded clip until it ends or ``stopped`` is set.
+
+    The clip length is known up front, so instead of polling the mixer we
+    wait on the utterance's stop event with that length as the timeout.
+    """
+    channel = sound.play()
+    if channel is None:
+        return
+    interrupted = await asyncio.to_thread(stopped.wait, sound.get_length() + 0.05)
+    if interrupted:
+        channel.stop()
+
+
+async def play_music(source, stopped: threading.Event):
+    """Fallback for a clip the mixer won't decode as a Sound: stream it
+    through ``mixer.music`` until it ends or ``stopped`` is set.
+
+    As with ``play_sound`` this waits on the stop event, for the length the
+    MP3's frame header implies, and only checks the mixer again if the
+    estimate ran short.
+    """
+    if hasattr(source, "read"):
+        data = source.read()
+        source = io.BytesIO(data)
+    else:
+        with open(source, "rb") as f:
+            data = f.read()
+    pygame.mixer.music.load(source)
+    pygame.mixer.music.play()
+    wait = (mp3_length(data) or 0.0) + 0.05
+    while not await asyncio.to_thread(stopped.wait, wait):
+        if not pygame.mixer.music.get_busy():
+            break
+        wait = 0.1
+    pygame.mixer.music.stop()
@@ -0,0 +1,77 @@
+# ============================================================
+#  J.A.R.V.I.S  –  Startup Profile
+#  Timestamps for every import and init step on the way to
+#  "window visible" and "wake word listening", printed once
+#  both are reached when run with --startup-profile.  Costs
+#  nothing when not enabled.
+# ============================================================
+
+import sys
+import time
+import threading
+from contextlib import contextmanager
+
+_T0 = time.perf_counter()       # imported first thing by the entry point
+_steps = []                     # (start s, duration s or None, thread, label)
+_lock = threading.Lock()
+_enabled = False
+_report_after = ()
+_reported = False
+
+
+def enable(report_after=("window visible", "wake word listening")):
+    """Start recording; print the table once every label in ``report_after`` is marked."""
+    global _enabled, _report_after
+    _enabled = True
+    _report_after = tuple(report_after)
+
+
+@contextmanager
+def step(label: str):
+    """Time an import or init step."""
+    if not _enabled:
+        yield
+        return
+    t = time.perf_counter()
+    try:
+        yield
+    finally:
+        _record(t - _T0, time.perf_counter() - t, label)
+
+
+def mark(label: str):
+    """A milestone (recorded once, the first time it's reached)."""
+    if not _enabled:
+        return
+    now = time.perf_counter() - _T0
+    with _lock:
+        if any(s[3] == label for s in _steps):
+            return
+        _steps.append((now, None, threading.current_thread().name, label))
+    _maybe_report()
+
+
+def _record(start: float, duration, label: str):
+    with _lock:
+        _steps.append((start, duration, threading.current_thread().name, label))
+
+
+def _maybe_report():
+    global _reported
+    with _lock:
+        done = {s[3] for s in _steps if s[1] is None}
+        if _reported or not all(label in done for label in _report_after):
+            return
+        _reported = True
+    report()
+
+
+def report(file=None):
+    file = file or sys.stdout
+    with _lock:
+        steps = sorted(_steps)
+    print(f"{'at ms':>8s} {'took ms':>8s}  {'thread':14s} step", file=file)
+    for start, duration, thread, label in steps:
+        took = f"{duration * 1000:8.0f}" if duration is not None else f"{'—':>8s}"
+        print(f"{start * 1000:8.0f} {took}  {thread[:14]:14s} {label}", file=file)
+    file.flush()
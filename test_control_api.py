@@ -0,0 +1,134 @@
+# ============================================================
+#  Tests for the control API over a real loopback socket (an
+#  ephemeral port) with a stub engine in place of JarvisCore:
+#  python -m pytest -q test_control_api.py
+# ============================================================
+
+import os
+import socket
+import threading
+
+import pytest
+
+from control_api import ControlServer, ensure_token
+from intents import Intent
+from jarvisctl import ControlClient
+from speech import Utterance
+
+TOKEN = "test-token"
+
+
+class StubCore:
+    """The three calls the server makes, answered on other threads like
+    the real dispatcher and TTS worker would."""
+
+    def __init__(self):
+        self.delays = {}            # text -> seconds before it is "handled"
+        self.spoken = []
+        self.speak_delay = 0.0
+
+    def submit_text(self, text, on_done):
+        intent = Intent("echo", {"text": text}, 1.0, True, text)
+        threading.Timer(self.delays.get(text, 0.0), on_done, (intent, None)).start()
+        return True
+
+    def speak(self, text, priority):
+        utt = Utterance(text, priority, len(self.spoken))
+        self.spoken.append(text)
+        if self.speak_delay is not None:
+            threading.Timer(self.speak_delay, utt.done.set).start()
+        return utt
+
+    def status(self, latency=False):
+        return {"running": True}
+
+
+@pytest.fixture
+def core():
+    return StubCore()
+
+
+@pytest.fixture
+def server(core):
+    server = ControlServer(core, host="127.0.0.1", port=0, token=TOKEN, timeout=2.0)
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def client(server):
+    client = ControlClient("127.0.0.1", server.port, TOKEN, timeout=5.0)
+    yield client
+    client.close()
+
+
+def test_requests_without_the_right_token_are_refused(server, core):
+    for token in ("", "wrong", "test-tokeN"):
+        bad = ControlClient("127.0.0.1", server.port, token, timeout=5.0)
+        reply = bad.call("speak", text="Hello sir.")
+        bad.close()
+        assert reply == {"id": 1, "ok": False, "error": "bad or missing token"}
+    # A non-string token is refused the same way, not a server error
+    raw = ControlClient("127.0.0.1", server.port, "", timeout=5.0)
+    raw.send("status", token=12345)
+    assert raw.recv()["error"] == "bad or missing token"
+    raw.close()
+    assert core.spoken == []
+
+
+def test_a_first_line_that_is_not_json_closes_the_connection(server):
+    sock = socket.create_connection(("127.0.0.1", server.port), timeout=5.0)
+    sock.sendall(b"POST / HTTP/1.1\r\nHost: localhost\r\n\r\n")
+    assert sock.recv(1024) == b""       # closed, nothing answered
+    sock.close()
+
+
+def test_a_later_malformed_line_gets_an_error_reply(client):
+    assert client.call("status")["ok"]
+    client._sock.sendall(b"{not json\n[1, 2]\n")
+    assert client.recv() == {"id": None, "ok": False, "error": "request is not valid JSON"}
+    assert client.recv() == {"id": None, "ok": False, "error": "request must be a JSON object"}
+    assert client.call("status")["ok"]  # still served
+
+
+def test_pipelined_replies_come_back_in_request_order(client, core):
+    core.delays["slow"] = 0.3
+    ids = [client.send("text", text="slow"), client.send("status"),
+           client.send("text", text="fast"), client.send("nonsense")]
+    replies = [client.recv() for _ in ids]
+    assert [r["id"] for r in replies] == ids
+    assert replies[0]["slots"] == {"text": "slow"} and replies[2]["slots"] == {"text": "fast"}
+    assert replies[1]["ok"] and not replies[3]["ok"]
+
+
+def test_speak_with_wait_replies_once_spoken(client, core):
+    core.speak_delay = 0.2
+    assert client.call("speak", text="Hello sir.") == {"id": 1, "ok": True, "queued": True}
+    assert client.call("speak", text="Hello again.", wait=True) == {
+        "id": 2, "ok": True, "spoken": True}
+
+
+def test_speak_with_wait_times_out(core):
+    core.speak_delay = None             # never finishes
+    server = ControlServer(core, host="127.0.0.1", port=0, token=TOKEN, timeout=0.2)
+    server.start()
+    try:
+        client = ControlClient("127.0.0.1", server.port, TOKEN, timeout=5.0)
+        reply = client.call("speak", text="Hello sir.", wait=True)
+        client.close()
+        assert not reply["ok"] and reply["error"].startswith("timed out")
+    finally:
+        server.stop()
+
+
+def test_token_is_generated_once_and_kept_private(tmp_path, core):
+    path = str(tmp_path / "control_api.token")
+    server = ControlServer(core, host="127.0.0.1", port=0, token="", token_path=path)
+    server.start()
+    server.stop()
+    assert server.token and ensure_token(path) == server.token
+    if os.name == "posix":
+        assert os.stat(path).st_mode & 0o077 == 0
+    with open(path, encoding="utf-8") as f:
+        assert f.read().strip() == server.token
@@ -0,0 +1,96 @@
+# ============================================================
+#  Behaviour tests for the intent registry and Jarvis's own
+#  command table:  python -m pytest -q test_intents.py
+#  (bench_intents.py only measures matching speed)
+# ============================================================
+
+import os
+import re
+import inspect
+
+import pytest
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from intents import CommandRegistry
+
+
+def test_slot_captures_the_rest_of_the_phrase():
+    registry = CommandRegistry("jarvis")
+    registry.register("play", ["play {song_name}"], lambda song_name: None)
+    registry.compile()
+    intent = registry.match("jarvis play back in black")
+    assert intent.name == "play"
+    assert intent.slots == {"song_name": "back in black"}
+    assert intent.addressed
+
+
+def test_wake_word_alone_falls_back():
+    greet = object()
+    registry = CommandRegistry("jarvis", fallback=greet)
+    registry.register("open_home", "open home")
+    registry.compile()
+    intent = registry.match("jarvis")
+    assert intent.name is None and intent.handler is greet
+    assert registry.match("good morning") is None
+
+
+# ── Jarvis's command table ─────────────────────────────────
+@pytest.fixture
+def core():
+    from jarvis_core import JarvisCore
+    # Only the command table is exercised: no audio, mixer or threads
+    return object.__new__(JarvisCore)
+
+
+def example(pattern: str) -> str:
+    """A phrase matching ``pattern``, with every ``{slot}`` filled in."""
+    return "jarvis " + re.sub(r"\{\w+\}", "thunderstruck", pattern)
+
+
+def test_every_command_pattern_fits_its_handler(core):
+    commands = core._register_commands()
+    for name, pattern in commands._patterns:
+        intent = commands.match(example(pattern))
+        assert intent is not None and intent.name == name, pattern
+        # _handle_phrase calls handler(**slots): slot names must be parameters
+        inspect.signature(intent.handler).bind(**intent.slots)
+
+
+def test_play_command_reaches_play_song(core):
+    played = []
+    core.play_song = lambda song_name: played.append(song_name)
+    commands = core._register_commands()
+    intent = commands.match("jarvis play highway to hell")
+    intent.handler(**intent.slots)
+    assert played == ["highway to hell"]
+
+
+def handled(core, alternatives, wake=False):
+    """Run ``alternatives`` through ``_handle_phrase``; return what was said."""
+    from jarvis_core import TypedPhrase
+    from tracing import Tracer
+    said = []
+    core._on_log = core._on_wake = lambda *a: None
+    core.tracer = Tracer(enabled=False)
+    core.speak = lambda text, *a: said.append(text)
+    core.barge_in = lambda: None
+    core._followup_until = 0.0
+    core._commands = core._register_commands()
+    phrase = TypedPhrase(alternatives[0][0], 0.0, core.tracer.begin())
+    phrase.wake = wake
+    core._handle_phrase(phrase, alternatives)
+    return said
+
+
+def test_unsure_command_is_asked_again(core):
+    from phrases import NOT_CAUGHT
+    assert handled(core, [("jarvis open home", 0.3)]) == [NOT_CAUGHT]
+
+
+def test_unsure_wake_word_still_greets(core):
+    from phrases import GREETINGS
+    said = handled(core, [("jarvis", 0.45)])
+    assert len(said) == 1 and said[0] in GREETINGS
+    said = handled(core, [("darvis", 0.3)], wake=True)    # the spotter heard it
+    assert len(said) == 1 and said[0] in GREETINGS
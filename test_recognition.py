@@ -0,0 +1,138 @@
+# ============================================================
+#  Tests for the recognition pipeline with a stub recogniser:
+#  python -m pytest -q test_recognition.py
+# ============================================================
+
+import time
+import threading
+
+from recognition import RecognitionPipeline
+
+
+class Dispatched(list):
+    """Records ``dispatch(segment, result)`` calls and waits for them."""
+
+    def __call__(self, segment, result):
+        self.append((segment, result))
+
+    def wait_for(self, n: int, timeout: float = 5.0) -> bool:
+        deadline = time.monotonic() + timeout
+        while len(self) < n and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return len(self) >= n
+
+
+def gated(gates):
+    """A recogniser that returns ``segment.upper()`` once its gate opens."""
+    def recognize(segment):
+        gates[segment].wait()
+        return segment.upper()
+    return recognize
+
+
+def test_results_are_dispatched_in_capture_order():
+    gates = {s: threading.Event() for s in "abc"}
+    out = Dispatched()
+    pipeline = RecognitionPipeline(gated(gates), out, workers=3)
+    pipeline.start()
+    try:
+        for s in "abc":
+            pipeline.submit(s)
+        for s in "cb":                  # the later phrases finish first
+            gates[s].set()
+        time.sleep(0.1)
+        assert out == []                # held back behind "a"
+        gates["a"].set()
+        assert out.wait_for(3)
+        assert out == [("a", "A"), ("b", "B"), ("c", "C")]
+    finally:
+        pipeline.stop()
+
+
+def test_failed_and_empty_results_are_skipped():
+    errors = []
+
+    def recognize(segment):
+        if segment == "noise":
+            return None
+        if segment == "broken":
+            raise ConnectionError("offline")
+        return segment
+
+    out = Dispatched()
+    pipeline = RecognitionPipeline(recognize, out, workers=2,
+                                   on_error=lambda seg, e: errors.append(seg))
+    pipeline.start()
+    try:
+        for s in ("one", "noise", "broken", "two"):
+            pipeline.submit(s)
+        assert out.wait_for(2)
+        time.sleep(0.05)
+        assert out == [("one", "one"), ("two", "two")]
+        assert errors == ["broken"]
+    finally:
+        pipeline.stop()
+
+
+def test_full_queue_drops_the_oldest_non_wake_phrase():
+    dropped = []
+    out = Dispatched()
+    pipeline = RecognitionPipeline(lambda s: s, out, max_pending=2,
+                                   on_drop=dropped.append)
+    # Not started yet: nothing leaves the queue
+    pipeline.submit("jarvis", is_wake=True)
+    pipeline.submit("chatter")
+    pipeline.submit("more chatter")         # full: "chatter" goes
+    pipeline.submit("jarvis again", is_wake=True)   # full: "more chatter" goes
+    pipeline.submit("jarvis once more", is_wake=True)  # all wake: the oldest goes
+    assert dropped == ["chatter", "more chatter", "jarvis"]
+    assert pipeline.dropped == 3 and pipeline.backlog() == 2
+
+    pipeline.start()
+    try:
+        assert out.wait_for(2)
+        assert [s for s, _ in out] == ["jarvis again", "jarvis once more"]
+    finally:
+        pipeline.stop()
+
+
+def test_a_hung_request_times_out_and_the_rest_flow_on():
+    hung = threading.Event()
+
+    def recognize(segment):
+        if segment == "slow":
+            hung.wait()
+        return segment
+
+    out = Dispatched()
+    pipeline = RecognitionPipeline(recognize, out, workers=2, timeout=0.2)
+    pipeline.start()
+    try:
+        pipeline.submit("slow")
+        pipeline.submit("fast")
+        assert out.wait_for(1, timeout=3.0)
+        assert out == [("fast", "fast")]
+        assert pipeline.timed_out == 1
+        hung.set()                      # the late answer is thrown away
+        time.sleep(0.1)
+        assert out == [("fast", "fast")]
+    finally:
+        hung.set()
+        pipeline.stop()
+
+
+def test_injected_results_wait_for_earlier_phrases():
+    gates = {"spoken": threading.Event()}
+    out = Dispatched()
+    pipeline = RecognitionPipeline(gated(gates), out)
+    pipeline.start()
+    try:
+        pipeline.submit("spoken")
+        pipeline.inject("typed", "typed")
+        time.sleep(0.1)
+        assert out == []
+        gates["spoken"].set()
+        assert out.wait_for(2)
+        assert out == [("spoken", "SPOKEN"), ("typed", "typed")]
+    finally:
+        pipeline.stop()
@@ -0,0 +1,81 @@
+# ============================================================
+#  Tests for the UI event bus (no Tk needed: drain() is just
+#  called by hand):  python -m pytest -q test_ui_events.py
+# ============================================================
+
+import threading
+
+import activity_log
+from ui_events import UIEventBus
+
+
+def recorder(bus, kind):
+    seen = []
+    bus.on(kind, seen.append)
+    return seen
+
+
+def test_only_the_newest_post_per_key_is_delivered():
+    bus = UIEventBus()
+    status = recorder(bus, "status")
+    bus.post("status", "listening", key="mic")
+    bus.post("status", "muted", key="mic")
+    bus.post("status", "online", key="net")
+    bus.drain()
+    assert status == ["muted", "online"]
+    assert bus.posted == 3 and bus.coalesced == 1 and bus.delivered == 2
+
+
+def test_a_repeat_of_what_is_shown_is_dropped_until_forgotten():
+    bus = UIEventBus()
+    status = recorder(bus, "status")
+    for _ in range(2):
+        bus.post("status", "listening", key="mic")
+        bus.drain()
+    assert status == ["listening"]
+    bus.forget("status")
+    bus.post("status", "listening", key="mic")
+    bus.drain()
+    assert status == ["listening", "listening"]
+
+
+def test_stream_arrives_in_order_as_one_batch():
+    bus = UIEventBus(stream_limit=3)
+    batches = recorder(bus, "log")
+    for i in range(5):
+        bus.append("log", i)
+    bus.drain()
+    bus.drain()                         # nothing new: no empty batch
+    assert batches == [[2, 3, 4]]       # the oldest fell off the bounded stream
+
+
+def test_posts_from_many_threads_all_reach_one_drain():
+    bus = UIEventBus(stream_limit=1000)
+    batches = recorder(bus, "log")
+
+    def worker(n):
+        for i in range(100):
+            bus.append("log", (n, i))
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    bus.drain()
+    assert len(batches) == 1 and len(batches[0]) == 400
+    for n in range(4):                  # each thread's lines stay in order
+        assert [i for m, i in batches[0] if m == n] == list(range(100))
+
+
+def test_a_failing_handler_is_logged_and_the_drain_goes_on(monkeypatch):
+    logged = []
+    monkeypatch.setattr(activity_log, "record", lambda tag, msg: logged.append((tag, msg)))
+    bus = UIEventBus()
+    bus.on("broken", lambda payload: 1 / 0)
+    status = recorder(bus, "status")
+    bus.post("broken", "x")
+    bus.post("status", "ok")
+    bus.drain()
+    assert status == ["ok"]
+    assert logged == [("error", "UI event 'broken' failed: division by zero")]
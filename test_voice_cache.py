@@ -0,0 +1,146 @@
+# ============================================================
+#  Tests for the on-disk voice cache, the decoded-clip LRU and
+#  the packed voice bank:  python -m pytest -q test_voice_cache.py
+# ============================================================
+
+import os
+import time
+import threading
+
+from voice_cache import (
+    VoiceCache, ClipCache, VoiceBank, write_bank, BANK_NAME, PARTIAL_GRACE,
+)
+
+
+def store(cache, text, size=10, pinned=False):
+    """Write a clip of ``size`` bytes for ``text`` and record it."""
+    with open(cache.path_for(text), "wb") as f:
+        f.write(b"x" * size)
+    cache.add(text, pinned=pinned)
+
+
+# ── VoiceCache ─────────────────────────────────────────────
+def test_evicts_least_recently_used(tmp_path):
+    cache = VoiceCache(str(tmp_path), max_entries=2)
+    store(cache, "one")
+    store(cache, "two")
+    cache._entries[cache.key("one")]["last_used"] += 1    # "one" used after "two"
+    store(cache, "three")
+    assert cache.contains("one") and cache.contains("three")
+    assert not cache.contains("two")
+    assert not os.path.exists(cache.path_for("two"))
+    assert cache.evictions == 1
+
+
+def test_pinned_clips_are_never_evicted(tmp_path):
+    cache = VoiceCache(str(tmp_path), max_entries=1)
+    store(cache, "greeting", pinned=True)
+    store(cache, "reply")
+    store(cache, "another reply")
+    assert cache.contains("greeting")
+    assert not cache.contains("reply")
+
+
+def test_oversize_clip_survives_its_own_add(tmp_path):
+    cache = VoiceCache(str(tmp_path), max_bytes=100)
+    store(cache, "long answer", size=500)
+    assert cache.lookup("long answer") == cache.path_for("long answer")
+    store(cache, "short answer", size=50)
+    assert not cache.contains("long answer")
+
+
+def test_manifest_survives_a_restart(tmp_path):
+    cache = VoiceCache(str(tmp_path))
+    store(cache, "hello sir", pinned=True)
+    again = VoiceCache(str(tmp_path))
+    assert again.lookup("hello sir") is not None
+    assert again._entries[again.key("hello sir")]["pinned"]
+
+
+def test_gc_removes_orphans_but_not_fresh_partials(tmp_path):
+    cache = VoiceCache(str(tmp_path))
+    store(cache, "kept")
+    orphan = os.path.join(str(tmp_path), "jarvis_0123456789abcdef0123.mp3")
+    open(orphan, "wb").close()
+    stale = cache.partial_path("old")
+    old = time.time() - PARTIAL_GRACE - 60
+    os.utime(stale, (old, old))
+    fresh = cache.partial_path("being written")
+    os.remove(cache.path_for("kept"))              # manifest entry without a file
+
+    assert cache.gc() == 2
+    assert not os.path.exists(orphan) and not os.path.exists(stale)
+    assert os.path.exists(fresh)
+    assert not cache.contains("kept") and cache.stats()["entries"] == 0
+
+
+def test_partial_paths_are_unique(tmp_path):
+    cache = VoiceCache(str(tmp_path))
+    assert cache.partial_path("same") != cache.partial_path("same")
+
+
+# ── ClipCache ──────────────────────────────────────────────
+def test_clip_cache_counts_bytes_once_per_key():
+    clips = ClipCache(bytes, len, budget_bytes=100)
+    clips.put("a", b"x" * 30)
+    clips.put("a", b"x" * 30)
+    assert clips.used_bytes == 30
+
+
+def test_clip_cache_evicts_unpinned_to_budget():
+    clips = ClipCache(bytes, len, budget_bytes=100)
+    clips.preload([("pinned", b"p" * 40)])
+    for key in "abc":
+        clips.put(key, b"x" * 30)
+    assert clips.used_bytes <= 100
+    assert clips.get("pinned") is not None
+    assert clips.get("a") is None and clips.get("c") is not None
+
+
+def test_clip_cache_concurrent_decode_is_counted_once():
+    barrier = threading.Barrier(4)
+
+    def slow_loader(source):
+        barrier.wait()                  # every thread decodes before any stores
+        return bytes(source)
+
+    clips = ClipCache(slow_loader, len, budget_bytes=1000)
+    threads = [threading.Thread(target=clips.put, args=("k", b"x" * 100)) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert clips.used_bytes == 100 and clips.stats()["clips"] == 1
+
+
+def test_clip_larger_than_budget_is_returned_but_not_kept():
+    clips = ClipCache(bytes, len, budget_bytes=10)
+    assert clips.put("big", b"x" * 50) == b"x" * 50
+    assert clips.used_bytes == 0
+
+
+# ── Voice bank ─────────────────────────────────────────────
+def test_bank_round_trip(tmp_path):
+    sources = {}
+    for key, data in [("a" * 20, b"first clip"), ("b" * 20, b"second")]:
+        path = os.path.join(str(tmp_path), key + ".mp3")
+        with open(path, "wb") as f:
+            f.write(data)
+        sources[key] = (path, data)
+
+    bank_path = os.path.join(str(tmp_path), BANK_NAME)
+    assert write_bank(bank_path, [(k, p) for k, (p, _) in sources.items()]) == 2
+    bank = VoiceBank.open_first(str(tmp_path / "missing"), str(tmp_path))
+    try:
+        assert len(bank) == 2
+        for key, (_, data) in sources.items():
+            assert key in bank
+            assert bank.open(key).read() == data
+        assert bank.open("c" * 20) is None
+    finally:
+        bank.close()
+
+
+def test_open_first_skips_files_that_are_not_banks(tmp_path):
+    (tmp_path / BANK_NAME).write_bytes(b"not a bank at all")
+    assert VoiceBank.open_first(str(tmp_path)) is None
@@ -0,0 +1,91 @@
+# ============================================================
+#  Tests for the pre-synthesis pipeline, driven by the local
+#  FakeSynthesizer:  python -m pytest -q test_voice_synth.py
+# ============================================================
+
+import os
+import time
+import asyncio
+
+import pytest
+
+from voice_cache import VoiceCache
+from voice_synth import FakeSynthesizer, synthesize_all, synthesize_to_cache, stream_to_cache
+
+PHRASES = [f"Line number {i}, sir." for i in range(12)]
+
+
+def leftovers(cache):
+    return [n for n in os.listdir(cache.cache_dir) if n.endswith(".part")]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return VoiceCache(str(tmp_path))
+
+
+def test_concurrency_is_capped(cache):
+    synth = FakeSynthesizer(latency=0.02, jitter=0.01, seed=1)
+    failed = asyncio.run(synthesize_all(PHRASES, cache, synth, concurrency=3))
+    assert failed == []
+    assert synth.peak_in_flight == 3
+    assert all(cache.contains(p) for p in PHRASES)
+
+
+def test_failures_are_retried(cache):
+    synth = FakeSynthesizer(latency=0.0, fail_rate=0.4, seed=7)
+    failed = asyncio.run(synthesize_all(PHRASES, cache, synth, retries=6, backoff=0.0))
+    assert failed == []
+    assert synth.calls > len(PHRASES)
+    assert leftovers(cache) == []
+
+
+def test_backoff_doubles_between_attempts(cache):
+    synth = FakeSynthesizer(latency=0.0, fail_rate=1.0)
+    t0 = time.perf_counter()
+    with pytest.raises(ConnectionError):
+        asyncio.run(synthesize_to_cache("hello", cache, synth, retries=2, backoff=0.05))
+    # 0.05 + 0.10, each within ±20 % jitter
+    assert time.perf_counter() - t0 >= 0.15 * 0.8
+    assert synth.calls == 3
+
+
+def test_giving_up_leaves_no_partial_files(cache):
+    synth = FakeSynthesizer(latency=0.0, fail_rate=1.0)
+    failed = asyncio.run(synthesize_all(PHRASES[:4], cache, synth, retries=1, backoff=0.0))
+    assert [p for p, _ in failed] == PHRASES[:4]
+    assert all(isinstance(e, ConnectionError) for _, e in failed)
+    assert synth.calls == 8
+    assert leftovers(cache) == []
+    assert not any(cache.contains(p) for p in PHRASES[:4])
+
+
+def test_progress_reports_every_phrase(cache):
+    calls = []
+    synth = FakeSynthesizer(latency=0.0)
+    asyncio.run(synthesize_all(PHRASES + PHRASES[:3], cache, synth,
+                               on_progress=lambda *a: calls.append(a)))
+    assert [done for done, _, _, _ in calls] == list(range(1, len(PHRASES) + 1))
+    assert {total for _, total, _, _ in calls} == {len(PHRASES)}     # duplicates dropped
+    assert sorted(p for _, _, p, _ in calls) == sorted(PHRASES)
+    assert all(error is None for *_, error in calls)
+
+
+def test_stream_hands_out_chunks_and_caches_the_clip(cache):
+    synth = FakeSynthesizer(latency=0.0, payload=b"0123456789" * 10)
+    chunks = []
+    path = asyncio.run(stream_to_cache("streamed", cache, synth.stream, on_chunk=chunks.append))
+    assert len(chunks) > 1
+    with open(path, "rb") as f:
+        assert f.read() == b"".join(chunks) == synth.payload
+    assert cache.contains("streamed") and leftovers(cache) == []
+
+
+def test_broken_stream_leaves_nothing_behind(cache):
+    async def broken(text):
+        yield b"first"
+        raise ConnectionError("dropped")
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(stream_to_cache("cut off", cache, broken))
+    assert not cache.contains("cut off") and leftovers(cache) == []
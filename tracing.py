@@ -0,0 +1,172 @@
+# ============================================================
+#  J.A.R.V.I.S  –  Latency Tracing
+#  Stamps each voice interaction with monotonic-clock spans
+#  (capture → recognition → dispatch → handler → synthesis →
+#  first audio) and keeps a rolling window of samples per stage
+#  for p50/p95/p99.  Recording a span is one clock read and a
+#  deque append, so it stays on all the time.
+# ============================================================
+
+import os
+import json
+import time
+import threading
+from collections import deque
+from contextlib import contextmanager
+
+import numpy as np
+
+from config import TRACE_ENABLED, TRACE_WINDOW
+
+_now = time.perf_counter_ns
+
+# Report order: roughly the order an interaction goes through them
+STAGES = (
+    "endpoint",     # last speech frame → phrase cut by the VAD
+    "queue",        # phrase cut → a recogniser worker picked it up
+    "recognize",    # cloud recognition round trip
+    "reorder",      # recognised → dispatched (waiting on earlier phrases)
+    "intent",       # n-best → intent match
+    "handler",      # the command itself (includes the spans below)
+    "spotify",      # Spotify track search
+    "tts_queue",    # reply queued → TTS worker picked it up
+    "synthesis",    # picked up → audio ready (cache, bank or network)
+    "first_audio",  # last speech frame → first syllable of the reply
+)
+
+
+class Trace:
+    """One interaction, carried along with the phrase and its first reply."""
+
+    __slots__ = ("_tracer", "start", "_stamps", "spoken", "done")
+
+    def __init__(self, tracer, start: int):
+        self._tracer = tracer
+        self.start = start
+        self._stamps = {}
+        self.spoken = False         # first reply already claimed
+        self.done = False
+
+    def stamp(self, name: str):
+        self._stamps[name] = _now()
+
+    def since(self, stage: str, name: str):
+        """Record the time since ``stamp(name)`` as ``stage``."""
+        t = self._stamps.get(name)
+        if t is not None:
+            self._tracer.record(stage, _now() - t)
+
+    @contextmanager
+    def span(self, stage: str):
+        t = _now()
+        try:
+            yield
+        finally:
+            self._tracer.record(stage, _now() - t)
+
+    def first_audio(self):
+        """The reply just started playing: close out the interaction."""
+        if self.done:
+            return
+        self.done = True
+        now = _now()
+        picked = self._stamps.get("picked")
+        if picked is not None:
+            self._tracer.record("synthesis", now - picked)
+        self._tracer.record("first_audio", now - self.start)
+
+
+class Tracer:
+    """Rolling per-stage latency samples (the last ``window`` of each)."""
+
+    def __init__(self, window: int = TRACE_WINDOW, enabled: bool = TRACE_ENABLED):
+        self.enabled = enabled
+        self.window = window
+        self._samples = {}
+        self._local = threading.local()
+        self.traces = 0
+
+    def begin(self, ago: float = 0.0) -> Trace:
+        """Start an interaction that began ``ago`` seconds before now."""
+        self.traces += 1
+        return Trace(self, _now() - int(ago * 1e9))
+
+    def record(self, stage: str, ns: int):
+        if not self.enabled:
+            return
+        samples = self._samples.get(stage)
+        if samples is None:
+            samples = self._samples.setdefault(stage, deque(maxlen=self.window))
+        samples.append(ns)
+
+    @contextmanager
+    def span(self, stage: str):
+        """Time a block as ``stage``, with or without an active trace."""
+        t = _now()
+        try:
+            yield
+        finally:
+            self.record(stage, _now() - t)
+
+    # ── Current interaction (per thread) ────────────────────
+    @contextmanager
+    def activate(self, trace: Trace):
+        """Make ``trace`` the current one on this thread while a handler runs."""
+        prev = getattr(self._local, "trace", None)
+        self._local.trace = trace
+        try:
+            yield trace
+        finally:
+            self._local.trace = prev
+
+    def claim_reply(self):
+        """The current trace, if this is its first reply (else None)."""
+        trace = getattr(self._local, "trace", None)
+        if trace is None or trace.spoken:
+            return None
+        trace.spoken = True
+        trace.stamp("queued")
+        return trace
+
+    # ── Reporting ───────────────────────────────────────────
+    def summary(self) -> dict:
+        """``{stage: {count, p50_ms, p95_ms, p99_ms, max_ms}}`` over the window."""
+        out = {}
+        order = list(STAGES) + sorted(set(self._samples) - set(STAGES))
+        for stage in order:
+            samples = self._samples.get(stage)
+            if not samples:
+                continue
+            ms = np.fromiter(list(samples), dtype=np.float64) / 1e6
+            p50, p95, p99 = np.percentile(ms, (50, 95, 99))
+            out[stage] = {
+                "count": len(ms),
+                "p50_ms": round(float(p50), 2),
+                "p95_ms": round(float(p95), 2),
+                "p99_ms": round(float(p99), 2),
+                "max_ms": round(float(ms.max()), 2),
+            }
+        return out
+
+    def dump(self, path: str) -> dict:
+        """Write the summary to ``path`` as JSON (atomically) and return it."""
+        report = {
+            "generated": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "window": self.window,
+            "interactions": self.traces,
+            "stages": self.summary(),
+        }
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        os.replace(tmp, path)
+        return report
+
+
+def format_report(report: dict):
+    """Text table lines for a ``Tracer.dump`` report."""
+    lines = [f"{'stage':12s} {'n':>5s} {'p50':>8s} {'p95':>8s} {'p99':>8s} {'max':>8s}  (ms)"]
+    for stage, s in report.get("stages", {}).items():
+        lines.append(f"{stage:12s} {s['count']:5d} {s['p50_ms']:8.1f} {s['p95_ms']:8.1f}"
+                     f" {s['p99_ms']:8.1f} {s['max_ms']:8.1f}")
+    return lines
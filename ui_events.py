@@ -0,0 +1,93 @@
+# ============================================================
+#  J.A.R.V.I.S  –  UI Event Bus
+#  The only way engine and tray threads talk to the window.
+#  They publish events from any thread; the Tk thread drains
+#  them once per frame.  State-like events are coalesced
+#  (latest value per key wins, repeats of what's already on
+#  screen are dropped) and stream events (log lines) arrive in
+#  order as one batch.
+# ============================================================
+
+import threading
+from collections import deque
+
+from config import LOG_VIEW_LINES
+import activity_log
+
+
+class UIEventBus:
+    """Thread-safe mailbox between background threads and the Tk loop.
+
+    ``post(kind, payload, key)``  coalesced: only the newest payload per
+                                  ``(kind, key)`` is delivered per drain
+    ``append(kind, payload)``     streamed: every payload, in order, handed
+                                  to the handler as one list per drain
+    """
+
+    def __init__(self, stream_limit: int = LOG_VIEW_LINES):
+        self._lock = threading.Lock()
+        self._latest = {}           # (kind, key) -> payload, in first-post order
+        self._streams = {}          # kind -> deque of payloads
+        self._stream_limit = stream_limit
+        self._handlers = {}
+        self._shown = {}            # (kind, key) -> last delivered payload
+        self.posted = 0
+        self.coalesced = 0
+        self.delivered = 0
+
+    def on(self, kind: str, handler):
+        """Deliver ``kind`` events to ``handler`` (called on the Tk thread)."""
+        self._handlers[kind] = handler
+
+    def forget(self, kind: str):
+        """The UI reset ``kind`` itself: deliver the next post even if it
+        repeats what was last shown."""
+        self._shown = {k: v for k, v in self._shown.items() if k[0] != kind}
+
+    # ── Any thread ──────────────────────────────────────────
+    def post(self, kind: str, payload=None, key=None):
+        with self._lock:
+            self.posted += 1
+            if (kind, key) in self._latest:
+                self.coalesced += 1
+            self._latest[(kind, key)] = payload
+
+    def append(self, kind: str, payload):
+        with self._lock:
+            self.posted += 1
+            stream = self._streams.get(kind)
+            if stream is None:
+                # Bounded: if the UI stalls, the oldest entries fall off
+                stream = self._streams[kind] = deque(maxlen=self._stream_limit)
+            stream.append(payload)
+
+    # ── Tk thread ───────────────────────────────────────────
+    def drain(self):
+        """Deliver everything published since the last drain."""
+        with self._lock:
+            if not self._latest and not self._streams:
+                return
+            latest, self._latest = self._latest, {}
+            streams, self._streams = self._streams, {}
+
+        for kind, items in streams.items():
+            self._deliver(kind, list(items))
+        for (kind, key), payload in latest.items():
+            # A status that's already showing is not worth a widget update
+            if (kind, key) in self._shown and self._shown[(kind, key)] == payload:
+                self.coalesced += 1
+                continue
+            if payload is not None:
+                self._shown[(kind, key)] = payload
+            self._deliver(kind, payload)
+
+    def _deliver(self, kind: str, payload):
+        handler = self._handlers.get(kind)
+        if handler is None:
+            return
+        self.delivered += 1
+        try:
+            handler(payload)
+        except Exception as e:
+            # Keep draining: one bad handler must not stall the frame loop
+            activity_log.record("error", f"UI event '{kind}' failed: {e}")
@@ -0,0 +1,248 @@
+# ============================================================
+#  J.A.R.V.I.S  –  Voice Activity Detection & Endpointing
+#  Vectorised frame features (energy, zero-crossing rate,
+#  spectral flatness) with an adaptive noise floor and
+#  hangover, segmenting utterances straight off the shared
+#  capture stream.  The ambient calibration is persisted so
+#  it isn't re-learned on every launch.
+# ============================================================
+
+import os
+import json
+import time
+from collections import deque
+
+import numpy as np
+
+from config import (
+    VAD_FRAME_MS,
+    VAD_SNR_DB,
+    VAD_FLATNESS_MAX,
+    VAD_HANGOVER_MS,
+    VAD_MAX_PHRASE,
+    VAD_CALIBRATION,
+)
+from paths import DATA_DIR
+
+CALIBRATION_PATH = os.path.join(DATA_DIR, VAD_CALIBRATION)
+
+ZCR_MAX = 0.45              # above this a frame is hiss/clicks, not speech
+ONSET_FRAMES = 3            # consecutive speech frames needed to open a phrase
+MIN_SPEECH_MS = 150         # shorter bursts (knocks, clicks) are discarded
+PREROLL_MS = 250            # audio kept from before the detected onset
+CALIBRATION_SECONDS = 1.0   # ambient audio used when there's no saved calibration
+
+
+def frame_features(frames):
+    """Per-frame (energy dBFS, zero-crossing rate, spectral flatness)
+    for a ``(n, frame_len)`` batch, computed in one pass.
+    """
+    energy = (frames ** 2).mean(axis=1)
+    energy_db = 10.0 * np.log10(energy + 1e-10)
+    signs = np.signbit(frames)
+    zcr = (signs[:, 1:] != signs[:, :-1]).mean(axis=1)
+    power = np.abs(np.fft.rfft(frames * np.hanning(frames.shape[1]), axis=1)) ** 2 + 1e-12
+    flatness = np.exp(np.log(power).mean(axis=1)) / power.mean(axis=1)
+    return energy_db, zcr, flatness
+
+
+class VoiceActivityDetector:
+    """Frame classifier with a slowly adapting noise floor."""
+
+    def __init__(self, noise_db: float = None, snr_db: float = VAD_SNR_DB,
+                 flatness_max: float = VAD_FLATNESS_MAX, adapt: float = 0.02,
+                 path: str = CALIBRATION_PATH):
+        self.noise_db = noise_db
+        self.path = path            # where save() persists the floor
+        self.snr_db = snr_db
+        self.flatness_max = flatness_max
+        self.adapt = adapt
+
+    @property
+    def calibrated(self) -> bool:
+        return self.noise_db is not None
+
+    def calibrate(self, frames):
+        """Set the noise floor from a stretch of (assumed) ambient audio."""
+        energy_db, _, _ = frame_features(frames)
+        # A high-ish percentile so a stray noise doesn't skew it too far
+        self.noise_db = float(np.percentile(energy_db, 60))
+
+    def classify(self, frames):
+        """Boolean speech mask for a batch of frames (adapts the noise floor)."""
+        energy_db, zcr, flatness = frame_features(frames)
+        if self.noise_db is None:
+            self.noise_db = float(energy_db.min())
+        speech = (
+            (energy_db > self.noise_db + self.snr_db)
+            & (flatness < self.flatness_max)
+            & (zcr < ZCR_MAX)
+        )
+        quiet = energy_db[~speech]
+        if len(quiet):
+            # Track the floor down quickly, up slowly
+            target = float(quiet.mean())
+            rate = 0.2 if target < self.noise_db else self.adapt
+            self.noise_db += rate * (target - self.noise_db)
+        return speech
+
+    # ── Persistence ────────────────────────────────────────
+    def save(self, path: str = None):
+        if self.noise_db is None:
+            return
+        path = path or self.path
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"noise_db": self.noise_db, "saved": time.time()}, f)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str = CALIBRATION_PATH):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return cls(noise_db=float(json.load(f)["noise_db"]), path=path)
+        except (OSError, ValueError, KeyError):
+            return cls(path=path)
+
+
+class Segment:
+    """One utterance cut from the capture stream."""
+
+    def __init__(self, audio, rate: int, start: float, speech_end: float,
+                 endpoint_delay: float):
+        self.audio = audio
+        self.rate = rate
+        self.start = start                      # stream time (s) of first sample
+        self.speech_end = speech_end            # stream time of the last speech frame
+        self.endpoint_delay = endpoint_delay    # speech end -> segment handed out (s)
+        self.wake = False                       # local spotter heard the wake word in it
+        self.trace = None                       # latency trace, set by the consumer
+
+    @property
+    def duration(self) -> float:
+        return len(self.audio) / self.rate
+
+    def pcm16(self) -> bytes:
+        return (np.clip(self.audio, -1.0, 1.0) * 32767).astype(np.int16).tobytes()
+
+
+class UtteranceSegmenter:
+    """Cuts utterances out of a ``CaptureReader`` as soon as speech stops.
+
+    The hangover grows with the length of the utterance: a two-word command
+    is closed after ``VAD_HANGOVER_MS[0]``, while longer sentences are given
+    up to ``VAD_HANGOVER_MS[1]`` to accommodate natural pauses.
+    """
+
+    def __init__(self, reader, rate: int, vad: VoiceActivityDetector = None,
+                 frame_ms: int = VAD_FRAME_MS, hangover_ms=VAD_HANGOVER_MS,
+                 max_phrase: float = VAD_MAX_PHRASE):
+        self.reader = reader
+        self.rate = rate
+        self.vad = vad or VoiceActivityDetector.load()
+        self.frame_len = int(rate * frame_ms / 1000)
+        self.frame_s = self.frame_len / rate
+        self.hang_min, self.hang_max = (h / 1000.0 for h in hangover_ms)
+        self.max_frames = int(max_phrase / self.frame_s)
+        self.preroll = int(PREROLL_MS / 1000.0 / self.frame_s)
+        self._history = []          # recent non-speech frames (pre-roll)
+        self._queue = deque()       # classified frames not yet stepped through
+        self._reset()
+
+    def _reset(self):
+        self._frames = []
+        self._active = False
+        self._onset = 0
+        self._speech_frames = 0
+        self._silence = 0
+        self._last_speech = 0       # index into _frames
+        self._start_pos = 0
+
+    def _hangover_frames(self) -> int:
+        speech_s = self._speech_frames * self.frame_s
+        hang = min(self.hang_max, self.hang_min + 0.15 * speech_s)
+        return max(1, int(hang / self.frame_s))
+
+    def calibrate(self):
+        """Learn the ambient floor from the stream unless a saved one exists."""
+        if self.vad.calibrated:
+            return False
+        n = max(1, int(CALIBRATION_SECONDS / self.frame_s))
+        got = []
+        while len(got) < n:
+            frames = self.reader.read_frames(self.frame_len, n - len(got), timeout=2.0)
+            if frames is None:
+                break
+            got.extend(frames)
+        if not got:
+            return False        # no audio (capture down): keep adapting as it arrives
+        self.vad.calibrate(np.asarray(got))
+        self.vad.save()
+        return True
+
+    def next_segment(self, timeout: float = 1.0):
+        """Return the next complete ``Segment``, or None if ``timeout`` passes
+        without one finishing.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            while self._queue:
+                frame, is_speech, pos = self._queue.popleft()
+                seg = self._step(frame, is_speech, pos)
+                if seg is not None:
+                    # Audio already captured past the cut point is also latency
+                    captured = self.reader.pos + self.reader.available()
+                    seg.endpoint_delay += max(0, captured - pos - self.frame_len) / self.rate
+                    return seg
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            frames = self.reader.read_frames(self.frame_len, 16, timeout=remaining)
+            if frames is None:
+                return None
+            base = self.reader.pos - len(frames) * self.frame_len
+            speech = self.vad.classify(frames)
+            self._queue.extend(
+                (frame, bool(is_speech), base + i * self.frame_len)
+                for i, (frame, is_speech) in enumerate(zip(frames, speech))
+            )
+
+    def _step(self, frame, is_speech: bool, pos: int):
+        if not self._active:
+            self._history.append(frame)
+            if len(self._history) > self.preroll + ONSET_FRAMES:
+                self._history.pop(0)
+            self._onset = self._onset + 1 if is_speech else 0
+            if self._onset >= ONSET_FRAMES:
+                self._active = True
+                self._frames = list(self._history)
+                self._start_pos = pos - (len(self._frames) - 1) * self.frame_len
+                self._history = []
+                self._speech_frames = self._onset
+                self._last_speech = len(self._frames) - 1
+                self._silence = 0
+            return None
+
+        self._frames.append(frame)
+        if is_speech:
+            self._speech_frames += 1
+            self._silence = 0
+            self._last_speech = len(self._frames) - 1
+        else:
+            self._silence += 1
+
+        too_long = len(self._frames) >= self.max_frames
+        if self._silence < self._hangover_frames() and not too_long:
+            return None
+
+        frames, speech_frames = self._frames, self._speech_frames
+        last_speech, start = self._last_speech, self._start_pos
+        self._reset()
+        if speech_frames * self.frame_s * 1000 < MIN_SPEECH_MS:
+            return None
+        # Keep a little audio after the last speech frame, drop the rest
+        keep = min(len(frames), last_speech + 1 + int(0.1 / self.frame_s))
+        audio = np.concatenate(frames[:keep])
+        speech_end = start / self.rate + (last_speech + 1) * self.frame_s
+        delay = (len(frames) - last_speech - 1) * self.frame_s
+        return Segment(audio, self.rate, start / self.rate, speech_end, delay)
@@ -0,0 +1,427 @@
+# ============================================================
+#  J.A.R.V.I.S  –  Voice Cache
+#  Content-addressed store for synthesized Edge TTS clips.
+#  Clips are keyed by a stable digest of (text, voice, rate,
+#  pitch) so they survive restarts, and tracked in a manifest
+#  with LRU eviction and an orphan garbage-collect pass.
+#  Decoded clips are additionally held in a memory-budgeted
+#  LRU so hot phrases skip file I/O and MP3 decode entirely.
+#  For shipping, clips are packed into a single memory-mapped
+#  voice bank (header index of key -> offset/length).
+# ============================================================
+
+import io
+import os
+import json
+import mmap
+import time
+import struct
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+
+from config import (
+    EDGE_TTS_VOICE,
+    EDGE_TTS_RATE,
+    EDGE_TTS_PITCH,
+    VOICE_CACHE_MAX_ENTRIES,
+    VOICE_CACHE_MAX_MB,
+    CLIP_CACHE_MB,
+)
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+CLIP_PREFIX = "jarvis_"
+CLIP_SUFFIX = ".mp3"
+PARTIAL_GRACE = 600          # seconds a .part file may still be being written
+
+# Voice bank layout:  header | index[count] | clip data …
+BANK_NAME = "voice_bank.bin"
+BANK_MAGIC = b"JVBANK01"
+BANK_HEADER = struct.Struct("<8sI")          # magic, entry count
+BANK_ENTRY = struct.Struct("<20sQI")         # clip key, data offset, length
+
+
+def clip_key(text: str, voice: str = EDGE_TTS_VOICE,
+             rate: str = EDGE_TTS_RATE, pitch: str = EDGE_TTS_PITCH) -> str:
+    """Stable key for a phrase rendered with the given voice settings."""
+    blob = "\x1f".join((voice, rate, pitch, text)).encode("utf-8")
+    return hashlib.sha256(blob).hexdigest()[:20]
+
+
+class VoiceCache:
+    """On-disk clip store with a JSON manifest, hit/miss stats and LRU eviction."""
+
+    def __init__(self, cache_dir: str, voice: str = EDGE_TTS_VOICE,
+                 rate: str = EDGE_TTS_RATE, pitch: str = EDGE_TTS_PITCH,
+                 max_entries: int = VOICE_CACHE_MAX_ENTRIES,
+                 max_bytes: int = VOICE_CACHE_MAX_MB * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.voice = voice
+        self.rate = rate
+        self.pitch = pitch
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._manifest_path = os.path.join(cache_dir, MANIFEST_NAME)
+        os.makedirs(cache_dir, exist_ok=True)
+        self._entries: dict = self._load_manifest()
+
+    # ── Manifest I/O ────────────────────────────────────────
+    def _load_manifest(self) -> dict:
+        try:
+            with open(self._manifest_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == MANIFEST_VERSION:
+                return dict(data.get("entries", {}))
+        except (OSError, ValueError):
+            pass
+        return {}
+
+    def flush(self):
+        """Write the manifest atomically if anything changed."""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {"version": MANIFEST_VERSION, "entries": self._entries}
+            tmp = self._manifest_path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=1, ensure_ascii=False)
+            os.replace(tmp, self._manifest_path)
+            self._dirty = False
+
+    # ── Lookup / store ──────────────────────────────────────
+    def key(self, text: str) -> str:
+        return clip_key(text, self.voice, self.rate, self.pitch)
+
+    def path_for(self, text: str) -> str:
+        """Where the clip for this phrase lives (whether or not it exists yet)."""
+        return os.path.join(self.cache_dir, f"{CLIP_PREFIX}{self.key(text)}{CLIP_SUFFIX}")
+
+    def partial_path(self, text: str) -> str:
+        """A fresh, unique ``.part`` file to write this phrase's clip into
+        before renaming it to ``path_for(text)`` (writers never share one)."""
+        fd, path = tempfile.mkstemp(
+            dir=self.cache_dir, prefix=f"{CLIP_PREFIX}{self.key(text)}.", suffix=".part")
+        os.close(fd)
+        return path
+
+    def lookup(self, text: str):
+        """Return the cached clip path, or None on a miss."""
+        key = self.key(text)
+        path = os.path.join(self.cache_dir, f"{CLIP_PREFIX}{key}{CLIP_SUFFIX}")
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and os.path.exists(path):
+                entry["last_used"] = time.time()
+                self._dirty = True
+                self.hits += 1
+                return path
+            if entry is not None:
+                # File vanished behind our back
+                del self._entries[key]
+                self._dirty = True
+            self.misses += 1
+            return None
+
+    def contains(self, text: str) -> bool:
+        """Cheap presence check that does not touch the hit/miss counters."""
+        key = self.key(text)
+        with self._lock:
+            return key in self._entries and os.path.exists(
+                os.path.join(self.cache_dir, f"{CLIP_PREFIX}{key}{CLIP_SUFFIX}"))
+
+    def add(self, text: str, pinned: bool = False):
+        """Record a clip that has just been written to ``path_for(text)``."""
+        key = self.key(text)
+        path = self.path_for(text)
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            return
+        with self._lock:
+            prev = self._entries.get(key, {})
+            self._entries[key] = {
+                "text": text,
+                "voice": self.voice,
+                "rate": self.rate,
+                "pitch": self.pitch,
+                "size": size,
+                "pinned": pinned or prev.get("pinned", False),
+                "last_used": time.time(),
+            }
+            self._dirty = True
+            # Never the clip just written: the caller is about to play it
+            self._evict(keep=key)
+            self.flush()
+
+    def touch(self, text: str):
+        """Mark a phrase as recently used without hitting the filesystem."""
+        with self._lock:
+            entry = self._entries.get(self.key(text))
+            if entry is not None:
+                entry["last_used"] = time.time()
+                self._dirty = True
+
+    def pin(self, text: str):
+        """Protect an already-cached phrase from eviction."""
+        with self._lock:
+            entry = self._entries.get(self.key(text))
+            if entry is not None and not entry.get("pinned"):
+                entry["pinned"] = True
+                self._dirty = True
+
+    # ── Eviction / GC ───────────────────────────────────────
+    def _total_bytes(self) -> int:
+        return sum(e.get("size", 0) for e in self._entries.values())
+
+    def _evict(self, keep: str = None):
+        """Drop least-recently-used unpinned clips (other than ``keep``)
+        until under both caps."""
+        total = self._total_bytes()
+        if len(self._entries) <= self.max_entries and total <= self.max_bytes:
+            return
+        victims = sorted(
+            (k for k, e in self._entries.items() if not e.get("pinned") and k != keep),
+            key=lambda k: self._entries[k].get("last_used", 0.0),
+        )
+        for key in victims:
+            if len(self._entries) <= self.max_entries and total <= self.max_bytes:
+                break
+            total -= self._entries[key].get("size", 0)
+            self._remove(key)
+            self.evictions += 1
+
+    def _remove(self, key: str):
+        del self._entries[key]
+        self._dirty = True
+        try:
+            os.remove(os.path.join(self.cache_dir, f"{CLIP_PREFIX}{key}{CLIP_SUFFIX}"))
+        except OSError:
+            pass
+
+    def gc(self) -> int:
+        """Delete clip files the manifest doesn't know about (and vice versa).
+
+        Returns the number of orphaned files removed.
+        """
+        removed = 0
+        with self._lock:
+            for key in [k for k in self._entries
+                        if not os.path.exists(os.path.join(
+                            self.cache_dir, f"{CLIP_PREFIX}{k}{CLIP_SUFFIX}"))]:
+                del self._entries[key]
+                self._dirty = True
+            for name in os.listdir(self.cache_dir):
+                is_clip = name.startswith(CLIP_PREFIX) and name.endswith(CLIP_SUFFIX)
+                is_partial = name.endswith(".part") or name.endswith(".tmp")
+                if not (is_clip or is_partial):
+                    continue
+                key = name[len(CLIP_PREFIX):-len(CLIP_SUFFIX)] if is_clip else None
+                if key in self._entries:
+                    continue
+                path = os.path.join(self.cache_dir, name)
+                try:
+                    # A recent partial file may still be being written
+                    if is_partial and time.time() - os.path.getmtime(path) < PARTIAL_GRACE:
+                        continue
+                    os.remove(path)
+                    removed += 1
+                except OSError:
+                    pass
+            self._evict()
+            self.flush()
+        return removed
+
+    # ── Stats ───────────────────────────────────────────────
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._total_bytes(),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+class ClipCache:
+    """Memory-budgeted LRU of decoded clips, keyed by ``clip_key``.
+
+    ``loader(source)`` decodes a path or file object into a playable clip and
+    ``sizer(clip)`` reports its decoded size in bytes.  Pinned clips (the
+    canned responses preloaded at start-up) are never evicted.
+    """
+
+    def __init__(self, loader, sizer, budget_bytes: int = CLIP_CACHE_MB * 1024 * 1024):
+        self._loader = loader
+        self._sizer = sizer
+        self.budget_bytes = budget_bytes
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._clips: OrderedDict = OrderedDict()   # key -> (clip, size, pinned)
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        """Return the decoded clip for ``key`` or None (counted as a miss)."""
+        with self._lock:
+            item = self._clips.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+            self._clips.move_to_end(key)
+            self.hits += 1
+            return item[0]
+
+    def put(self, key: str, source, pinned: bool = False):
+        """Decode ``source`` and keep it if it fits the budget. Returns the clip."""
+        with self._lock:
+            item = self._clips.get(key)
+            if item is not None:
+                return item[0]
+        try:
+            clip = self._loader(source)
+        except Exception:
+            return None
+        size = self._sizer(clip)
+        with self._lock:
+            item = self._clips.get(key)
+            if item is not None:
+                # Decoded concurrently by another thread: keep the one we have
+                if pinned and not item[2] and self._pinned_bytes() + item[1] <= self.budget_bytes:
+                    self._clips[key] = (item[0], item[1], True)
+                return item[0]
+            if size > self.budget_bytes:
+                return clip
+            if pinned and self._pinned_bytes() + size > self.budget_bytes:
+                # Keep it playable, but don't let pins crowd out the whole budget
+                pinned = False
+            self._clips[key] = (clip, size, pinned)
+            self.used_bytes += size
+            self._evict()
+        return clip
+
+    def preload(self, items):
+        """Decode ``(key, source)`` pairs up front as pinned clips."""
+        loaded = 0
+        for key, source in items:
+            if self.put(key, source, pinned=True) is not None:
+                loaded += 1
+        return loaded
+
+    def _pinned_bytes(self) -> int:
+        return sum(size for _, size, pinned in self._clips.values() if pinned)
+
+    def _evict(self):
+        if self.used_bytes <= self.budget_bytes:
+            return
+        for key in [k for k, (_, _, pinned) in self._clips.items() if not pinned]:
+            if self.used_bytes <= self.budget_bytes:
+                break
+            self.used_bytes -= self._clips.pop(key)[1]
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "clips": len(self._clips),
+                "bytes": self.used_bytes,
+                "budget": self.budget_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+# ── Packed voice bank ──────────────────────────────────────
+def write_bank(path: str, clips) -> int:
+    """Pack ``(key, clip_path)`` pairs into a single voice-bank file.
+
+    Written to a temp file and renamed into place, so a running app never
+    maps a half-written bank.  Returns the number of clips packed.
+    """
+    blobs = []
+    for key, clip_path in clips:
+        with open(clip_path, "rb") as f:
+            blobs.append((key.encode("ascii"), f.read()))
+
+    offset = BANK_HEADER.size + BANK_ENTRY.size * len(blobs)
+    index = []
+    for key, data in blobs:
+        index.append(BANK_ENTRY.pack(key, offset, len(data)))
+        offset += len(data)
+
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(BANK_HEADER.pack(BANK_MAGIC, len(blobs)))
+        f.writelines(index)
+        f.writelines(data for _, data in blobs)
+    os.replace(tmp, path)
+    return len(blobs)
+
+
+class VoiceBank:
+    """Read-only, memory-mapped view of a packed voice bank."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # mmap refuses empty files
+            self._file.close()
+            raise ValueError(f"Empty voice bank: {path}")
+        magic, count = BANK_HEADER.unpack_from(self._map, 0)
+        if magic != BANK_MAGIC:
+            self.close()
+            raise ValueError(f"Not a voice bank: {path}")
+        self._index = {}
+        pos = BANK_HEADER.size
+        for _ in range(count):
+            key, off, length = BANK_ENTRY.unpack_from(self._map, pos)
+            self._index[key.decode("ascii")] = (off, length)
+            pos += BANK_ENTRY.size
+
+    @classmethod
+    def open_first(cls, *dirs):
+        """Open the first ``voice_bank.bin`` found in ``dirs``, or return None."""
+        for d in dirs:
+            path = os.path.join(d, BANK_NAME)
+            if os.path.exists(path):
+                try:
+                    return cls(path)
+                except (OSError, ValueError, struct.error):
+                    continue
+        return None
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def open(self, key: str):
+        """File object over the clip bytes for ``key`` (None if absent)."""
+        entry = self._index.get(key)
+        if entry is None:
+            return None
+        off, length = entry
+        return io.BytesIO(self._map[off:off + length])
+
+    def close(self):
+        try:
+            self._map.close()
+        except (AttributeError, ValueError):
+            pass
+        self._file.close()
@@ -0,0 +1,177 @@
+# ============================================================
+#  J.A.R.V.I.S  –  Voice Synthesis Pipeline
+#  Concurrent, bounded Edge TTS pre-synthesis with retry and
+#  atomic write-then-rename into the voice cache, plus a
+#  streaming path that hands audio out as it arrives.
+# ============================================================
+
+import os
+import random
+import asyncio
+
+from config import (
+    EDGE_TTS_VOICE,
+    EDGE_TTS_RATE,
+    EDGE_TTS_PITCH,
+    TTS_SYNTH_CONCURRENCY,
+    TTS_SYNTH_RETRIES,
+    TTS_SYNTH_BACKOFF,
+)
+
+
+async def edge_synthesize(text: str, path: str, voice: str = EDGE_TTS_VOICE,
+                          rate: str = EDGE_TTS_RATE, pitch: str = EDGE_TTS_PITCH):
+    """Render ``text`` with Edge TTS into ``path``."""
+    import edge_tts         # slowest import in the app; only needed on a cache miss
+    communicate = edge_tts.Communicate(text, voice=voice, rate=rate, pitch=pitch)
+    await communicate.save(path)
+
+
+async def edge_stream(text: str, voice: str = EDGE_TTS_VOICE,
+                      rate: str = EDGE_TTS_RATE, pitch: str = EDGE_TTS_PITCH):
+    """Yield MP3 audio chunks from Edge TTS as they are received."""
+    import edge_tts
+    communicate = edge_tts.Communicate(text, voice=voice, rate=rate, pitch=pitch)
+    async for chunk in communicate.stream():
+        if chunk["type"] == "audio":
+            yield chunk["data"]
+
+
+class FakeSynthesizer:
+    """Local stand-in for Edge TTS with injected latency and failures.
+
+    Lets the pipeline be exercised (and timed) without network access.
+    """
+
+    def __init__(self, latency: float = 0.3, jitter: float = 0.0,
+                 fail_rate: float = 0.0, payload: bytes = b"", seed=None):
+        self.latency = latency
+        self.jitter = jitter
+        self.fail_rate = fail_rate
+        self.payload = payload
+        self.calls = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._rng = random.Random(seed)
+
+    async def __call__(self, text: str, path: str):
+        self.calls += 1
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency + self._rng.uniform(0, self.jitter))
+            if self._rng.random() < self.fail_rate:
+                raise ConnectionError("injected TTS failure")
+            with open(path, "wb") as f:
+                f.write(self.payload or text.encode("utf-8"))
+        finally:
+            self.in_flight -= 1
+
+    async def stream(self, text: str, chunks: int = 8):
+        """Streaming variant: first chunk after ``latency``, the rest trickle in."""
+        data = self.payload or text.encode("utf-8")
+        step = max(1, -(-len(data) // chunks))
+        await asyncio.sleep(self.latency + self._rng.uniform(0, self.jitter))
+        for i in range(0, len(data), step):
+            yield data[i:i + step]
+            await asyncio.sleep(self.latency / chunks)
+
+
+def _commit(tmp: str, path: str):
+    """Rename a finished ``.part`` file into place."""
+    try:
+        os.replace(tmp, path)
+    except OSError:
+        # Windows: the clip is open for playback after another writer of the
+        # same phrase got there first — theirs is just as good
+        if not os.path.exists(path):
+            raise
+        os.remove(tmp)
+
+
+async def synthesize_to_cache(text: str, cache, synth=edge_synthesize,
+                              retries: int = TTS_SYNTH_RETRIES,
+                              backoff: float = TTS_SYNTH_BACKOFF,
+                              pinned: bool = False) -> str:
+    """Synthesize one phrase into ``cache`` and return the clip path.
+
+    The clip is written to its own ``.part`` file and renamed into place only
+    once complete, so readers never see a truncated MP3 and two writers of
+    the same phrase never collide.  Failed attempts are retried with
+    exponential backoff; the last error is re-raised.
+    """
+    path = cache.path_for(text)
+    for attempt in range(retries + 1):
+        tmp = cache.partial_path(text)
+        try:
+            await synth(text, tmp)
+            _commit(tmp, path)
+            cache.add(text, pinned=pinned)
+            return path
+        except Exception:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            if attempt == retries:
+                raise
+            await asyncio.sleep(backoff * (2 ** attempt) * random.uniform(0.8, 1.2))
+
+
+async def stream_to_cache(text: str, cache, stream=edge_stream, on_chunk=None,
+                          pinned: bool = False) -> str:
+    """Consume a TTS stream, handing each chunk to ``on_chunk`` while
+    persisting the whole clip into ``cache`` (atomically, as above).
+    """
+    path = cache.path_for(text)
+    tmp = cache.partial_path(text)
+    try:
+        with open(tmp, "wb") as f:
+            async for chunk in stream(text):
+                f.write(chunk)
+                if on_chunk is not None:
+                    on_chunk(chunk)
+        _commit(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+    cache.add(text, pinned=pinned)
+    return path
+
+
+async def synthesize_all(phrases, cache, synth=edge_synthesize,
+                         concurrency: int = TTS_SYNTH_CONCURRENCY,
+                         retries: int = TTS_SYNTH_RETRIES,
+                         backoff: float = TTS_SYNTH_BACKOFF,
+                         pinned: bool = True, on_progress=None):
+    """Synthesize many phrases with at most ``concurrency`` requests in flight.
+
+    ``on_progress(done, total, phrase, error)`` is called as each phrase
+    finishes (``error`` is None on success).  Returns the list of
+    ``(phrase, error)`` pairs that still failed after all retries.
+    """
+    phrases = list(dict.fromkeys(phrases))          # de-dupe, keep order
+    total = len(phrases)
+    sem = asyncio.Semaphore(max(1, concurrency))
+    failed = []
+    done = 0
+
+    async def worker(phrase):
+        nonlocal done
+        error = None
+        async with sem:
+            try:
+                await synthesize_to_cache(phrase, cache, synth, retries, backoff, pinned)
+            except Exception as e:
+                error = e
+                failed.append((phrase, e))
+        done += 1
+        if on_progress is not None:
+            on_progress(done, total, phrase, error)
+
+    await asyncio.gather(*(worker(p) for p in phrases))
+    cache.flush()
+    return failed
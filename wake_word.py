@@ -0,0 +1,231 @@
+# ============================================================
+#  J.A.R.V.I.S  –  Local Wake-Word Spotter
+#  MFCC features + subsequence DTW against a handful of
+#  enrolled samples of the user saying the wake word.  Runs in
+#  front of the cloud recogniser so only audio that starts
+#  with "Jarvis" ever leaves the machine.
+#
+#  Enrol:   python wake_word.py record 5
+#           python wake_word.py enroll a.wav b.wav c.wav
+# ============================================================
+
+import os
+import sys
+
+import numpy as np
+
+from config import WAKE_SPOTTER_MODEL, WAKE_SPOTTER_MARGIN, WAKE_SPOTTER_WINDOW
+from paths import DATA_DIR
+
+FEATURE_RATE = 16000
+FRAME_LEN = 400         # 25 ms
+HOP = 160               # 10 ms
+NFFT = 512
+N_MELS = 26
+N_MFCC = 13
+
+MODEL_PATH = os.path.join(DATA_DIR, WAKE_SPOTTER_MODEL)
+
+
+def _hz_to_mel(hz):
+    return 2595.0 * np.log10(1.0 + hz / 700.0)
+
+
+def _mel_to_hz(mel):
+    return 700.0 * (10.0 ** (mel / 2595.0) - 1.0)
+
+
+def _mel_filterbank(n_mels: int = N_MELS, nfft: int = NFFT, rate: int = FEATURE_RATE):
+    mels = np.linspace(_hz_to_mel(60.0), _hz_to_mel(rate / 2), n_mels + 2)
+    bins = np.floor((nfft + 1) * _mel_to_hz(mels) / rate).astype(int)
+    fb = np.zeros((n_mels, nfft // 2 + 1), dtype=np.float32)
+    for m in range(1, n_mels + 1):
+        lo, mid, hi = bins[m - 1], bins[m], bins[m + 1]
+        if mid > lo:
+            fb[m - 1, lo:mid] = (np.arange(lo, mid) - lo) / (mid - lo)
+        if hi > mid:
+            fb[m - 1, mid:hi] = (hi - np.arange(mid, hi)) / (hi - mid)
+    return fb
+
+
+def _dct_matrix(n_out: int = N_MFCC, n_in: int = N_MELS):
+    k = np.arange(n_out)[:, None]
+    n = np.arange(n_in)[None, :]
+    return (np.cos(np.pi * k * (2 * n + 1) / (2 * n_in)) * np.sqrt(2.0 / n_in)).astype(np.float32)
+
+
+class MfccExtractor:
+    """Vectorised MFCCs, all frames in one batch.
+
+    c0 (overall loudness) is dropped so matching doesn't depend on how close
+    the user is to the mic.
+    """
+
+    def __init__(self):
+        self._window = np.hamming(FRAME_LEN).astype(np.float32)
+        self._fb = _mel_filterbank()
+        self._dct = _dct_matrix()
+
+    @staticmethod
+    def resample(audio, rate: int):
+        audio = np.asarray(audio, dtype=np.float32)
+        if rate == FEATURE_RATE or len(audio) == 0:
+            return audio
+        n = int(len(audio) * FEATURE_RATE / rate)
+        return np.interp(
+            np.linspace(0, len(audio) - 1, n), np.arange(len(audio)), audio
+        ).astype(np.float32)
+
+    def __call__(self, audio, rate: int = FEATURE_RATE):
+        x = self.resample(audio, rate)
+        if len(x) < FRAME_LEN:
+            return np.zeros((0, N_MFCC - 1), dtype=np.float32)
+        x = np.append(x[0], x[1:] - 0.97 * x[:-1])          # pre-emphasis
+        n_frames = 1 + (len(x) - FRAME_LEN) // HOP
+        idx = np.arange(FRAME_LEN)[None, :] + HOP * np.arange(n_frames)[:, None]
+        frames = x[idx] * self._window
+        power = np.abs(np.fft.rfft(frames, NFFT)) ** 2 / NFFT
+        mel = np.log(power @ self._fb.T + 1e-8)
+        return (mel @ self._dct.T)[:, 1:]
+
+
+def trim_silence(audio, rate: int, floor_db: float = -30.0):
+    """Cut leading/trailing audio more than ``floor_db`` below the loudest 10 ms."""
+    hop = max(1, rate // 100)
+    n = len(audio) // hop
+    if n == 0:
+        return audio
+    energy = (np.asarray(audio[:n * hop]).reshape(n, hop) ** 2).mean(axis=1)
+    db = 10 * np.log10(energy + 1e-12)
+    loud = np.flatnonzero(db > db.max() + floor_db)
+    return audio[loud[0] * hop:(loud[-1] + 1) * hop]
+
+
+def subsequence_dtw(template, features) -> float:
+    """Length-normalised cost of the best match of ``template`` anywhere in
+    ``features`` (free start and end).
+
+    Step pattern (1,0)/(1,1)/(1,2) keeps each template row dependent only on
+    the previous row, so every row is one vectorised NumPy update.
+    """
+    if len(features) == 0 or len(template) == 0:
+        return np.inf
+    # Euclidean frame distances, all pairs at once
+    cost = (
+        (template ** 2).sum(axis=1)[:, None]
+        + (features ** 2).sum(axis=1)[None, :]
+        - 2.0 * template @ features.T
+    )
+    cost = np.sqrt(np.maximum(cost, 0.0))
+    acc = cost[0].copy()
+    shifted1 = np.empty_like(acc)
+    shifted2 = np.empty_like(acc)
+    for i in range(1, len(template)):
+        shifted1[0] = shifted2[:2] = np.inf
+        shifted1[1:] = acc[:-1]
+        shifted2[2:] = acc[:-2]
+        acc = cost[i] + np.minimum(np.minimum(acc, shifted1), shifted2)
+    return float(acc.min() / len(template))
+
+
+class WakeWordSpotter:
+    """Keyword spotter enrolled from a few recordings of the wake word."""
+
+    def __init__(self, templates=None, threshold: float = np.inf,
+                 window: float = WAKE_SPOTTER_WINDOW):
+        self.templates = list(templates or [])
+        self.threshold = threshold
+        self.window = window
+        self._mfcc = MfccExtractor()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.templates)
+
+    # ── Enrolment ──────────────────────────────────────────
+    def enroll(self, clips, margin: float = WAKE_SPOTTER_MARGIN):
+        """Build templates from ``(audio, rate)`` clips and derive a threshold.
+
+        The threshold is ``margin`` times the worst leave-one-out match between
+        the enrolled samples, i.e. a new utterance has to resemble at least one
+        template about as well as the samples resemble each other.
+        """
+        self.templates = [
+            self._mfcc(trim_silence(np.asarray(a, dtype=np.float32), r), r)
+            for a, r in clips
+        ]
+        self.templates = [t for t in self.templates if len(t) > 10]
+        if len(self.templates) < 2:
+            raise ValueError("Need at least two usable wake-word samples")
+        worst = 0.0
+        for i, t in enumerate(self.templates):
+            others = [subsequence_dtw(o, t) for j, o in enumerate(self.templates) if j != i]
+            worst = max(worst, min(others))
+        self.threshold = worst * margin
+        return self.threshold
+
+    def save(self, path: str = MODEL_PATH):
+        arrays = {f"t{i}": t for i, t in enumerate(self.templates)}
+        np.savez(path, threshold=np.float32(self.threshold), **arrays)
+
+    @classmethod
+    def load(cls, path: str = MODEL_PATH):
+        """Load an enrolled model; a missing file gives a disabled spotter."""
+        if not os.path.exists(path):
+            return cls()
+        with np.load(path) as data:
+            keys = sorted((k for k in data.files if k[0] == "t" and k[1:].isdigit()),
+                          key=lambda k: int(k[1:]))
+            return cls([data[k] for k in keys], float(data["threshold"]))
+
+    # ── Detection ──────────────────────────────────────────
+    def features(self, audio, rate: int):
+        """MFCCs for the part of a phrase the wake word can appear in."""
+        return self._mfcc(np.asarray(audio)[:int(self.window * rate)], rate)
+
+    def score(self, audio, rate: int) -> float:
+        feats = self.features(audio, rate)
+        return min((subsequence_dtw(t, feats) for t in self.templates), default=np.inf)
+
+    def detect(self, audio, rate: int):
+        """Return ``(detected, score)``; always detected when not enrolled."""
+        if not self.enabled:
+            return True, 0.0
+        s = self.score(audio, rate)
+        return s <= self.threshold, s
+
+
+# ── Enrolment CLI ──────────────────────────────────────────
+def _record(count: int, seconds: float = 1.5):
+    import sounddevice as sd
+    from config import SAMPLE_RATE
+    clips = []
+    for i in range(count):
+        input(f"  [{i + 1}/{count}] Press Enter, then say 'Jarvis'…")
+        audio = sd.rec(int(seconds * SAMPLE_RATE), samplerate=SAMPLE_RATE,
+                       channels=1, dtype="float32")
+        sd.wait()
+        clips.append((audio[:, 0], SAMPLE_RATE))
+    return clips
+
+
+def main(argv):
+    if len(argv) < 2 or argv[0] not in ("record", "enroll"):
+        print("usage: python wake_word.py record <count>\n"
+              "       python wake_word.py enroll <sample.wav> <sample.wav> …")
+        return 1
+    if argv[0] == "record":
+        clips = _record(int(argv[1]))
+    else:
+        from audio_capture import WavSource
+        clips = [(WavSource.load(p, FEATURE_RATE), FEATURE_RATE) for p in argv[1:]]
+    spotter = WakeWordSpotter()
+    threshold = spotter.enroll(clips)
+    spotter.save()
+    print(f"Enrolled {len(spotter.templates)} samples, threshold {threshold:.2f}"
+          f" -> {MODEL_PATH}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))